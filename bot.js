@@ -1,6 +1,8 @@
 const { Client, GatewayIntentBits, EmbedBuilder } = require("discord.js")
 const axios = require("axios")
 const fs = require("fs")
+const http = require("http")
+const https = require("https")
 const path = require("path")
 
 // Yapılandırma dosyasını yükle
@@ -32,132 +34,175 @@ const client = new Client({
   intents: [GatewayIntentBits.Guilds, GatewayIntentBits.GuildMessages, GatewayIntentBits.MessageContent],
 })
 
+// API istemcisi: bağlantılar keep-alive ile yeniden kullanılır
+const apiClient = axios.create({
+  baseURL: config.apiUrl,
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 16 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 16 }),
+})
+
+// Okuma önbelleği (/status, /links, /profiles) ve süren GET isteklerinin birleştirilmesi
+const READ_CACHE_TTL_MS = config.readCacheTtlMs ?? 2000
+const readCache = new Map() // url -> { expires, data }
+const inflightReads = new Map() // url -> Promise
+let readGeneration = 0
+
+function cachedGet(url, ttl = READ_CACHE_TTL_MS) {
+  const cached = readCache.get(url)
+  if (cached && cached.expires > Date.now()) return Promise.resolve(cached.data)
+
+  // Aynı istek zaten sürüyorsa ona bağlan
+  if (inflightReads.has(url)) return inflightReads.get(url)
+
+  const generation = readGeneration
+  const request = apiClient
+    .get(url)
+    .then((response) => {
+      // Bu sırada bir değiştirme çağrısı olduysa eski yanıtı önbelleğe alma
+      if (ttl > 0 && generation === readGeneration && response.data.success) {
+        readCache.set(url, { expires: Date.now() + ttl, data: response.data })
+      }
+      return response.data
+    })
+    .finally(() => {
+      if (inflightReads.get(url) === request) inflightReads.delete(url)
+    })
+  inflightReads.set(url, request)
+  return request
+}
+
+// Botun kendi değiştirme çağrılarından sonra okuma önbelleğini geçersiz kıl
+function invalidateReads() {
+  readGeneration++
+  readCache.clear()
+  inflightReads.clear()
+}
+
+async function mutate(request) {
+  try {
+    return (await request).data
+  } finally {
+    invalidateReads()
+  }
+}
+
+// API'nin kendi hata yanıtını (ör. 429 başlatma kuyruğu dolu) koru, yoksa genel mesaj döndür
+function apiError(name, error) {
+  console.error(`API hatası (${name}):`, error.message)
+  const data = error.response && error.response.data
+  if (data && data.message) {
+    return { success: false, message: data.message, retry_after: data.retry_after }
+  }
+  return { success: false, message: "API ile iletişim kurulamadı" }
+}
+
 // API ile iletişim için yardımcı fonksiyonlar
 const api = {
   async getStatus() {
     try {
-      const response = await axios.get(`${config.apiUrl}/status`)
-      return response.data
+      return await cachedGet("/status")
     } catch (error) {
-      console.error("API hatası (getStatus):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("getStatus", error)
     }
   },
 
   async getLinks() {
     try {
-      const response = await axios.get(`${config.apiUrl}/links`)
-      return response.data
+      return await cachedGet("/links")
     } catch (error) {
-      console.error("API hatası (getLinks):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("getLinks", error)
     }
   },
 
   async startLink(link, profileId = null, allProfiles = false) {
     try {
-      const response = await axios.post(`${config.apiUrl}/start`, {
-        link,
-        profile_id: profileId,
-        all_profiles: allProfiles,
-      })
-      return response.data
+      return await mutate(
+        apiClient.post("/start", {
+          link,
+          profile_id: profileId,
+          all_profiles: allProfiles,
+        }),
+      )
     } catch (error) {
-      console.error("API hatası (startLink):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("startLink", error)
     }
   },
 
   async stopLink(link = null, profileId = null) {
     try {
-      const response = await axios.post(`${config.apiUrl}/stop`, {
-        link,
-        profile_id: profileId,
-      })
-      return response.data
+      return await mutate(
+        apiClient.post("/stop", {
+          link,
+          profile_id: profileId,
+        }),
+      )
     } catch (error) {
-      console.error("API hatası (stopLink):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("stopLink", error)
     }
   },
 
   async addLink(url, name = null) {
     try {
-      const response = await axios.post(`${config.apiUrl}/links`, { url, name })
-      return response.data
+      return await mutate(apiClient.post("/links", { url, name }))
     } catch (error) {
-      console.error("API hatası (addLink):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("addLink", error)
     }
   },
 
   async removeLink(link) {
     try {
-      const response = await axios.delete(`${config.apiUrl}/links`, { data: { link } })
-      return response.data
+      return await mutate(apiClient.delete("/links", { data: { link } }))
     } catch (error) {
-      console.error("API hatası (removeLink):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("removeLink", error)
     }
   },
 
   async setInterval(minutes) {
     try {
-      const response = await axios.put(`${config.apiUrl}/interval`, { minutes })
-      return response.data
+      return await mutate(apiClient.put("/interval", { minutes }))
     } catch (error) {
-      console.error("API hatası (setInterval):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("setInterval", error)
     }
   },
 
   async restart() {
     try {
-      const response = await axios.post(`${config.apiUrl}/restart`)
-      return response.data
+      return await mutate(apiClient.post("/restart"))
     } catch (error) {
-      console.error("API hatası (restart):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("restart", error)
     }
   },
 
   async reposition() {
     try {
-      const response = await axios.post(`${config.apiUrl}/reposition`)
-      return response.data
+      return await mutate(apiClient.post("/reposition"))
     } catch (error) {
-      console.error("API hatası (reposition):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("reposition", error)
     }
   },
 
   async getProfiles() {
     try {
-      const response = await axios.get(`${config.apiUrl}/profiles`)
-      return response.data
+      return await cachedGet("/profiles")
     } catch (error) {
-      console.error("API hatası (getProfiles):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("getProfiles", error)
     }
   },
 
   async getLogs(lines = 10) {
     try {
-      const response = await axios.get(`${config.apiUrl}/logs?lines=${lines}`)
-      return response.data
+      // Loglar önbelleğe alınmaz, sadece eşzamanlı aynı istekler birleştirilir
+      return await cachedGet(`/logs?lines=${lines}`, 0)
     } catch (error) {
-      console.error("API hatası (getLogs):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("getLogs", error)
     }
   },
 
   async openLink(link, profileId) {
     try {
-      const response = await axios.post(`${config.apiUrl}/open`, { link, profile_id: profileId })
-      return response.data
+      return await mutate(apiClient.post("/open", { link, profile_id: profileId }))
     } catch (error) {
-      console.error("API hatası (openLink):", error.message)
-      return { success: false, message: "API ile iletişim kurulamadı" }
+      return apiError("openLink", error)
     }
   },
 }
@@ -575,35 +620,129 @@ async function handleOpenCommand(message, args) {
 }
 
 // Log mesajı gönderme fonksiyonu
-async function sendLogMessage(message, type = "info") {
+// Log mesajları tamponda biriktirilir ve toplu gönderilir
+const LOG_FLUSH_INTERVAL_MS = config.logFlushIntervalMs ?? 2000
+const LOG_BUFFER_SIZE = config.logBufferSize ?? 100
+const MAX_EMBEDS_PER_MESSAGE = 10 // Discord mesaj başına embed sınırı
+const MAX_EMBED_CHARS_PER_MESSAGE = 6000 // Discord mesaj başına toplam embed metni sınırı
+const MAX_LOG_DESCRIPTION = 1000
+
+const LOG_STYLES = {
+  error: { color: "#ff0000", title: "🔴 Hata" },
+  warning: { color: "#ffaa00", title: "🟡 Uyarı" },
+  success: { color: "#00ff00", title: "🟢 Başarılı" },
+  info: { color: "#0099ff", title: "ℹ️ Bilgi" },
+}
+
+const logBuffer = [] // { message, type, timestamp }
+const droppedLogs = {} // type -> atlanan mesaj sayısı
+let logChannel = null
+let flushingLogs = false
+
+async function getLogChannel() {
+  // Önbellek kanal ID'sine bağlı: !setlogchannel sonrası yeni kanal alınır
+  if (!logChannel || logChannel.id !== config.logChannelId) {
+    logChannel = await client.channels.fetch(config.logChannelId)
+  }
+  return logChannel
+}
+
+function sendLogMessage(message, type = "info") {
   if (!config.logChannelId) return
 
+  // Tampon doluysa en eski mesajı at ve özet için say
+  if (logBuffer.length >= LOG_BUFFER_SIZE) {
+    const dropped = logBuffer.shift()
+    droppedLogs[dropped.type] = (droppedLogs[dropped.type] || 0) + 1
+  }
+  logBuffer.push({ message: String(message), type, timestamp: Date.now() })
+
+  // Tek mesajı dolduracak kadar birikti ise beklemeden gönder
+  if (logBuffer.length >= MAX_EMBEDS_PER_MESSAGE) {
+    flushLogs()
+  }
+}
+
+function buildLogEmbed(entry) {
+  const style = LOG_STYLES[entry.type] || LOG_STYLES.info
+  let description = entry.message
+  if (description.length > MAX_LOG_DESCRIPTION) {
+    description = description.slice(0, MAX_LOG_DESCRIPTION - 1) + "…"
+  }
+  return new EmbedBuilder()
+    .setColor(style.color)
+    .setTitle(style.title)
+    .setDescription(description || "-")
+    .setTimestamp(entry.timestamp)
+}
+
+function buildDroppedSummaryEmbed() {
+  const types = Object.keys(droppedLogs)
+  if (types.length === 0) return null
+
+  const total = types.reduce((sum, type) => sum + droppedLogs[type], 0)
+  const details = types.map((type) => `${(LOG_STYLES[type] || LOG_STYLES.info).title}: ${droppedLogs[type]}`)
+  for (const type of types) delete droppedLogs[type]
+
+  return new EmbedBuilder()
+    .setColor("#ffaa00")
+    .setTitle("🟡 Uyarı")
+    .setDescription(`Log tamponu doldu, ${total} mesaj gönderilmedi.\n${details.join("\n")}`)
+    .setTimestamp()
+}
+
+async function flushLogs() {
+  if (flushingLogs || !config.logChannelId) return
+  if (logBuffer.length === 0 && Object.keys(droppedLogs).length === 0) return
+  flushingLogs = true
+
   try {
-    const channel = await client.channels.fetch(config.logChannelId)
-    if (!channel) return
-
-    const embed = new EmbedBuilder().setDescription(message).setTimestamp()
-
-    switch (type) {
-      case "error":
-        embed.setColor("#ff0000").setTitle("🔴 Hata")
-        break
-      case "warning":
-        embed.setColor("#ffaa00").setTitle("🟡 Uyarı")
-        break
-      case "success":
-        embed.setColor("#00ff00").setTitle("🟢 Başarılı")
-        break
-      default:
-        embed.setColor("#0099ff").setTitle("ℹ️ Bilgi")
+    const channel = await getLogChannel()
+    if (!channel) {
+      logBuffer.length = 0
+      return
     }
 
-    await channel.send({ embeds: [embed] })
+    while (logBuffer.length > 0 || Object.keys(droppedLogs).length > 0) {
+      const embeds = []
+      const batch = []
+      let chars = 0
+
+      const summary = buildDroppedSummaryEmbed()
+      if (summary) {
+        embeds.push(summary)
+        chars += summary.data.title.length + summary.data.description.length
+      }
+
+      while (logBuffer.length > 0 && embeds.length < MAX_EMBEDS_PER_MESSAGE) {
+        const embed = buildLogEmbed(logBuffer[0])
+        const size = embed.data.title.length + embed.data.description.length
+        if (embeds.length > 0 && chars + size > MAX_EMBED_CHARS_PER_MESSAGE) break
+        batch.push(logBuffer.shift())
+        embeds.push(embed)
+        chars += size
+      }
+
+      try {
+        await channel.send({ embeds })
+      } catch (error) {
+        console.error("Log mesajı gönderilirken hata:", error)
+        // Gönderilemeyen mesajlar bir sonraki özette sayılır
+        for (const entry of batch) droppedLogs[entry.type] = (droppedLogs[entry.type] || 0) + 1
+        logChannel = null // Kanal silinmiş/erişim kalkmış olabilir, sonraki turda yeniden al
+        return
+      }
+    }
   } catch (error) {
-    console.error("Log mesajı gönderilirken hata:", error)
+    console.error("Log kanalı alınırken hata:", error)
+    logChannel = null
+  } finally {
+    flushingLogs = false
   }
 }
 
+setInterval(flushLogs, LOG_FLUSH_INTERVAL_MS)
+
 // Hata yakalama
 client.on("error", (error) => {
   console.error("Discord bot hatası:", error)
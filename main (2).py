@@ -1,53 +1,2410 @@
-import json
 import time
+_MODULE_LOAD_STARTED = time.perf_counter()
+
+import json
 import logging
 import threading
 import os
 import signal
 import sys
+import itertools
+import queue
+import random
+import functools
+import hashlib
+import math
+import mmap
+import struct
+from collections import Counter, deque
+from contextlib import contextmanager
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.edge.options import Options
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-# API sunucusu için Flask import
-from flask import Flask, request, jsonify
-
-# Rich imports for beautiful console GUI
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.layout import Layout
-from rich.live import Live
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.align import Align
-from rich.columns import Columns
-from rich import box
-from rich.rule import Rule
-import keyboard
-import asyncio
-
-# Logging yapılandırması
-if not os.path.exists('logs'):
-    os.makedirs('logs')
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f"logs/betterkick_tool_{datetime.now().strftime('%Y%m%d')}.log"),
-        logging.StreamHandler()
-    ]
-)
 
-logger = logging.getLogger("BetterKickTool")
+# Ağır bağımlılıklar (selenium, flask, rich, keyboard) ilk kullanıldıkları yerde
+# içe aktarılır; böylece daemon modu rich ve keyboard'u hiç yüklemez
+
+logger = logging.getLogger("BetterKickTool")
+
+def setup_logging():
+    """Logging yapılandırması"""
+    if not os.path.exists('logs'):
+        os.makedirs('logs')
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(f"logs/betterkick_tool_{datetime.now().strftime('%Y%m%d')}.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+class StartupTimer:
+    """Başlangıç aşamalarının sürelerini ölç ve logla"""
+    def __init__(self):
+        self.started = _MODULE_LOAD_STARTED
+        self.phases = [('modül importları', time.perf_counter() - _MODULE_LOAD_STARTED)]
+    
+    @contextmanager
+    def phase(self, name):
+        """Bir başlangıç aşamasını ölç"""
+        phase_started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - phase_started))
+    
+    def report(self):
+        """Süre dökümünü logla"""
+        total = time.perf_counter() - self.started
+        breakdown = ", ".join(f"{name}: {duration * 1000:.0f}ms" for name, duration in self.phases)
+        logger.info(f"Başlangıç süreleri: {breakdown} | toplam: {total * 1000:.0f}ms")
+
+class Tracer:
+    """Hafif, iç içe geçebilen span'ler; tamamlanan izler sınırlı bir tamponda tutulur"""
+    def __init__(self, max_traces=200):
+        self.traces = deque(maxlen=max_traces)
+        self.local = threading.local()
+        self.pid = os.getpid()
+    
+    def begin(self, name, **args):
+        """Mevcut thread'de yeni bir span aç"""
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        thread = threading.current_thread()
+        span = {
+            'name': name,
+            'args': args,
+            'tid': thread.ident,
+            'thread': thread.name,
+            'start_us': time.perf_counter_ns() // 1000,
+            'children': [],
+        }
+        stack.append(span)
+        return span
+    
+    def end(self, error=None):
+        """Mevcut thread'deki en içteki span'i kapat"""
+        stack = getattr(self.local, 'stack', None)
+        if not stack:
+            return
+        span = stack.pop()
+        span['dur_us'] = time.perf_counter_ns() // 1000 - span['start_us']
+        if error is not None:
+            span['args']['error'] = str(error)
+        if stack:
+            stack[-1]['children'].append(span)
+        else:
+            self.traces.append(span)
+    
+    @contextmanager
+    def span(self, name, **args):
+        """with bloğunu bir span olarak ölç"""
+        span = self.begin(name, **args)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.end(error)
+    
+    def export_chrome(self, limit=None):
+        """Son izleri Chrome trace-event JSON biçiminde döndür"""
+        traces = list(self.traces)
+        if limit:
+            traces = traces[-limit:]
+        events = []
+        threads = {}
+        
+        def walk(span):
+            threads[span['tid']] = span['thread']
+            events.append({
+                'name': span['name'],
+                'cat': 'betterkick',
+                'ph': 'X',
+                'ts': span['start_us'],
+                'dur': span['dur_us'],
+                'pid': self.pid,
+                'tid': span['tid'],
+                'args': {k: v if isinstance(v, (int, float, bool)) or v is None else str(v) for k, v in span['args'].items()},
+            })
+            for child in span['children']:
+                walk(child)
+        
+        for trace in traces:
+            walk(trace)
+        for tid, thread_name in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': thread_name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+def traced(name):
+    """Manager metodunu self.tracer ile bir span içinde çalıştır"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name, args=", ".join(str(a) for a in args)[:120]):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+def sample_stacks(seconds, hz=100):
+    """Tüm thread yığınlarını örnekle, flame graph için collapsed-stack metni döndür"""
+    interval = 1.0 / hz
+    counts = Counter()
+    own_thread = threading.get_ident()
+    deadline = time.perf_counter() + seconds
+    
+    while time.perf_counter() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            counts[";".join(part.replace(';', ',') for part in reversed(stack))] += 1
+        time.sleep(interval)
+    
+    return "\n".join(f"{stack} {count}" for stack, count in counts.most_common()) + "\n"
+
+class EdgeDriverFactory:
+    """Gerçek Edge tarayıcısı başlatan varsayılan driver fabrikası"""
+    def __init__(self, page_load_strategy='normal'):
+        # normal: driver.get tüm kaynaklar yüklenene kadar bekler,
+        # eager: DOM hazır olunca döner, none: hemen döner
+        self.page_load_strategy = page_load_strategy
+    
+    def build_options(self, profile_path):
+        """Profil için Edge seçeneklerini oluştur"""
+        from selenium.webdriver.edge.options import Options
+        
+        edge_options = Options()
+        edge_options.page_load_strategy = self.page_load_strategy
+        
+        # Edge profil yapısını doğru şekilde ayarla
+        user_data_dir = os.path.dirname(profile_path)
+        profile_directory = os.path.basename(profile_path)
+        
+        edge_options.add_argument(f"--user-data-dir={user_data_dir}")
+        edge_options.add_argument(f"--profile-directory={profile_directory}")
+        edge_options.add_argument("--no-first-run")
+        edge_options.add_argument("--no-default-browser-check")
+        edge_options.add_argument("--disable-extensions")
+        edge_options.add_argument("--disable-plugins")
+        edge_options.add_argument("--mute-audio")
+        edge_options.add_argument("--disable-web-security")
+        edge_options.add_argument("--disable-features=VizDisplayCompositor")
+        edge_options.add_argument("--disable-blink-features=AutomationControlled")
+        edge_options.add_argument("--disable-dev-shm-usage")
+        edge_options.add_argument("--no-sandbox")
+        edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        edge_options.add_experimental_option('useAutomationExtension', False)
+        return edge_options
+    
+    def start(self):
+        """Başlangıçta yapılacak hazırlık (varsayılan fabrikada yok)"""
+    
+    def stop(self):
+        """Kapanışta fabrikaya ait kaynakları bırak (varsayılan fabrikada yok)"""
+    
+    def create(self, profile_path):
+        """Yeni bir Edge driver başlat"""
+        from selenium import webdriver
+        from selenium.webdriver.edge.service import Service
+        
+        service = Service()
+        return webdriver.Edge(service=service, options=self.build_options(profile_path))
+
+class SharedEdgeDriverFactory(EdgeDriverFactory):
+    """Tek bir uzun ömürlü msedgedriver sunucusuna karşı remote oturum açan fabrika
+    
+    Driver binary'si başlangıçta bir kez çözülür; her oturum aynı sunucuda
+    bağımsız bir WebDriver session'ıdır, böylece oturum başına msedgedriver
+    süreci başlatılmaz.
+    """
+    def __init__(self, page_load_strategy='normal'):
+        super().__init__(page_load_strategy)
+        self.service = None
+        self.lock = threading.Lock()
+    
+    def start(self):
+        """Driver binary'sini çöz ve sunucuyu başlat (çalışıyorsa dokunma)"""
+        from selenium.webdriver.common.driver_finder import DriverFinder
+        from selenium.webdriver.edge.options import Options
+        from selenium.webdriver.edge.service import Service
+        
+        with self.lock:
+            if self.service is not None and self.service.is_connectable():
+                return
+            if self.service is not None:
+                logger.warning("msedgedriver sunucusu yanıt vermiyor, yeniden başlatılıyor")
+                self.stop_service()
+            
+            service = Service()
+            driver_path = service.env_path() if hasattr(service, 'env_path') else None
+            service.path = driver_path or DriverFinder(service, Options()).get_driver_path()
+            service.start()
+            self.service = service
+            logger.info(f"Paylaşılan msedgedriver sunucusu başlatıldı: {service.service_url} ({service.path})")
+    
+    def stop_service(self):
+        process = getattr(self.service, 'process', None)
+        try:
+            self.service.stop()
+        except Exception as e:
+            logger.warning(f"msedgedriver sunucusu durdurulamadı: {str(e)}")
+            if process is not None:
+                BrowserProcessRegistry.kill_tree(process.pid)
+        self.service = None
+    
+    def stop(self):
+        """Paylaşılan sunucuyu durdur"""
+        with self.lock:
+            if self.service is not None:
+                self.stop_service()
+    
+    def create(self, profile_path):
+        """Paylaşılan sunucuda yeni bir oturum aç"""
+        from selenium import webdriver
+        
+        self.start()
+        return webdriver.Remote(command_executor=self.service.service_url, options=self.build_options(profile_path))
+
+class FakeWebElement:
+    """Sahte driver'ın döndürdüğü element"""
+    def __init__(self, driver, value):
+        self.driver = driver
+        self.value = value
+
+class FakeSwitchTo:
+    """Sahte driver için driver.switch_to karşılığı"""
+    def __init__(self, driver):
+        self.driver = driver
+    
+    def new_window(self, type_hint=None):
+        self.driver._call('new_window')
+        handle = f"window-{next(self.driver.factory.handle_seq)}"
+        self.driver.urls[handle] = "about:blank"
+        self.driver.handle = handle
+    
+    def window(self, handle):
+        from selenium.common.exceptions import NoSuchWindowException
+        
+        self.driver._call('switch_to_window')
+        if handle not in self.driver.urls:
+            raise NoSuchWindowException(f"Sahte pencere yok: {handle}")
+        self.driver.handle = handle
+
+class FakeWebDriver:
+    """Tarayıcı açmadan WebDriver arayüzünü taklit eden sahte driver"""
+    def __init__(self, factory, profile_path):
+        self.factory = factory
+        self.profile_path = profile_path
+        self.alive = True
+        self.rect = {"x": 0, "y": 0, "width": 800, "height": 600}
+        self.handle = f"window-{next(factory.handle_seq)}"
+        self.urls = {self.handle: "about:blank"}  # pencere handle -> URL
+        self.switch_to = FakeSwitchTo(self)
+    
+    def _call(self, name):
+        """Çağrıyı say, gecikme uygula, gerekiyorsa hata enjekte et"""
+        from selenium.common.exceptions import WebDriverException
+        
+        self.factory.record(name)
+        if not self.alive:
+            raise WebDriverException("Sahte tarayıcı kapalı")
+        self.factory.delay(name)
+        if self.factory.should_fail(name):
+            if name == 'current_url':
+                self.alive = False  # Sağlık kontrolünde çökme
+            raise WebDriverException(f"Sahte hata: {name}")
+    
+    def crash(self):
+        """Tarayıcı çökmesini taklit et"""
+        self.alive = False
+    
+    def get(self, url):
+        self._call('get')
+        self.urls[self.handle] = url
+    
+    @property
+    def current_url(self):
+        self._call('current_url')
+        return self.urls[self.handle]
+    
+    @property
+    def current_window_handle(self):
+        self._call('current_window_handle')
+        return self.handle
+    
+    @property
+    def window_handles(self):
+        self._call('window_handles')
+        return list(self.urls)
+    
+    def close(self):
+        self._call('close')
+        self.urls.pop(self.handle, None)
+        if not self.urls:
+            self.alive = False
+    
+    def find_element(self, by, value):
+        from selenium.common.exceptions import NoSuchElementException
+        
+        self.factory.record('find_element')
+        if not self.alive:
+            from selenium.common.exceptions import WebDriverException
+            raise WebDriverException("Sahte tarayıcı kapalı")
+        self.factory.delay('find_element')
+        if self.factory.should_fail('ready'):
+            raise NoSuchElementException(f"Sahte element bulunamadı: {value}")
+        return FakeWebElement(self, value)
+    
+    def set_window_rect(self, x=None, y=None, width=None, height=None):
+        self._call('set_window_rect')
+        self.rect = {"x": x, "y": y, "width": width, "height": height}
+        return dict(self.rect)
+    
+    def execute_script(self, script, *args):
+        self._call('execute_script')
+        if 'document.readyState' in script:
+            return 'loading' if self.factory.should_fail('ready') else 'complete'
+        return None
+    
+    def refresh(self):
+        self._call('refresh')
+    
+    def quit(self):
+        self.factory.record('quit')
+        self.factory.delay('quit')
+        self.alive = False
+
+class FakeDriverFactory:
+    """Ayarlanabilir gecikme ve hata oranlarıyla sahte driver üreten fabrika
+    
+    latencies ve failure_rates anahtarları: launch, get, current_url,
+    find_element/ready, set_window_rect, execute_script, refresh, quit
+    """
+    def __init__(self, latencies=None, failure_rates=None, seed=None):
+        self.latencies = dict(latencies or {})
+        self.failure_rates = dict(failure_rates or {})
+        self.random = random.Random(seed)
+        self.calls = Counter()
+        self.lock = threading.Lock()
+        self.drivers = []
+        self.handle_seq = itertools.count(1)
+    
+    def record(self, name):
+        with self.lock:
+            self.calls[name] += 1
+    
+    def delay(self, name):
+        latency = self.latencies.get(name, 0)
+        if latency:
+            time.sleep(latency)
+    
+    def should_fail(self, name):
+        rate = self.failure_rates.get(name, 0)
+        if not rate:
+            return False
+        with self.lock:
+            return self.random.random() < rate
+    
+    def start(self):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def snapshot(self):
+        """Çağrı sayaçlarının kopyasını döndür"""
+        with self.lock:
+            return Counter(self.calls)
+    
+    def create(self, profile_path):
+        """Yeni bir sahte driver oluştur"""
+        self.record('launch')
+        self.delay('launch')
+        if self.should_fail('launch'):
+            raise RuntimeError("Sahte driver başlatılamadı")
+        driver = FakeWebDriver(self, profile_path)
+        with self.lock:
+            self.drivers.append(driver)
+        return driver
+
+class WarmDriverPool:
+    """Profil başına önceden başlatılmış boş driver havuzu
+    
+    Arka plan thread'i havuzu hedef boyuta tamamlar ve TTL'i dolan boşta
+    bekleyen driver'ları kapatır. start_link havuzda driver varsa onu alır.
+    """
+    def __init__(self, manager, size=1, ttl=600, check_interval=5):
+        self.manager = manager
+        self.size = size
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.pools = {}  # profile_id -> deque[(driver, oluşturulma zamanı)]
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.worker, name="warm_pool", daemon=True)
+        self.thread.start()
+        logger.info(f"Sıcak driver havuzu başlatıldı (profil başına {self.size}, TTL {self.ttl}s)")
+    
+    def stop(self):
+        """Havuzu durdur ve bekleyen driver'ları kapat"""
+        self.running = False
+        self.wakeup.set()
+        with self.lock:
+            drivers = [driver for pool in self.pools.values() for driver, _ in pool]
+            self.pools.clear()
+        self.manager.quit_drivers(drivers)
+    
+    def acquire(self, profile_id):
+        """Profil için hazır bir driver al, yoksa None döndür"""
+        driver = None
+        stale = []
+        with self.lock:
+            pool = self.pools.get(profile_id)
+            while pool:
+                candidate, created = pool.popleft()
+                if time.time() - created > self.ttl:
+                    stale.append(candidate)
+                    continue
+                driver = candidate
+                break
+        
+        # Havuzdayken kapanmış tarayıcıları ele
+        if driver is not None:
+            try:
+                driver.current_url
+            except Exception:
+                stale.append(driver)
+                driver = None
+        for candidate in stale:
+            self.manager.quit_driver(candidate)
+        
+        with self.lock:
+            if driver is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self.wakeup.set()
+        return driver
+    
+    def evict_expired(self):
+        """TTL'i dolan driver'ları havuzdan çıkar ve kapat"""
+        expired = []
+        now = time.time()
+        with self.lock:
+            for pool in self.pools.values():
+                while pool and now - pool[0][1] > self.ttl:
+                    expired.append(pool.popleft()[0])
+            self.evictions += len(expired)
+        for driver in expired:
+            self.manager.quit_driver(driver)
+    
+    def refill(self):
+        """Her profilin havuzunu hedef boyuta tamamla"""
+        for index, profile in enumerate(list(self.manager.profiles)):
+            profile_id = str(index)
+            while self.running and self.manager.running:
+                with self.lock:
+                    if len(self.pools.setdefault(profile_id, deque())) >= self.size:
+                        break
+                driver = self.manager.create_edge_driver(profile['path'], profile['name'])
+                if driver is None:
+                    break
+                with self.lock:
+                    self.pools.setdefault(profile_id, deque()).append((driver, time.time()))
+    
+    def remap(self, id_map, dropped=()):
+        """Profil listesi değişince havuzları yeni profil ID'lerine taşı
+        
+        Kaldırılan ve dropped içindeki (yolu değişen) profillerin driver'ları kapatılır.
+        """
+        discard = []
+        with self.lock:
+            pools = {}
+            for profile_id, pool in self.pools.items():
+                if profile_id in id_map and profile_id not in dropped:
+                    pools[id_map[profile_id]] = pool
+                else:
+                    discard.extend(driver for driver, _ in pool)
+            self.pools = pools
+        self.manager.quit_drivers(discard)
+        self.wakeup.set()
+    
+    def worker(self):
+        while self.running and self.manager.running:
+            try:
+                self.evict_expired()
+                self.refill()
+            except Exception as e:
+                logger.error(f"Sıcak havuz hatası: {str(e)}")
+            self.wakeup.wait(self.check_interval)
+            self.wakeup.clear()
+    
+    def stats(self):
+        """Havuz istatistiklerini döndür"""
+        with self.lock:
+            return {
+                'size': self.size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'warm': {profile_id: len(pool) for profile_id, pool in self.pools.items()},
+            }
+
+class RestartQueue:
+    """Çöken oturumlar için üstel geri çekilmeli yeniden başlatma kuyruğu
+    
+    Her (link, profil) çifti için ardışık hatalar sayılır. İlk çökmede hemen,
+    sonrakilerde base * 2^n (max_delay ile sınırlı, ±jitter) saniye sonra
+    yeniden denenir. max_failures ardışık hatadan sonra çift park edilir
+    (devre kesici); park_seconds sonra tek bir deneme yapılır (0: elle
+    başlatılana kadar parkta kalır). Çiftler konumsal ID'ler yerine
+    (url, profil adı) ile tutulur.
+    """
+    def __init__(self, manager, base=5, max_delay=300, jitter=0.2, max_failures=5,
+                 park_seconds=1800, stable_seconds=120):
+        self.manager = manager
+        self.base = base
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_failures = max_failures
+        self.park_seconds = park_seconds
+        self.stable_seconds = stable_seconds
+        self.entries = {}  # (url, profil adı) -> durum
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.random = random.Random()
+        self.running = False
+        self.thread = None
+    
+    def start(self):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self.worker, name="restart_queue", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+    
+    def reconfigure(self, base, max_delay, jitter, max_failures, park_seconds, stable_seconds):
+        """Geri çekilme ayarlarını canlı değiştir (zamanlanmış denemeler sonraki hatada yeni ayarı kullanır)"""
+        with self.lock:
+            self.base = base
+            self.max_delay = max_delay
+            self.jitter = jitter
+            self.max_failures = max_failures
+            self.park_seconds = park_seconds
+            self.stable_seconds = stable_seconds
+        self.wakeup.set()
+    
+    def key(self, link_id, profile_id):
+        """(url, profil adı) anahtarı; link veya profil bu arada silinmişse None"""
+        try:
+            return (self.manager.links[link_id]['url'], self.manager.profiles[int(profile_id)]['name'])
+        except (KeyError, IndexError, ValueError):
+            return None
+    
+    def backoff(self, failures):
+        """failures. ardışık hatadan sonraki bekleme süresi"""
+        if failures <= 1:
+            return 0
+        delay = min(self.max_delay, self.base * 2 ** (failures - 2))
+        return delay * self.random.uniform(1 - self.jitter, 1 + self.jitter)
+    
+    def record_failure(self, key, error):
+        """Hata say, sonraki denemeyi zamanla veya devreyi aç (kilit altında çağrılır)"""
+        entry = self.entries.setdefault(key, {'failures': 0})
+        entry['failures'] += 1
+        entry['last_error'] = error
+        entry['started_at'] = None
+        now = time.time()
+        if entry['failures'] >= self.max_failures:
+            entry['state'] = 'parked'
+            entry['next_attempt'] = now + self.park_seconds if self.park_seconds else None
+            logger.warning(f"Yeniden başlatma park edildi ({entry['failures']} ardışık hata): {key[0]} ({key[1]})")
+            self.manager.add_error(f"Park edildi: {key[1]} ({entry['failures']} hata)")
+            self.manager.notifier.notify('circuit_open', f"{key[0]} ({key[1]}): {entry['failures']} ardışık hata")
+        else:
+            entry['state'] = 'pending'
+            entry['next_attempt'] = now + self.backoff(entry['failures'])
+    
+    def schedule(self, link_id, profile_id, error):
+        """Çöken oturumu yeniden başlatma kuyruğuna ekle"""
+        key = self.key(link_id, profile_id)
+        if key is None:
+            return
+        with self.lock:
+            self.record_failure(key, error)
+        self.manager.bump_version('sessions')
+        self.start()
+        self.wakeup.set()
+    
+    def cancel(self, link_id=None, profile_id=None):
+        """Kullanıcı durdurduğunda bekleyen/park edilmiş denemeleri iptal et (None: tümü)"""
+        with self.lock:
+            if link_id is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(self.key(link_id, profile_id), None)
+        self.manager.bump_version('sessions')
+    
+    def resolve(self, key):
+        """(url, profil adı) anahtarını güncel (link ID, profil ID) çiftine çevir"""
+        link_id = next((lid for lid, data in self.manager.links.items() if data['url'] == key[0]), None)
+        profile_id = next((str(i) for i, p in enumerate(self.manager.profiles) if p['name'] == key[1]), None)
+        return link_id, profile_id
+    
+    def due(self):
+        """Zamanı gelen çiftleri ve bir sonrakine kalan süreyi döndür
+        
+        Yeniden açıldıktan sonra stable_seconds boyunca çökmeyen çiftlerin hata
+        sayacı burada sıfırlanır; durum kontrolü yoklamasına bağlı değildir.
+        """
+        now = time.time()
+        ready = []
+        wait = None
+        stable = 0
+        with self.lock:
+            for key, entry in list(self.entries.items()):
+                if entry['state'] == 'running':
+                    remaining = entry['started_at'] + self.stable_seconds - now
+                    if remaining <= 0:
+                        del self.entries[key]
+                        stable += 1
+                    else:
+                        wait = remaining if wait is None else min(wait, remaining)
+                    continue
+                if entry['next_attempt'] is None:
+                    continue
+                remaining = entry['next_attempt'] - now
+                if remaining <= 0:
+                    entry['state'] = 'restarting'
+                    ready.append(key)
+                else:
+                    wait = remaining if wait is None else min(wait, remaining)
+        if stable:
+            self.manager.bump_version('sessions')
+        return ready, wait
+    
+    def attempt(self, key):
+        link_id, profile_id = self.resolve(key)
+        if link_id is None or profile_id is None:
+            # Link veya profil artık yok (canlı yeniden yükleme)
+            with self.lock:
+                self.entries.pop(key, None)
+            return
+        if (link_id, profile_id) in self.manager.active_links:
+            # Bu arada elle başlatılmış
+            with self.lock:
+                self.entries.pop(key, None)
+            return
+        
+        logger.info(f"Link yeniden başlatılıyor: {self.manager.links[link_id]['name']} (ID: {link_id}, Profil: {key[1]})")
+        self.manager.add_log(f"Link yeniden başlatılıyor: {key[1]}")
+        result = self.manager.start_link(link_id, profile_id, restart=True)
+        with self.lock:
+            if key not in self.entries:
+                return  # Deneme sırasında iptal edildi
+            if result['success']:
+                entry = self.entries[key]
+                entry['state'] = 'running'
+                entry['started_at'] = time.time()
+                self.manager.notifier.notify('restart', f"{key[0]} ({key[1]})")
+            else:
+                self.record_failure(key, result['message'])
+                entry = self.entries[key]
+                if entry['state'] == 'pending':
+                    next_in = max(0, entry['next_attempt'] - time.time())
+                    self.manager.notifier.notify(
+                        'restart_failed', f"{key[0]} ({key[1]}): {entry['failures']}. hata, {next_in:.0f}s sonra tekrar")
+        self.manager.bump_version('sessions')
+    
+    def worker(self):
+        while self.running and self.manager.running:
+            try:
+                ready, wait = self.due()
+                for key in ready:
+                    if not self.running:
+                        break
+                    self.attempt(key)
+                if ready:
+                    continue
+            except Exception as e:
+                logger.error(f"Yeniden başlatma kuyruğu hatası: {str(e)}")
+                wait = 1
+            self.wakeup.wait(wait)
+            self.wakeup.clear()
+        self.running = False
+    
+    def down_keys(self):
+        """Yeniden başlatılmayı bekleyen veya park edilmiş (şu an kapalı) çiftler"""
+        with self.lock:
+            return [key for key, entry in self.entries.items() if entry['state'] in ('pending', 'restarting', 'parked')]
+    
+    def states(self):
+        """Link ID'si başına kuyruk durumları: {'pending': n, 'parked': n}"""
+        result = {}
+        with self.lock:
+            for key, entry in self.entries.items():
+                if entry['state'] in ('pending', 'restarting', 'parked'):
+                    link_id, _ = self.resolve(key)
+                    counts = result.setdefault(link_id, Counter())
+                    counts['parked' if entry['state'] == 'parked' else 'pending'] += 1
+        return result
+    
+    def stats(self):
+        """Bekleyen ve park edilmiş yeniden başlatmaları döndür"""
+        now = time.time()
+        pending = []
+        parked = []
+        with self.lock:
+            for key, entry in self.entries.items():
+                if entry['state'] == 'running':
+                    continue
+                link_id, profile_id = self.resolve(key)
+                item = {
+                    'link_id': link_id,
+                    'url': key[0],
+                    'profile_id': profile_id,
+                    'profile_name': key[1],
+                    'failures': entry['failures'],
+                    'last_error': entry.get('last_error'),
+                    'next_attempt_in': round(max(0, entry['next_attempt'] - now), 1) if entry['next_attempt'] else None
+                }
+                (parked if entry['state'] == 'parked' else pending).append(item)
+        return {
+            'pending': pending,
+            'parked': parked,
+            'max_failures': self.max_failures
+        }
+
+class WebhookNotifier:
+    """Oturum olaylarını toplu halde Discord webhook'una gönderen arka plan bildiricisi
+    
+    notify() sadece sınırlı kuyruğa ekler ve hemen döner (kuyruk doluysa en
+    eski olay atılır ve sayılır). Arka plan thread'i batch_interval boyunca
+    biriken olayları türlerine göre birleştirip tek mesajda gönderir; 429
+    yanıtında Retry-After kadar bekleyip aynı mesajı yeniden dener.
+    """
+    EVENT_STYLES = {
+        'crash': ("🔴 Oturum Çöktü", 0xff0000),
+        'restart': ("🟢 Yeniden Başlatıldı", 0x00ff00),
+        'restart_failed': ("🟡 Yeniden Başlatma Başarısız", 0xffaa00),
+        'circuit_open': ("⛔ Yeniden Başlatma Park Edildi", 0xff0000),
+    }
+    MAX_DESCRIPTION = 4000  # Discord embed açıklama sınırı 4096
+    
+    def __init__(self, url_provider, batch_interval=2.0, max_queue=500, timeout=10, max_retries=5):
+        self.url_provider = url_provider
+        self.batch_interval = batch_interval
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.events = deque()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.running = False
+        self.thread = None
+        self.dropped = 0          # Gönderilmeyi bekleyen atılan olaylar (sonraki mesajda bildirilir)
+        self.stats_counter = Counter()
+    
+    def start(self):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+            # Her worker'ın kendi durdurma olayı var: durdurulmuş (belki hala son
+            # gönderimini yapan) eski worker yeni worker'ı etkilemez
+            self.stopping = threading.Event()
+            self.thread = threading.Thread(target=self.worker, args=(self.stopping,),
+                                           name="webhook_notifier", daemon=True)
+            thread = self.thread
+        thread.start()
+    
+    def stop(self, timeout=3):
+        """Thread'i durdur; kuyrukta kalan olaylar için son bir gönderim denenir
+        
+        Sonraki notify() yeni bir worker başlatır.
+        """
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            stopping, thread = self.stopping, self.thread
+        stopping.set()
+        self.wakeup.set()
+        if thread:
+            thread.join(timeout)
+    
+    def notify(self, kind, message):
+        """Olayı kuyruğa ekle (asla beklemez)"""
+        if not self.url_provider():
+            return
+        with self.lock:
+            if len(self.events) >= self.max_queue:
+                self.events.popleft()
+                self.dropped += 1
+                self.stats_counter['dropped'] += 1
+            self.events.append((kind, message, time.time()))
+        self.start()
+        self.wakeup.set()
+    
+    def build_payload(self, batch, dropped):
+        """Olayları türlerine göre birer embed'de birleştir"""
+        grouped = {}
+        for kind, message, created in batch:
+            grouped.setdefault(kind, []).append(f"`{datetime.fromtimestamp(created).strftime('%H:%M:%S')}` {message}")
+        
+        embeds = []
+        for kind, lines in grouped.items():
+            title, color = self.EVENT_STYLES.get(kind, ("ℹ️ Bilgi", 0x0099ff))
+            description = ""
+            for i, line in enumerate(lines):
+                if len(description) + len(line) + 1 > self.MAX_DESCRIPTION:
+                    description += f"... ve {len(lines) - i} olay daha"
+                    break
+                description += line + "\n"
+            embeds.append({
+                "title": f"{title} ({len(lines)})" if len(lines) > 1 else title,
+                "description": description.rstrip(),
+                "color": color,
+                "timestamp": datetime.now().astimezone().isoformat()
+            })
+        if dropped:
+            embeds.append({
+                "title": "🟡 Uyarı",
+                "description": f"Bildirim kuyruğu doldu, {dropped} olay atlandı",
+                "color": 0xffaa00
+            })
+        return {"username": "BetterKick Tool", "embeds": embeds[:10]}
+    
+    def post(self, url, payload):
+        """Webhook'a gönder: (HTTP durumu, Retry-After saniyesi) döndür"""
+        import urllib.error
+        import urllib.request
+        
+        data = json.dumps(payload).encode('utf-8')
+        req = urllib.request.Request(url, data=data, method='POST',
+                                     headers={'Content-Type': 'application/json', 'User-Agent': 'BetterKickTool'})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.status, None
+        except urllib.error.HTTPError as e:
+            retry_after = None
+            if e.code == 429:
+                try:
+                    retry_after = float(e.headers.get('Retry-After') or json.loads(e.read()).get('retry_after'))
+                except (TypeError, ValueError):
+                    retry_after = 1.0
+            return e.code, retry_after
+    
+    def send(self, batch, dropped, final=False, stopping=None):
+        """Toplu mesajı gönder; 429'da bekleyip, ağ/sunucu hatalarında geri çekilerek tekrar dene"""
+        stopping = stopping or self.stopping
+        payload = self.build_payload(batch, dropped)
+        attempts = 0
+        while True:
+            url = self.url_provider()
+            if not url:
+                return
+            try:
+                status, retry_after = self.post(url, payload)
+            except Exception as e:
+                status, retry_after = None, None
+                logger.warning(f"Discord webhook'una ulaşılamadı: {str(e)}")
+            
+            if status is not None and 200 <= status < 300:
+                self.stats_counter['messages'] += 1
+                self.stats_counter['events'] += len(batch)
+                return
+            attempts += 1
+            if status == 429:
+                self.stats_counter['rate_limited'] += 1
+                delay = min(retry_after or 1.0, 60)
+            elif status is None or status >= 500:
+                delay = min(2 ** attempts, 60)
+            else:
+                # Diğer 4xx: yeniden denemek düzeltmez (ör. geçersiz URL)
+                logger.error(f"Discord webhook isteği reddedildi: HTTP {status}")
+                break
+            if final or attempts >= self.max_retries:
+                break
+            if stopping.wait(delay) and not final:
+                final = True  # Kapanıyor: bir deneme daha yapıp çık
+        
+        self.stats_counter['failed'] += len(batch)
+        logger.error(f"Discord bildirimi gönderilemedi, {len(batch)} olay atıldı")
+    
+    def drain(self):
+        with self.lock:
+            batch = list(self.events)
+            self.events.clear()
+            dropped, self.dropped = self.dropped, 0
+        return batch, dropped
+    
+    def worker(self, stopping):
+        while not stopping.is_set():
+            self.wakeup.wait()
+            self.wakeup.clear()
+            # Kısa süre içinde gelen olayları tek mesajda topla
+            stopping.wait(self.batch_interval)
+            batch, dropped = self.drain()
+            if batch or dropped:
+                try:
+                    self.send(batch, dropped, final=stopping.is_set(), stopping=stopping)
+                except Exception as e:
+                    logger.error(f"Bildirim hatası: {str(e)}")
+        batch, dropped = self.drain()
+        if batch or dropped:
+            self.send(batch, dropped, final=True, stopping=stopping)
+    
+    def stats(self):
+        with self.lock:
+            queued = len(self.events)
+        return {
+            'enabled': bool(self.url_provider()),
+            'queued': queued,
+            'sent_messages': self.stats_counter['messages'],
+            'sent_events': self.stats_counter['events'],
+            'rate_limited': self.stats_counter['rate_limited'],
+            'dropped': self.stats_counter['dropped'],
+            'failed': self.stats_counter['failed']
+        }
+
+class AdmissionRejected(Exception):
+    """Başlatma zamanlayıcısı isteği kabul etmedi (kuyruk dolu veya bekleme süresi aşıldı)"""
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class LaunchScheduler:
+    """Tarayıcı başlatan istekler için giriş kontrolü
+    
+    Aynı anda en fazla concurrency istek çalışır; fazlası queue_size
+    uzunluğunda FIFO kuyrukta en fazla queue_timeout saniye bekler. Kuyruk
+    doluysa veya bekleme süresi aşılırsa AdmissionRejected yükseltilir;
+    retry_after ortalama çalışma süresinden tahmin edilir.
+    """
+    def __init__(self, concurrency=2, queue_size=8, queue_timeout=60):
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.condition = threading.Condition()
+        self.active = 0
+        self.waiting = deque()  # Sıradaki biletler (FIFO)
+        self.tickets = itertools.count()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.max_depth = 0
+        self.wait_times = deque(maxlen=500)
+        self.service_time = None  # Çalışma süresinin üstel ortalaması (saniye)
+        self.local = threading.local()  # Thread'in tuttuğu hak ve askıda geçen süre
+    
+    def retry_after(self):
+        """Kuyruğun boşalması için tahmini süre (saniye, kilit altında çağrılır)"""
+        service = self.service_time or 5.0
+        return max(1, int(service * (len(self.waiting) + 1) / self.concurrency + 0.999))
+    
+    @contextmanager
+    def slot(self):
+        """Başlatma hakkı al; hak alınamazsa AdmissionRejected yükselt"""
+        requested = time.monotonic()
+        with self.condition:
+            if self.active >= self.concurrency or self.waiting:
+                if len(self.waiting) >= self.queue_size:
+                    self.rejected += 1
+                    raise AdmissionRejected("Başlatma kuyruğu dolu", self.retry_after())
+                ticket = next(self.tickets)
+                self.waiting.append(ticket)
+                self.max_depth = max(self.max_depth, len(self.waiting))
+                admitted = self.condition.wait_for(
+                    lambda: self.waiting[0] == ticket and self.active < self.concurrency,
+                    timeout=self.queue_timeout
+                )
+                self.waiting.remove(ticket)
+                if not admitted:
+                    self.timed_out += 1
+                    self.condition.notify_all()
+                    raise AdmissionRejected("Başlatma kuyruğunda bekleme süresi aşıldı", self.retry_after())
+            self.active += 1
+            self.admitted += 1
+            started = time.monotonic()
+            self.wait_times.append(started - requested)
+            self.condition.notify_all()
+        self.local.held = True
+        self.local.suspended = 0.0
+        try:
+            yield started - requested
+        finally:
+            self.local.held = False
+            elapsed = time.monotonic() - started - self.local.suspended
+            with self.condition:
+                self.active -= 1
+                self.service_time = elapsed if self.service_time is None else 0.8 * self.service_time + 0.2 * elapsed
+                self.condition.notify_all()
+    
+    def reconfigure(self, concurrency, queue_size, queue_timeout):
+        """Sınırları canlı değiştir; artan eşzamanlılık bekleyenleri hemen içeri alır"""
+        with self.condition:
+            self.concurrency = concurrency
+            self.queue_size = queue_size
+            self.queue_timeout = queue_timeout
+            self.condition.notify_all()
+    
+    @contextmanager
+    def suspended(self):
+        """Bu thread'in başlatma hakkını blok boyunca bırak
+        
+        Başka bir isteğin süren başlatmasını bekleyen istek hak tutmasın diye
+        kullanılır; blok bitince hak kuyruğa girmeden, ilk boş yer açıldığında geri
+        alınır. Thread hak tutmuyorsa hiçbir şey yapmaz.
+        """
+        if not getattr(self.local, 'held', False):
+            yield
+            return
+        paused = time.monotonic()
+        with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.condition.wait_for(lambda: self.active < self.concurrency)
+                self.active += 1
+            self.local.suspended += time.monotonic() - paused
+    
+    def stats(self):
+        """Kuyruk derinliği, bekleme süreleri ve sayaçlar"""
+        with self.condition:
+            waits = sorted(self.wait_times)
+            return {
+                'concurrency': self.concurrency,
+                'queue_size': self.queue_size,
+                'active': self.active,
+                'queued': len(self.waiting),
+                'max_queued': self.max_depth,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'wait_ms': {
+                    'p50': round(waits[len(waits) // 2] * 1000, 1) if waits else None,
+                    'p95': round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else None,
+                    'max': round(waits[-1] * 1000, 1) if waits else None,
+                },
+                'avg_launch_ms': round(self.service_time * 1000, 1) if self.service_time is not None else None
+            }
+
+class IdempotencyCache:
+    """Idempotency-Key başlıklı isteklerin yanıtlarını TTL süresince saklar
+    
+    Aynı anahtarla gelen tekrar istek, ilki sürüyorsa kısa bir süre (wait_timeout)
+    onun bitmesini bekler ve aynı yanıtı alır; bitmezse API işçisini tutmadan
+    "sürüyor" bildirilir ve istemci daha sonra yeniden dener. Anahtar farklı bir istek gövdesiyle
+    kullanılırsa çakışma bildirilir. Sadece tamamlanan (200) yanıtlar saklanır; 429 gibi geçici
+    yanıtlardan sonra aynı anahtarla yeniden denenebilir.
+    """
+    def __init__(self, ttl=600, max_entries=1000, wait_timeout=2):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.wait_timeout = wait_timeout
+        self.entries = {}  # anahtar -> {'fingerprint', 'event', 'response', 'expires'}
+        self.lock = threading.Lock()
+        self.replays = 0
+    
+    def purge(self, now):
+        """Süresi dolan ve sınırı aşan kayıtları sil (kilit altında çağrılır)"""
+        for key in [k for k, e in self.entries.items() if e['expires'] is not None and e['expires'] < now]:
+            del self.entries[key]
+        while len(self.entries) > self.max_entries:
+            oldest = next((k for k, e in self.entries.items() if e['response'] is not None), None)
+            if oldest is None:
+                break
+            del self.entries[oldest]
+    
+    def begin(self, key, fingerprint):
+        """İsteği kaydet: ('new', None), ('replay', yanıt), ('conflict', None) veya ('in_progress', None) döndür"""
+        while True:
+            with self.lock:
+                self.purge(time.time())
+                entry = self.entries.get(key)
+                if entry is None:
+                    self.entries[key] = {'fingerprint': fingerprint, 'event': threading.Event(),
+                                         'response': None, 'expires': None}
+                    return 'new', None
+                if entry['fingerprint'] != fingerprint:
+                    return 'conflict', None
+                if entry['response'] is not None:
+                    self.replays += 1
+                    return 'replay', entry['response']
+                event = entry['event']
+            # Aynı anahtarla ilk istek sürüyor: bitmesini bekle ve tekrar bak
+            if not event.wait(self.wait_timeout):
+                return 'in_progress', None
+    
+    def finish(self, key, body, status):
+        """Yanıtı sakla (200) veya kaydı bırak, bekleyenleri uyandır"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            if status == 200:
+                entry['response'] = (body, status)
+                entry['expires'] = time.time() + self.ttl
+            else:
+                del self.entries[key]
+        entry['event'].set()
+
+class BrowserProcessRegistry:
+    """Başlatılan msedgedriver/Edge süreçlerini diskte takip eder
+    
+    Kapanmayan driver'ların süreç ağacını zorla sonlandırır ve başlangıçta
+    önceki (çökmüş) çalıştırmadan kalan süreçleri temizler. Süreç ağacı ve
+    yetim taraması için psutil kullanılır (isteğe bağlı bağımlılık).
+    """
+    PROCESS_NAMES = ('msedgedriver', 'msedge')
+    
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.by_driver = {}  # id(driver) -> [{'pid', 'create_time'}]
+    
+    @staticmethod
+    def psutil():
+        try:
+            import psutil
+            return psutil
+        except ImportError:
+            return None
+    
+    def register(self, driver):
+        """Driver'ın msedgedriver sürecini ve alt süreçlerini (Edge) kaydet"""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is None:
+            return  # Remote/sahte driver: yerel süreç yok
+        entries = [{'pid': process.pid, 'create_time': None}]
+        ps = self.psutil()
+        if ps:
+            try:
+                root = ps.Process(process.pid)
+                entries = [{'pid': p.pid, 'create_time': p.create_time()}
+                           for p in [root] + root.children(recursive=True)]
+            except ps.Error:
+                pass
+        with self.lock:
+            self.by_driver[id(driver)] = entries
+            self.save()
+    
+    def release(self, driver, force=False):
+        """Driver'ın kaydını sil; force ise hala yaşayan süreçlerini sonlandır"""
+        with self.lock:
+            entries = self.by_driver.pop(id(driver), None)
+            if entries is not None:
+                self.save()
+        if force and entries:
+            for entry in entries:
+                self.kill_tree(entry['pid'])
+    
+    def save(self):
+        """Kayıtlı süreçleri pid dosyasına yaz (kilit altında çağrılır)"""
+        entries = [entry for group in self.by_driver.values() for entry in group]
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'pids': entries}, f)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Süreç kaydı yazılamadı: {str(e)}")
+    
+    def rss_mb(self, driver):
+        """Driver'ın süreç ağacının toplam RSS'i (MB); psutil yoksa veya süreç bilinmiyorsa None"""
+        ps = self.psutil()
+        with self.lock:
+            entries = self.by_driver.get(id(driver))
+        if ps is None or not entries:
+            return None
+        try:
+            root = ps.Process(entries[0]['pid'])
+            procs = [root] + root.children(recursive=True)
+        except ps.Error:
+            return None
+        total = 0
+        for proc in procs:
+            try:
+                total += proc.memory_info().rss
+            except ps.Error:
+                pass
+        return total / (1024 * 1024)
+    
+    @staticmethod
+    def kill_tree(pid):
+        """Süreci alt süreçleriyle birlikte zorla sonlandır"""
+        ps = BrowserProcessRegistry.psutil()
+        if ps:
+            try:
+                root = ps.Process(pid)
+                procs = root.children(recursive=True) + [root]
+            except ps.Error:
+                return
+            for proc in procs:
+                try:
+                    proc.kill()
+                except ps.Error:
+                    pass
+            ps.wait_procs(procs, timeout=3)
+        elif os.name == 'nt':
+            import subprocess
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], capture_output=True)
+        else:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+    
+    def is_ours(self, proc):
+        name = (proc.name() or '').lower()
+        return name.startswith(self.PROCESS_NAMES)
+    
+    def is_our_browser(self, proc, user_data_dirs):
+        """Süreç bizim profil dizinlerimizden biriyle otomasyon için açılmış Edge ana süreci mi"""
+        try:
+            name = (proc.name() or '').lower()
+            cmdline = ' '.join(proc.cmdline() or [])
+        except self.psutil().Error:
+            return False
+        if not name.startswith('msedge') or name.startswith('msedgedriver'):
+            return False
+        if '--remote-debugging-port' not in cmdline or '--type=' in cmdline:
+            return False
+        return any(f"--user-data-dir={d}" in cmdline for d in user_data_dirs)
+    
+    def reap_orphans(self, user_data_dirs):
+        """Önceki çalıştırmadan kalan msedgedriver/Edge süreçlerini sonlandır"""
+        ps = self.psutil()
+        if ps is None:
+            logger.warning("psutil kurulu değil, yetim süreç taraması atlandı")
+            return 0
+        
+        reaped = 0
+        # 1) Önceki çalıştırmanın pid dosyası (pid yeniden kullanımına karşı create_time ile doğrulanır)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                previous = json.load(f).get('pids', [])
+        except (OSError, ValueError):
+            previous = []
+        previous_pids = {entry['pid'] for entry in previous}
+        for entry in previous:
+            try:
+                proc = ps.Process(entry['pid'])
+                if entry.get('create_time') is None or abs(proc.create_time() - entry['create_time']) > 1:
+                    continue
+                if self.is_ours(proc):
+                    self.kill_tree(proc.pid)
+                    reaped += 1
+            except ps.Error:
+                continue
+        
+        # 2) Create_time doğrulanamayanlar: ebeveyni ölmüş ve ya pid dosyamızda olan ya da
+        #    Edge alt süreci bizim profil dizinlerimizi kullanan msedgedriver'lar; bizim profil
+        #    dizinlerimizle otomasyon için açılmış, ebeveyni ölmüş Edge ana süreçleri.
+        #    Başka araçların (ör. başka bir Selenium betiği) driver'larına dokunulmaz.
+        for proc in ps.process_iter(['pid', 'name', 'cmdline']):
+            try:
+                name = (proc.info['name'] or '').lower()
+                if not name.startswith(self.PROCESS_NAMES):
+                    continue
+                parent = proc.parent()
+                if parent is not None and parent.is_running():
+                    continue
+                if name.startswith('msedgedriver'):
+                    if proc.pid not in previous_pids and not any(
+                            self.is_our_browser(child, user_data_dirs) for child in proc.children()):
+                        continue
+                elif not self.is_our_browser(proc, user_data_dirs):
+                    continue
+                self.kill_tree(proc.pid)
+                reaped += 1
+            except ps.Error:
+                continue
+        
+        with self.lock:
+            self.save()
+        if reaped:
+            logger.warning(f"Önceki çalıştırmadan kalan {reaped} tarayıcı/driver süreci sonlandırıldı")
+        return reaped
+
+class SessionJournal:
+    """Aktif oturum kümesinin çökmeye dayanıklı, yalnızca eklemeli günlüğü
+    
+    Her başlatma/durdurma tek bir JSON satırı olarak eklenip diske senkronlanır;
+    belirli sayıda kayıttan sonra günlük, güncel kümenin anlık görüntüsüyle
+    atomik olarak yeniden yazılır. Oturumlar konumsal ID'ler yerine
+    (url, profil adı) ile anahtarlanır, böylece link/profil listesi değişse de
+    doğru oturum geri yüklenir.
+    """
+    def __init__(self, path, compact_every=100):
+        self.path = path
+        self.compact_every = compact_every
+        self.lock = threading.Lock()
+        self.entries = {}  # (url, profil adı) -> kayıt, başlatma sırasıyla
+        self.appended = 0
+    
+    @staticmethod
+    def key(record):
+        return (record['url'], record['profile_name'])
+    
+    def load(self):
+        """Günlüğü yeniden oynatıp kayıtlı oturumları döndür"""
+        entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Çökme anında yarım kalmış son satır
+                    op = record.pop('op', None)
+                    if op == 'start':
+                        entries[self.key(record)] = record
+                    elif op == 'stop':
+                        entries.pop(self.key(record), None)
+                    elif op == 'clear':
+                        entries.clear()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Oturum günlüğü okunamadı: {str(e)}")
+        with self.lock:
+            self.entries = entries
+        return list(entries.values())
+    
+    def append(self, record):
+        """Kaydı günlüğe ekle ve diske senkronla (kilit altında çağrılır)"""
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.warning(f"Oturum günlüğüne yazılamadı: {str(e)}")
+            return
+        self.appended += 1
+        if self.appended >= self.compact_every:
+            self.compact()
+    
+    def compact(self):
+        """Günlüğü güncel oturum kümesiyle atomik olarak yeniden yaz (kilit altında çağrılır)"""
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in self.entries.values():
+                    f.write(json.dumps(dict(record, op='start'), ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.appended = 0
+        except OSError as e:
+            logger.warning(f"Oturum günlüğü sıkıştırılamadı: {str(e)}")
+    
+    def record_start(self, link_id, url, profile_id, profile_name):
+        record = {'link_id': link_id, 'url': url, 'profile_id': profile_id, 'profile_name': profile_name}
+        with self.lock:
+            self.entries[self.key(record)] = record
+            self.append(dict(record, op='start'))
+    
+    def record_stop(self, url, profile_name):
+        record = {'url': url, 'profile_name': profile_name}
+        with self.lock:
+            if self.entries.pop(self.key(record), None) is not None:
+                self.append(dict(record, op='stop'))
+    
+    def record_clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.append({'op': 'clear'})
+    
+    def reset(self):
+        """Günlüğü boşalt"""
+        with self.lock:
+            self.entries.clear()
+            self.compact()
+
+class ProfileCatalog:
+    """Edge profillerinin keşfi ve mtime ile önbelleklenen doğrulaması
+    
+    Profiller Edge'in 'Local State' dosyasındaki profile.info_cache alanından
+    okunur. Doğrulama sonuçları profil dizininin mtime değeriyle birlikte
+    önbellek dosyasına yazılır; dizin değişmemişse Preferences dosyasına
+    yeniden bakılmaz. Profiller paralel doğrulanır.
+    """
+    VALID = 'valid'      # Dizin ve Preferences var
+    UNUSED = 'unused'    # Dizin var ama Edge bu profille hiç açılmamış
+    MISSING = 'missing'  # Dizin yok
+    
+    def __init__(self, path, max_workers=8):
+        self.path = path
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.entries = {}     # profil yolu -> {'mtime', 'status'}
+        self.catalogs = {}    # User Data dizini -> {'mtime', 'profiles'}
+        self.verified = set() # Bu çalıştırmada doğrulanmış yollar
+        self.dirty = False
+        self.load()
+    
+    @staticmethod
+    def default_user_data_dir():
+        """Edge'in bu platformdaki varsayılan User Data dizini"""
+        if sys.platform == 'win32':
+            base = os.getenv('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+            return os.path.join(base, 'Microsoft', 'Edge', 'User Data')
+        if sys.platform == 'darwin':
+            return os.path.expanduser('~/Library/Application Support/Microsoft Edge')
+        return os.path.expanduser('~/.config/microsoft-edge')
+    
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get('profiles', {})
+            self.catalogs = data.get('catalogs', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Profil önbelleği okunamadı: {str(e)}")
+    
+    def save(self):
+        """Değişiklik varsa önbelleği atomik olarak yaz"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {'profiles': dict(self.entries), 'catalogs': dict(self.catalogs)}
+            self.dirty = False
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Profil önbelleği yazılamadı: {str(e)}")
+    
+    def discover(self, user_data_dir=None):
+        """Local State'teki profilleri [{'name', 'path'}] olarak döndür"""
+        user_data_dir = user_data_dir or self.default_user_data_dir()
+        local_state = os.path.join(user_data_dir, 'Local State')
+        try:
+            mtime = os.stat(local_state).st_mtime_ns
+        except OSError:
+            return []
+        with self.lock:
+            cached = self.catalogs.get(user_data_dir)
+        if cached and cached['mtime'] == mtime:
+            return [dict(profile) for profile in cached['profiles']]
+        
+        try:
+            with open(local_state, 'r', encoding='utf-8') as f:
+                profile_state = json.load(f).get('profile', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Edge Local State okunamadı ({local_state}): {str(e)}")
+            return []
+        info_cache = profile_state.get('info_cache', {})
+        # Edge'in kendi sırası varsa onu kullan, yoksa Default önce gelsin
+        order = [d for d in profile_state.get('profiles_order', []) if d in info_cache]
+        order += sorted((d for d in info_cache if d not in order), key=lambda d: (d != 'Default', len(d), d))
+        profiles = [
+            {'name': info_cache[directory].get('name') or directory, 'path': os.path.join(user_data_dir, directory)}
+            for directory in order
+        ]
+        with self.lock:
+            self.catalogs[user_data_dir] = {'mtime': mtime, 'profiles': profiles}
+            self.dirty = True
+        self.save()
+        return [dict(profile) for profile in profiles]
+    
+    def check(self, path):
+        """Tek profili doğrula; dizinin mtime'ı değişmediyse önbellekteki sonucu kullan"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime, status = None, self.MISSING
+        else:
+            with self.lock:
+                cached = self.entries.get(path)
+            if cached and cached['mtime'] == mtime:
+                with self.lock:
+                    self.verified.add(path)
+                return cached['status']
+            # Edge Preferences'ı geçici dosya + yeniden adlandırma ile yazar, bu da dizin mtime'ını günceller
+            status = self.VALID if os.path.exists(os.path.join(path, 'Preferences')) else self.UNUSED
+        with self.lock:
+            self.entries[path] = {'mtime': mtime, 'status': status}
+            self.verified.add(path)
+            self.dirty = True
+        return status
+    
+    def validate(self, paths):
+        """Profilleri paralel doğrula, {yol: durum} döndür"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        paths = list(dict.fromkeys(paths))
+        workers = min(self.max_workers, len(paths))
+        if workers <= 1:
+            results = {path: self.check(path) for path in paths}
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="profile_check") as pool:
+                results = dict(zip(paths, pool.map(self.check, paths)))
+        self.save()
+        return results
+    
+    def status(self, path):
+        """Başlatma öncesi kontrol: bu çalıştırmada doğrulanmış profil için dosya sistemine bakma"""
+        with self.lock:
+            cached = self.entries.get(path) if path in self.verified else None
+        if cached and cached['status'] != self.MISSING:
+            return cached['status']
+        status = self.check(path)
+        self.save()
+        return status
+    
+    def invalidate(self, path=None):
+        """Bir profilin (veya tümünün) bu çalıştırmadaki doğrulamasını unut"""
+        with self.lock:
+            if path is None:
+                self.verified.clear()
+            else:
+                self.verified.discard(path)
+
+class DevToolsConnection:
+    """Tek bir tarayıcının CDP (DevTools protokolü) websocket bağlantısı
+    
+    Tarayıcı düzeyindeki uç noktaya bağlanır; izlenen pencereler (CDP hedefleri)
+    düz oturum kipinde eklenir. Gelen olaylar DevToolsMonitor'a iletilir.
+    """
+    def __init__(self, monitor, driver, address, timeout=5):
+        self.monitor = monitor
+        self.driver = driver
+        self.address = address
+        self.timeout = timeout
+        self.ws = None
+        self.ids = itertools.count(1)
+        self.pending = {}   # komut id -> {'event', 'result', 'error'}
+        self.sessions = {}  # CDP oturum id -> hedef id
+        self.targets = {}   # hedef id (pencere handle'ı) -> CDP oturum id
+        self.lock = threading.Lock()
+        self.closing = False
+        self.thread = None
+    
+    @property
+    def alive(self):
+        return self.thread is not None and self.thread.is_alive() and not self.closing
+    
+    def open(self):
+        import urllib.request
+        websocket = DevToolsMonitor.websocket()
+        with urllib.request.urlopen(f"http://{self.address}/json/version", timeout=self.timeout) as response:
+            url = json.loads(response.read().decode('utf-8'))['webSocketDebuggerUrl']
+        # Origin gönderilmez: Edge, --remote-allow-origins olmadan Origin'li bağlantıları reddeder
+        self.ws = websocket.create_connection(url, timeout=self.timeout, suppress_origin=True)
+        self.ws.settimeout(None)
+        self.thread = threading.Thread(target=self.reader, name="devtools_reader", daemon=True)
+        self.thread.start()
+        # Hedef çökme/kapanma olayları tarayıcı düzeyinde gelir
+        self.send('Target.setDiscoverTargets', {'discover': True})
+    
+    def close(self):
+        self.closing = True
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+    
+    def send(self, method, params=None, session_id=None, wait=True):
+        """CDP komutu gönder; wait ise yanıtı bekleyip sonucu döndür"""
+        message_id = next(self.ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        waiter = {'event': threading.Event(), 'result': None, 'error': None}
+        with self.lock:
+            if wait:
+                self.pending[message_id] = waiter
+            self.ws.send(json.dumps(message))
+        if not wait:
+            return None
+        if not waiter['event'].wait(self.timeout):
+            with self.lock:
+                self.pending.pop(message_id, None)
+            raise TimeoutError(f"DevTools yanıt vermedi: {method}")
+        if waiter['error']:
+            raise RuntimeError(f"{method}: {waiter['error'].get('message')}")
+        return waiter['result'] or {}
+    
+    def attach(self, target_id):
+        """Pencereye bağlanıp sayfa olaylarını aç"""
+        if target_id in self.targets:
+            return
+        session_id = self.send('Target.attachToTarget', {'targetId': target_id, 'flatten': True})['sessionId']
+        with self.lock:
+            self.sessions[session_id] = target_id
+            self.targets[target_id] = session_id
+        # Network alanı açılmaz: yayın sayfalarında her segment isteği için olay üretir;
+        # ana belgenin yüklenememesi frameNavigated'daki unreachableUrl ile anlaşılır
+        self.send('Page.enable', session_id=session_id)
+    
+    def detach(self, target_id):
+        """Pencereyi izlemeyi bırak; başka izlenen pencere kalmadıysa True"""
+        with self.lock:
+            session_id = self.targets.pop(target_id, None)
+            self.sessions.pop(session_id, None)
+            empty = not self.targets
+        if session_id and not empty:
+            try:
+                self.send('Target.detachFromTarget', {'sessionId': session_id}, wait=False)
+            except Exception:
+                pass
+        return empty
+    
+    def reader(self):
+        while True:
+            try:
+                raw = self.ws.recv()
+            except Exception:
+                break
+            if not raw:
+                break
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                continue
+            if 'id' in message:
+                with self.lock:
+                    waiter = self.pending.pop(message['id'], None)
+                if waiter:
+                    waiter['result'] = message.get('result')
+                    waiter['error'] = message.get('error')
+                    waiter['event'].set()
+            else:
+                self.route(message.get('method'), message.get('params', {}), message.get('sessionId'))
+        
+        with self.lock:
+            waiters = list(self.pending.values())
+            self.pending.clear()
+        for waiter in waiters:
+            waiter['error'] = {'message': "DevTools bağlantısı kapandı"}
+            waiter['event'].set()
+        if not self.closing:
+            self.closing = True
+            self.monitor.emit(self.driver, None, 'disconnected', "DevTools bağlantısı koptu")
+    
+    def route(self, method, params, session_id):
+        """İzlenen pencerelerle ilgili olayları monitöre ilet"""
+        if method == 'Target.targetCrashed':
+            target_id = params.get('targetId')
+            if target_id in self.targets:
+                self.monitor.emit(self.driver, target_id, 'crashed',
+                                  f"Sayfa çöktü ({params.get('status')}, kod {params.get('errorCode')})")
+        elif method == 'Target.targetDestroyed':
+            target_id = params.get('targetId')
+            if target_id in self.targets:
+                self.monitor.emit(self.driver, target_id, 'closed', "Pencere kapandı")
+        elif method == 'Page.frameNavigated':
+            target_id = self.sessions.get(session_id)
+            frame = params.get('frame', {})
+            if target_id is None or frame.get('parentId'):
+                return  # Alt çerçeveler (reklam, sohbet iframe'leri) ilgilendirmez
+            if frame.get('unreachableUrl'):
+                self.monitor.emit(self.driver, target_id, 'load_failed', frame['unreachableUrl'])
+            else:
+                self.monitor.emit(self.driver, target_id, 'navigated', frame.get('url'))
+
+class DevToolsMonitor:
+    """Tarayıcı olaylarını DevTools protokolü üzerinden dinleyip yöneticiye iletir
+    
+    Her driver için Edge'in debuggerAddress'ine tek bir websocket açılır (sekme
+    modunda profil tarayıcısının tüm pencereleri aynı bağlantıyı paylaşır).
+    Sayfa çökmesi, pencerenin kapanması, ana çerçevenin başka adrese gitmesi ve
+    ana belgenin yüklenememesi olayları sıraya alınır; tek bir olay thread'i
+    bunları sırayla callback'e verir. websocket-client isteğe bağlı
+    bağımlılıktır; yoksa (veya sahte driver'da) sadece yoklama kullanılır.
+    """
+    def __init__(self, callback, timeout=5):
+        self.callback = callback
+        self.timeout = timeout
+        self.connections = {}  # id(driver) -> DevToolsConnection
+        self.lock = threading.Lock()
+        self.events = queue.Queue()
+        self.running = False
+        self.thread = None
+        self.stats_counter = Counter()
+        self.warned = False
+    
+    @staticmethod
+    def websocket():
+        try:
+            import websocket
+            return websocket
+        except ImportError:
+            return None
+    
+    @staticmethod
+    def debugger_address(driver):
+        """Edge/Chrome driver'ının DevTools adresi (host:port); yoksa None"""
+        capabilities = getattr(driver, 'capabilities', None) or {}
+        for key in ('ms:edgeOptions', 'goog:chromeOptions'):
+            address = (capabilities.get(key) or {}).get('debuggerAddress')
+            if address:
+                return address
+        return None
+    
+    def start(self):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self.worker, name="devtools_events", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self.events.put(None)
+        with self.lock:
+            connections = list(self.connections.values())
+            self.connections.clear()
+        for connection in connections:
+            connection.close()
+    
+    def watch(self, driver, target_id):
+        """Driver'ın penceresini izlemeye al; DevTools kullanılamıyorsa False"""
+        address = self.debugger_address(driver)
+        if address is None or target_id is None:
+            return False
+        if self.websocket() is None:
+            if not self.warned:
+                self.warned = True
+                logger.warning("websocket-client kurulu değil, DevTools olayları yerine sadece yoklama kullanılıyor")
+            return False
+        
+        try:
+            with self.lock:
+                connection = self.connections.get(id(driver))
+                if connection is None or not connection.alive:
+                    connection = DevToolsConnection(self, driver, address, self.timeout)
+                    connection.open()
+                    self.connections[id(driver)] = connection
+            connection.attach(target_id)
+        except Exception as e:
+            logger.warning(f"DevTools olaylarına abone olunamadı ({address}): {str(e)}")
+            self.stats_counter['watch_failed'] += 1
+            return False
+        self.start()
+        return True
+    
+    def unwatch(self, driver, target_id=None):
+        """Pencereyi (None: driver'ın tüm pencerelerini) izlemeyi bırak"""
+        with self.lock:
+            connection = self.connections.get(id(driver))
+            if connection is None:
+                return
+            if target_id is not None and not connection.detach(target_id):
+                return
+            del self.connections[id(driver)]
+        connection.close()
+    
+    def is_watched(self, driver, target_id=None):
+        with self.lock:
+            connection = self.connections.get(id(driver))
+        if connection is None or not connection.alive:
+            return False
+        return target_id is None or target_id in connection.targets
+    
+    def emit(self, driver, target_id, kind, detail):
+        """Bağlantı thread'inden gelen olayı sıraya al"""
+        self.stats_counter[kind] += 1
+        self.events.put((driver, target_id, kind, detail))
+    
+    def worker(self):
+        while self.running:
+            event = self.events.get()
+            if event is None:
+                continue
+            try:
+                self.callback(*event)
+            except Exception as e:
+                logger.error(f"DevTools olayı işlenirken hata: {str(e)}")
+    
+    def stats(self):
+        with self.lock:
+            connections = list(self.connections.values())
+        return {
+            'available': self.websocket() is not None,
+            'connections': sum(1 for c in connections if c.alive),
+            'watched_windows': sum(len(c.targets) for c in connections if c.alive),
+            'events': {kind: count for kind, count in self.stats_counter.items() if kind != 'watch_failed'},
+            'watch_failed': self.stats_counter['watch_failed']
+        }
 
-class BetterKickTool:
+class HealthHistory:
+    """Oturum sağlık/kaynak geçmişi için sabit boyutlu, bellek eşlemeli halka deposu
+    
+    Dosya başlıktan sonra sabit sayıda oturum yuvasına bölünür; her yuvada ham
+    örnekler (zaman, sağlıklı mı, hazır olma süresi, RSS) ile dakikalık ve saatlik
+    özetler için üç halka tampon bulunur. Özetler örnek eklenirken güncellenir,
+    bu yüzden erişilebilirlik yüzdeleri ham örnekler taranmadan hesaplanır.
+    Yuvalar dolunca en uzun süredir güncellenmeyen oturumun yuvası yeniden
+    kullanılır; dosya boyutu yapılandırmayla sabittir.
+    """
+    MAGIC = b'BKTH'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHIIII')             # magic, sürüm, -, yuva, ham, dakika, saat
+    HEADER_SIZE = 64
+    SLOT_HEADER = struct.Struct('<16s96sdIIIIII')   # özet, etiket, son zaman, halka başları/sayıları
+    RAW = struct.Struct('<dfff')                    # zaman, sağlıklı (0/1), ready_ms, rss_mb
+    ROLLUP = struct.Struct('<dIIdIff')              # başlangıç, örnek, sağlıklı, ready toplamı/sayısı/en büyük, rss en büyük
+    RESOLUTIONS = {'minute': 60, 'hour': 3600}
+    
+    def __init__(self, path, sampler=None, slots=64, raw=1440, minutes=1440, hours=720, sample_interval=60):
+        self.path = path
+        self.sampler = sampler
+        self.slots = slots
+        self.lengths = {'raw': raw, 'minute': minutes, 'hour': hours}
+        self.sample_interval = sample_interval
+        self.slot_size = (self.SLOT_HEADER.size + raw * self.RAW.size
+                          + (minutes + hours) * self.ROLLUP.size)
+        self.size = self.HEADER_SIZE + slots * self.slot_size
+        self.lock = threading.Lock()
+        self.map = None
+        self.file = None
+        self.index = {}  # anahtar özeti -> yuva numarası
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+    
+    def open(self):
+        """Dosyayı eşle; boyutlar yapılandırmayla uyuşmuyorsa sıfırdan oluştur (kilit altında çağrılır)"""
+        if self.map is not None:
+            return
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, 0, self.slots, *self.lengths.values())
+        fresh = True
+        try:
+            with open(self.path, 'rb') as f:
+                fresh = f.read(self.HEADER.size) != header or os.path.getsize(self.path) != self.size
+        except OSError:
+            pass
+        if fresh and os.path.exists(self.path):
+            logger.warning("Sağlık geçmişi dosyası farklı boyutlarla oluşturulmuş, sıfırlanıyor")
+        self.file = open(self.path, 'w+b' if fresh else 'r+b')
+        if fresh:
+            self.file.truncate(self.size)
+        self.map = mmap.mmap(self.file.fileno(), self.size)
+        if fresh:
+            self.map[:self.HEADER.size] = header
+        for slot in range(self.slots):
+            digest = self.SLOT_HEADER.unpack_from(self.map, self.slot_offset(slot))[0]
+            if digest != bytes(16):
+                self.index[digest] = slot
+    
+    def close(self):
+        with self.lock:
+            if self.map is None:
+                return
+            self.map.flush()
+            self.map.close()
+            self.file.close()
+            self.map = None
+            self.index = {}
+    
+    def start(self):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self.worker, name="health_history", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+        if self.thread:
+            self.thread.join(3)
+        self.close()
+    
+    def worker(self):
+        """sample_interval aralıklarla sampler'dan gelen oturum durumlarını kaydet"""
+        while self.running:
+            self.wakeup.wait(self.sample_interval)
+            if not self.running:
+                break
+            try:
+                for key, ok, rss_mb in self.sampler():
+                    self.record(key, ok, rss_mb=rss_mb)
+                with self.lock:
+                    if self.map is not None:
+                        self.map.flush()
+            except Exception as e:
+                logger.error(f"Sağlık geçmişi örneklenirken hata: {str(e)}")
+    
+    @staticmethod
+    def digest(key):
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+    
+    def slot_offset(self, slot):
+        return self.HEADER_SIZE + slot * self.slot_size
+    
+    def ring_offset(self, slot, ring):
+        offset = self.slot_offset(slot) + self.SLOT_HEADER.size
+        if ring == 'raw':
+            return offset
+        offset += self.lengths['raw'] * self.RAW.size
+        if ring == 'minute':
+            return offset
+        return offset + self.lengths['minute'] * self.ROLLUP.size
+    
+    def slot_for(self, key, create=False):
+        """Anahtarın yuvası; create ise gerekirse en eski yuvayı devral (kilit altında çağrılır)"""
+        digest = self.digest(key)
+        slot = self.index.get(digest)
+        if slot is not None or not create:
+            return slot
+        used = set(self.index.values())
+        free = [s for s in range(self.slots) if s not in used]
+        if free:
+            slot = free[0]
+        else:
+            slot = min(used, key=lambda s: self.SLOT_HEADER.unpack_from(self.map, self.slot_offset(s))[2])
+            old_digest = self.SLOT_HEADER.unpack_from(self.map, self.slot_offset(slot))[0]
+            del self.index[old_digest]
+        label = key.encode('utf-8')[:96]
+        self.SLOT_HEADER.pack_into(self.map, self.slot_offset(slot), digest, label, 0.0, 0, 0, 0, 0, 0, 0)
+        self.index[digest] = slot
+        return slot
+    
+    def record(self, key, ok, ready_ms=None, rss_mb=None, ts=None):
+        """Oturum için bir örnek ekle ve dakikalık/saatlik özetleri güncelle"""
+        ts = ts or time.time()
+        nan = float('nan')
+        with self.lock:
+            self.open()
+            slot = self.slot_for(key, create=True)
+            offset = self.slot_offset(slot)
+            digest, label, _, *rings = self.SLOT_HEADER.unpack_from(self.map, offset)
+            heads = dict(zip(('raw', 'minute', 'hour'), zip(rings[::2], rings[1::2])))
+            
+            head, count = heads['raw']
+            self.RAW.pack_into(self.map, self.ring_offset(slot, 'raw') + head * self.RAW.size, ts,
+                               1.0 if ok else 0.0, nan if ready_ms is None else ready_ms, nan if rss_mb is None else rss_mb)
+            heads['raw'] = ((head + 1) % self.lengths['raw'], min(count + 1, self.lengths['raw']))
+            
+            for ring, seconds in self.RESOLUTIONS.items():
+                heads[ring] = self.update_rollup(slot, ring, heads[ring], ts - ts % seconds, ok, ready_ms, rss_mb)
+            
+            self.SLOT_HEADER.pack_into(self.map, offset, digest, label, ts,
+                                       *heads['raw'], *heads['minute'], *heads['hour'])
+    
+    def update_rollup(self, slot, ring, head_count, bucket, ok, ready_ms, rss_mb):
+        """Özet halkasının son kovasını güncelle veya yeni kova aç (kilit altında çağrılır)"""
+        head, count = head_count
+        length = self.lengths[ring]
+        base = self.ring_offset(slot, ring)
+        row = None
+        if count:
+            last = (head - 1) % length
+            row = self.ROLLUP.unpack_from(self.map, base + last * self.ROLLUP.size)
+            if row[0] > bucket:
+                return head_count  # Sıra dışı eski örnek: özetlere katılmaz
+            if row[0] < bucket:
+                row = None
+        if row is None:
+            last = head
+            head, count = (head + 1) % length, min(count + 1, length)
+            row = (bucket, 0, 0, 0.0, 0, 0.0, 0.0)
+        start, samples, healthy, ready_sum, ready_count, ready_max, rss_max = row
+        samples += 1
+        healthy += 1 if ok else 0
+        if ready_ms is not None:
+            ready_sum += ready_ms
+            ready_count += 1
+            ready_max = max(ready_max, ready_ms)
+        if rss_mb is not None:
+            rss_max = max(rss_max, rss_mb)
+        self.ROLLUP.pack_into(self.map, base + last * self.ROLLUP.size,
+                              start, samples, healthy, ready_sum, ready_count, ready_max, rss_max)
+        return head, count
+    
+    def rows(self, slot, ring, newest_first=False):
+        """Halkadaki kayıtları eskiden yeniye (newest_first: yeniden eskiye) üret (kilit altında çağrılır)"""
+        rings = self.SLOT_HEADER.unpack_from(self.map, self.slot_offset(slot))[3:]
+        head, count = dict(zip(('raw', 'minute', 'hour'), zip(rings[::2], rings[1::2])))[ring]
+        record = self.RAW if ring == 'raw' else self.ROLLUP
+        length = self.lengths[ring]
+        base = self.ring_offset(slot, ring)
+        order = range(count - 1, -1, -1) if newest_first else range(count)
+        for i in order:
+            yield record.unpack_from(self.map, base + ((head - count + i) % length) * record.size)
+    
+    def history(self, key, resolution='minute', since=None, limit=None):
+        """Oturumun örneklerini (raw) veya özetlerini (minute/hour) eskiden yeniye döndür"""
+        def number(value):
+            return None if math.isnan(value) else round(value, 1)
+        
+        with self.lock:
+            self.open()
+            slot = self.slot_for(key)
+            rows = list(self.rows(slot, resolution)) if slot is not None else []
+        if since is not None:
+            rows = [row for row in rows if row[0] >= since]
+        if limit:
+            rows = rows[-limit:]
+        if resolution == 'raw':
+            return [{'ts': ts, 'ok': bool(ok), 'ready_ms': number(ready_ms), 'rss_mb': number(rss_mb)}
+                    for ts, ok, ready_ms, rss_mb in rows]
+        return [{
+            'ts': start,
+            'samples': samples,
+            'availability': round(healthy * 100 / samples, 2) if samples else None,
+            'ready_ms_avg': round(ready_sum / ready_count, 1) if ready_count else None,
+            'ready_ms_max': round(ready_max, 1) if ready_count else None,
+            'rss_mb_max': round(rss_max, 1) if rss_max else None
+        } for start, samples, healthy, ready_sum, ready_count, ready_max, rss_max in rows]
+    
+    def availability(self, keys, window):
+        """Anahtarların son window saniyedeki erişilebilirlik yüzdesi (özetlerden; örnek yoksa None)
+        
+        24 saat ve üstü pencereler saatlik özetlerden okunur (anahtar başına ~window/3600
+        satır); daha kısa pencereler dakikalık özetlerden. Başlangıç özet sınırına yuvarlanır.
+        """
+        if window < 86400 and window <= self.lengths['minute'] * 60:
+            resolution = 'minute'
+        else:
+            resolution = 'hour'
+        since = time.time() - window
+        since -= since % self.RESOLUTIONS[resolution]
+        samples = healthy = 0
+        with self.lock:
+            self.open()
+            for key in keys:
+                slot = self.slot_for(key)
+                if slot is None:
+                    continue
+                for row in self.rows(slot, resolution, newest_first=True):
+                    if row[0] < since:
+                        break
+                    samples += row[1]
+                    healthy += row[2]
+        return round(healthy * 100 / samples, 2) if samples else None
+
+def _profile_path_key(path):
+    """Profil yollarını karşılaştırmak için normalleştir"""
+    return os.path.normcase(os.path.abspath(path))
+
+def _trigrams(text):
+    """Metnin küçük harfli 3'lü karakter grupları"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class LinkIndex:
+    """/links ve /status sorguları için indeksler
+    
+    links/sessions/profiles sürümleri değiştiğinde bir kez yeniden kurulur;
+    aradaki tüm sorgular tarama yapmadan indekslerden yanıtlanır. İsim araması
+    trigram indeksiyle aday kümesini daraltır (3 karakterden kısa sorgular
+    isimleri tarar). Sayfalama için sıralama anahtarları ve konumlar da burada
+    bir kez hesaplanır; sorgular cursor'ı bu anahtarlarda ikili aramayla bulur.
+    """
     def __init__(self):
+        self.lock = threading.Lock()
+        self.key = None
+        self.link_ids = []        # Sayısal ID sırasıyla link ID'leri
+        self.link_keys = []       # link_ids ile aynı sırada sayısal ID'ler (cursor araması)
+        self.link_pos = {}        # link ID -> link_ids içindeki konum
+        self.names = {}           # link ID -> küçük harfli isim
+        self.link_status = {}     # durum -> {link ID}
+        self.link_profiles = {}   # profil ID -> {aktif oturumu olan link ID}
+        self.name_trigrams = {}   # trigram -> {link ID}
+        self.sessions = []        # (link sırası, profil sırası) ile sıralı (link ID, profil ID)
+        self.session_keys = []    # sessions ile aynı sırada (int link ID, int profil ID)
+        self.session_pos = {}     # oturum -> sessions içindeki konum
+        self.link_sessions = {}   # link ID -> {aktif oturum}
+        self.profile_sessions = {}  # profil ID -> {aktif oturum}
+    
+    def refresh(self, manager):
+        """Sürümler değiştiyse indeksleri yeniden kur"""
+        v = manager.versions
+        key = (v['links'], v['sessions'], v['profiles'])
+        with self.lock:
+            if key == self.key:
+                return
+            links = dict(manager.links)
+            self.link_ids = sorted(links, key=int)
+            self.link_keys = [int(lid) for lid in self.link_ids]
+            self.link_pos = {lid: i for i, lid in enumerate(self.link_ids)}
+            self.names = {lid: data['name'].lower() for lid, data in links.items()}
+            self.link_status = {}
+            self.name_trigrams = {}
+            for lid, data in links.items():
+                self.link_status.setdefault(data['status'], set()).add(lid)
+                for trigram in _trigrams(self.names[lid]):
+                    self.name_trigrams.setdefault(trigram, set()).add(lid)
+            self.link_profiles = {}
+            self.link_sessions = {}
+            self.profile_sessions = {}
+            sessions = []
+            for lid, pid in list(manager.active_links):
+                if lid in links:
+                    self.link_profiles.setdefault(pid, set()).add(lid)
+                    self.link_sessions.setdefault(lid, set()).add((lid, pid))
+                    self.profile_sessions.setdefault(pid, set()).add((lid, pid))
+                    sessions.append(((int(lid), int(pid)), (lid, pid)))
+            sessions.sort()
+            self.session_keys = [sort_key for sort_key, _ in sessions]
+            self.sessions = [session for _, session in sessions]
+            self.session_pos = {session: i for i, session in enumerate(self.sessions)}
+            self.key = key
+    
+    def match_name(self, query):
+        """İsminde query geçen link ID'leri"""
+        query = query.lower()
+        if len(query) < 3:
+            return {lid for lid, name in self.names.items() if query in name}
+        candidates = None
+        for trigram in _trigrams(query):
+            ids = self.name_trigrams.get(trigram, set())
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return {lid for lid in candidates if query in self.names[lid]}
+    
+    def matching_links(self, status=None, profile_id=None, name=None):
+        """Filtrelere uyan link ID'leri için küme (filtre yoksa None)"""
+        sets = []
+        if status is not None:
+            sets.append(self.link_status.get(status, set()))
+        if profile_id is not None:
+            sets.append(self.link_profiles.get(str(profile_id), set()))
+        if name:
+            sets.append(self.match_name(name))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return set.intersection(*sets)
+    
+    def query_links(self, status=None, profile_id=None, name=None, cursor=None, limit=None):
+        """Filtrelere uyan link ID'lerinden bir sayfa (sayısal ID sırasıyla)
+        
+        (sayfa, sonraki sayfanın cursor'ı, eşleşen toplam link sayısı) döndürür.
+        """
+        with self.lock:
+            matched = self.matching_links(status, profile_id, name)
+            page, last = _paginate(self.link_ids, self.link_keys, self.link_pos, cursor, limit, matched)
+            return page, last, len(self.link_ids if matched is None else matched)
+    
+    def query_sessions(self, status=None, profile_id=None, name=None, cursor=None, limit=None):
+        """Filtrelere uyan aktif oturumlardan bir sayfa (link, profil sırasıyla)
+        
+        (sayfa, sonraki sayfanın cursor'ı, eşleşen toplam oturum sayısı) döndürür.
+        """
+        with self.lock:
+            sets = []
+            links = self.matching_links(status, None, name)
+            if links is not None:
+                sets.append({s for lid in links for s in self.link_sessions.get(lid, ())})
+            if profile_id is not None:
+                sets.append(self.profile_sessions.get(str(profile_id), set()))
+            matched = set.intersection(*sets) if sets else None
+            page, last = _paginate(self.sessions, self.session_keys, self.session_pos, cursor, limit, matched)
+            return page, last, len(self.sessions if matched is None else matched)
+
+def _paginate(items, keys, positions, cursor, limit, matched=None):
+    """Sıralı listeden cursor'dan sonraki en fazla limit öğeyi ve sonraki cursor'ı döndür
+    
+    keys items ile aynı sırada önceden hesaplanmış sıralama anahtarları, positions
+    öğe -> konum eşlemesidir. matched verilirse sadece o kümedeki öğeler alınır.
+    Sadece sayfa kopyalanır; tüm liste ne kopyalanır ne de yeniden anahtarlanır.
+    """
+    import bisect
+    
+    start = bisect.bisect_right(keys, cursor) if cursor is not None else 0
+    if matched is None:
+        end = len(items) if limit is None else start + limit
+        page = items[start:end]
+        has_more = end < len(items)
+    elif len(matched) * 8 < len(items) - start:
+        # Seyrek filtre: eşleşenlerin konumlarını sırala, cursor'dan sonrakileri al
+        ordered = sorted(positions[item] for item in matched)
+        first = bisect.bisect_left(ordered, start)
+        end = len(ordered) if limit is None else first + limit
+        page = [items[i] for i in ordered[first:end]]
+        has_more = end < len(ordered)
+    else:
+        # Yoğun filtre: cursor'dan itibaren sırayla tara, sayfa dolunca dur
+        page = []
+        has_more = False
+        for i in range(start, len(items)):
+            if items[i] in matched:
+                if limit is not None and len(page) == limit:
+                    has_more = True
+                    break
+                page.append(items[i])
+    return page, (page[-1] if page and has_more else None)
+
+def _project(item, fields):
+    """fields verilmişse öğeden sadece istenen alanları bırak"""
+    if not fields:
+        return item
+    return {key: value for key, value in item.items() if key in fields}
+
+class DataFileWatcher:
+    """data dizinindeki links/profiles/config dosyalarını izler
+    
+    Linux'ta inotify (ctypes) ile olay tabanlı çalışır, diğer platformlarda
+    dosyaların mtime/boyutunu yoklar. Değişen her dosya için, art arda gelen
+    yazmalar kısa bir süre birleştirildikten sonra manager.reload_data_file
+    çağrılır.
+    """
+    IN_CLOSE_WRITE = 0x08
+    IN_MOVED_TO = 0x80
+    
+    def __init__(self, manager, directory, files, poll_interval=1.0, debounce=0.2):
+        self.manager = manager
+        self.directory = directory
+        self.files = set(files)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.running = False
+        self.thread = None
+        self.inotify_fd = None
+    
+    def start(self):
+        self.running = True
+        self.inotify_fd = self.open_inotify()
+        mode = "inotify" if self.inotify_fd is not None else f"yoklama ({self.poll_interval}s)"
+        self.thread = threading.Thread(target=self.worker, name="file_watcher", daemon=True)
+        self.thread.start()
+        logger.info(f"Veri dosyaları izleniyor: {self.directory} ({mode})")
+    
+    def stop(self):
+        self.running = False
+    
+    def open_inotify(self):
+        """inotify tanıtıcısını aç; desteklenmiyorsa None döndür"""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO
+            if libc.inotify_add_watch(fd, os.path.abspath(self.directory).encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify kullanılamıyor, yoklamaya geçiliyor: {str(e)}")
+            return None
+    
+    def read_inotify(self, timeout):
+        """Olayları bekle ve değişen izlenen dosya adlarını döndür"""
+        import select
+        import struct
+        
+        changed = set()
+        ready, _, _ = select.select([self.inotify_fd], [], [], timeout)
+        if not ready:
+            return changed
+        buffer = os.read(self.inotify_fd, 65536)
+        offset = 0
+        while offset + 16 <= len(buffer):
+            _, _, _, length = struct.unpack_from('iIII', buffer, offset)
+            name = buffer[offset + 16:offset + 16 + length].split(b'\0', 1)[0].decode(errors='replace')
+            offset += 16 + length
+            if name in self.files:
+                changed.add(name)
+        return changed
+    
+    def signatures(self):
+        """Yoklama için dosya imzaları: (mtime, boyut)"""
+        result = {}
+        for name in self.files:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+                result[name] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                result[name] = None
+        return result
+    
+    def worker(self):
+        last = self.signatures()
+        while self.running and self.manager.running:
+            try:
+                if self.inotify_fd is not None:
+                    changed = self.read_inotify(1.0)
+                    if changed:
+                        # Editörlerin art arda yazmalarını birleştir
+                        deadline = time.monotonic() + self.debounce
+                        while time.monotonic() < deadline:
+                            changed |= self.read_inotify(max(0, deadline - time.monotonic()))
+                else:
+                    time.sleep(self.poll_interval)
+                    current = self.signatures()
+                    changed = {name for name in self.files if current[name] != last[name] and current[name]}
+                    last = current
+                
+                for name in sorted(changed):
+                    self.manager.reload_data_file(name)
+            except Exception as e:
+                logger.error(f"Dosya izleyici hatası: {str(e)}")
+                time.sleep(self.poll_interval)
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+
+# links.json'da linkle birlikte saklanan hazır olma ayarları
+LINK_OPTION_KEYS = ('ready', 'ready_state', 'ready_selector', 'ready_timeout')
+READINESS_STRATEGIES = ('body', 'ready_state', 'selector', 'none')
+DEFAULT_READINESS_TIMEOUTS = {'body': 10, 'ready_state': 15, 'selector': 20}
+
+# Çalışırken değiştirilse de ancak yeniden başlatınca uygulanan yapılandırma anahtarları
+RESTART_REQUIRED_CONFIG_KEYS = ('driver_backend', 'fake_driver', 'browser_mode', 'warm_pool', 'page_load_strategy',
+                                'history', 'api_server', 'idempotency_ttl', 'idempotency_wait',
+                                'live_reload', 'reload_poll_interval')
+
+# Dashboard kısayolları: tuş -> komut
+HOTKEY_COMMANDS = {
+    'q': 'quit',
+    'r': 'refresh',
+    's': 'stop_all',
+    'p': 'reposition',
+    'h': 'help_on',
+    'esc': 'help_off',
+    'page down': 'scroll_down',
+    'page up': 'scroll_up',
+}
+
+class BetterKickTool:
+    def __init__(self, headless=False, driver_factory=None):
         self.drivers = []
         self.profiles = []
         self.links = {}
@@ -56,15 +2413,39 @@ class BetterKickTool:
         self.check_interval = 300  # 5 dakika
         self.last_status_check = 0
         self.discord_webhook_url = None
+        self.window_settle_delay = 0.5  # Pencere konumlandırma sonrası bekleme (saniye)
+        self.shutdown_timeout = 10      # Tüm driver'ların kapanması için genel süre sınırı (saniye)
+        self.readiness_timeouts = dict(DEFAULT_READINESS_TIMEOUTS)  # Hazır olma stratejisi başına süre sınırı
         
-        # GUI için console ve state
-        self.console = Console()
-        self.gui_enabled = True
+        # GUI için console ve state (daemon modunda rich hiç yüklenmez)
+        self.headless = headless
+        if headless:
+            self.console = None
+        else:
+            from rich.console import Console
+            self.console = Console()
+        self.gui_enabled = not headless
         self.gui_thread = None
         self.show_help_panel = False
+        self.command_queue = queue.Queue()  # Kısayol komutları
+        self.command_thread = None
+        self.hotkey_debounce = 0.3  # saniye
+        self._hotkey_hook = None
+        self._keys_down = set()
+        self._last_key_time = {}
         self.last_errors = []  # Son hataları sakla
         self.last_logs = []    # Son logları sakla
         
+        # Panel girdilerinin sürümleri: her değişiklikte ilgili sürüm artar,
+        # dashboard sadece sürümü değişen panelleri yeniden oluşturur
+        self._version_seq = itertools.count(1)
+        self.versions = {name: 0 for name in ('links', 'sessions', 'profiles', 'config', 'errors', 'logs', 'help')}
+        self.gui_dirty = threading.Event()
+        self.gui_refresh_per_second = 2
+        self.links_scroll = 0  # Links panelinde görünen ilk satır
+        self.config = {}
+        self.tracer = Tracer()
+        
         # Veri dizinleri kontrolü
         if not os.path.exists('data'):
             os.makedirs('data')
@@ -72,14 +2453,104 @@ class BetterKickTool:
         # Yapılandırma yükleme
         self.load_config()
         
+        # Aktif oturumların çökmeye dayanıklı günlüğü (--resume ile geri yüklenir)
+        self.journal = SessionJournal('data/sessions_journal.jsonl', self.config.get('journal_compact_every', 100))
+        self.resume_on_start = False
+        
+        # Başlatılan tarayıcı süreçlerinin kaydı (takılan/yetim süreçleri sonlandırmak için)
+        self.process_registry = BrowserProcessRegistry('data/browser_pids.json')
+        
+        # Edge profil keşfi (Local State) ve mtime ile önbelleklenen profil doğrulaması
+        self.profile_catalog = ProfileCatalog('data/profile_cache.json', self.config.get('profile_check_workers', 8))
+        
+        # Driver fabrikası: yapılandırmadaki driver_backend ile seçilir ("edge" veya "fake")
+        self.driver_factory = driver_factory or self.create_driver_factory()
+        
+        # İsteğe bağlı sıcak driver havuzu (warm_pool.size > 0 ise profiller yüklenince başlar)
+        self.warm_pool = None
+        
+        # Sekme modu: profil başına tek tarayıcı, her link kendi penceresinde
+        self.browser_mode = self.config.get('browser_mode', 'window')
+        self.profile_browsers = {}  # profile_id -> driver (sadece sekme modunda)
+        self.browser_locks = {}     # id(driver) -> paylaşılan tarayıcı kilidi
+        self.profile_open_locks = {}  # profil yolu -> tarayıcıyı bul-veya-oluştur kilidi (sekme modu)
+        
         # Pencere konumları dinamik olarak hesaplanacak
         self.window_positions = []
         
-        # Ctrl+C yakalama
-        signal.signal(signal.SIGINT, self.signal_handler)
-        
         # Status check thread
         self.status_thread = None
+        self.status_wakeup = threading.Event()
+        
+        # /links ve /status sorguları için sürüme bağlı indeksler
+        self.link_index = LinkIndex()
+        
+        # Oturum seçimi ve süren başlatmalar: (link_id, profile_id) -> {'event', 'success'}
+        self.state_lock = threading.RLock()
+        self.inflight = {}
+        self.inflight_wait_timeout = 300
+        
+        # Çökme/yeniden başlatma olaylarının Discord webhook bildirimi (discord_webhook_url)
+        notifier_config = self.config.get('webhook_notifier', {})
+        self.notifier = WebhookNotifier(
+            lambda: self.discord_webhook_url,
+            batch_interval=notifier_config.get('batch_interval', 2.0),
+            max_queue=notifier_config.get('max_queue', 500),
+            timeout=notifier_config.get('timeout', 10)
+        )
+        
+        # Oturum başına sağlık, hazır olma süresi ve RSS geçmişi (sabit boyutlu halka deposu)
+        history_config = self.config.get('history', {})
+        self.history_enabled = history_config.get('enabled', True)
+        self.history = HealthHistory(
+            'data/health_history.bin',
+            sampler=self.sample_sessions,
+            slots=history_config.get('slots', 64),
+            raw=history_config.get('raw_samples', 1440),
+            minutes=history_config.get('minute_buckets', 1440),
+            hours=history_config.get('hour_buckets', 720),
+            sample_interval=history_config.get('sample_interval', 60)
+        )
+        
+        # API'den gelen tarayıcı başlatma isteklerinin giriş kontrolü
+        admission_config = self.config.get('launch_admission', {})
+        self.launch_scheduler = LaunchScheduler(
+            concurrency=admission_config.get('concurrency', 2),
+            queue_size=admission_config.get('queue_size', 8),
+            queue_timeout=admission_config.get('queue_timeout', 60)
+        )
+        
+        # Çöken oturumların geri çekilmeli yeniden başlatılması
+        restart_config = self.config.get('restart_backoff', {})
+        self.restart_queue = RestartQueue(
+            self,
+            base=restart_config.get('base', 5),
+            max_delay=restart_config.get('max_delay', 300),
+            jitter=restart_config.get('jitter', 0.2),
+            max_failures=restart_config.get('max_failures', 5),
+            park_seconds=restart_config.get('park_seconds', 1800),
+            stable_seconds=restart_config.get('stable_seconds', 120)
+        )
+        
+        # data dosyalarının canlı yeniden yüklenmesi (live_reload)
+        self.file_watcher = None
+        
+        # main() tarafından başlatılan API sunucusu (ApiServer)
+        self.api_server = None
+        
+        # DevTools olaylarıyla anlık çökme/gezinme tespiti; tüm oturumlar izleniyorsa
+        # yoklama devtools.check_interval'a kadar seyreltilir
+        devtools_config = self.config.get('devtools', {})
+        self.devtools_enabled = devtools_config.get('enabled', True)
+        self.devtools_check_interval = devtools_config.get('check_interval', 1800)
+        self.devtools_refresh_cooldown = devtools_config.get('refresh_cooldown', 30)
+        self.devtools = DevToolsMonitor(self.on_devtools_event, timeout=devtools_config.get('timeout', 5))
+        
+    def install_signal_handlers(self):
+        """Ctrl+C (ve servis olarak çalışırken SIGTERM) yakalama"""
+        signal.signal(signal.SIGINT, self.signal_handler)
+        if hasattr(signal, 'SIGTERM'):
+            signal.signal(signal.SIGTERM, self.signal_handler)
         
     def signal_handler(self, sig, frame):
         """Ctrl+C ile programı güvenli şekilde sonlandır"""
@@ -89,12 +2560,19 @@ class BetterKickTool:
         self.cleanup()
         sys.exit(0)
         
+    def bump_version(self, *names):
+        """Belirtilen state parçalarının sürümünü artır ve GUI'ye haber ver"""
+        for name in names:
+            self.versions[name] = next(self._version_seq)
+        self.gui_dirty.set()
+        
     def add_error(self, error_msg):
         """Hata mesajını listeye ekle"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.last_errors.append(f"[{timestamp}] {error_msg}")
         if len(self.last_errors) > 10:  # Son 10 hatayı sakla
             self.last_errors.pop(0)
+        self.bump_version('errors')
             
     def add_log(self, log_msg):
         """Log mesajını listeye ekle"""
@@ -102,6 +2580,7 @@ class BetterKickTool:
         self.last_logs.append(f"[{timestamp}] {log_msg}")
         if len(self.last_logs) > 15:  # Son 15 logu sakla
             self.last_logs.pop(0)
+        self.bump_version('logs')
         
     def load_config(self):
         """Yapılandırma dosyasını yükle"""
@@ -109,8 +2588,7 @@ class BetterKickTool:
             if os.path.exists('data/config.json'):
                 with open('data/config.json', 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    self.check_interval = config.get('check_interval', 300)
-                    self.discord_webhook_url = config.get('discord_webhook_url', None)
+                    self.apply_config(config)
                     logger.info(f"Yapılandırma yüklendi: Kontrol aralığı {self.check_interval} saniye")
                     self.add_log(f"Yapılandırma yüklendi: {self.check_interval}s aralık")
             else:
@@ -121,13 +2599,33 @@ class BetterKickTool:
             self.add_error(f"Yapılandırma hatası: {str(e)}")
             self.save_config()
     
+    def apply_config(self, config):
+        """Yapılandırma sözlüğündeki değerleri uygula"""
+        self.config = config
+        self.check_interval = config.get('check_interval', 300)
+        self.discord_webhook_url = config.get('discord_webhook_url', None)
+        self.gui_refresh_per_second = config.get('gui_refresh_per_second', 2)
+        self.hotkey_debounce = config.get('hotkey_debounce', 0.3)
+        self.window_settle_delay = config.get('window_settle_delay', 0.5)
+        self.shutdown_timeout = config.get('shutdown_timeout', 10)
+        self.readiness_timeouts = dict(DEFAULT_READINESS_TIMEOUTS, **config.get('readiness_timeouts', {}))
+        self.tracer.traces = deque(self.tracer.traces, maxlen=config.get('trace_buffer_size', 200))
+        self.bump_version('config')
+    
     def save_config(self):
         """Yapılandırma dosyasını kaydet"""
         try:
-            config = {
+            # Bilinmeyen anahtarları koru, sadece yönetilen değerleri güncelle
+            config = dict(self.config)
+            config.update({
                 'check_interval': self.check_interval,
-                'discord_webhook_url': self.discord_webhook_url
-            }
+                'discord_webhook_url': self.discord_webhook_url,
+                'gui_refresh_per_second': self.gui_refresh_per_second,
+                'hotkey_debounce': self.hotkey_debounce,
+                'window_settle_delay': self.window_settle_delay,
+                'shutdown_timeout': self.shutdown_timeout
+            })
+            self.config = config
             with open('data/config.json', 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
             logger.info("Yapılandırma kaydedildi")
@@ -142,7 +2640,8 @@ class BetterKickTool:
             if os.path.exists('data/profiles.json'):
                 with open('data/profiles.json', 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.profiles = data.get('profiles', [])
+                    self.profiles = self.with_discovered_profiles(data.get('profiles', []))
+                    self.bump_version('profiles')
                     logger.info(f"{len(self.profiles)} profil yüklendi")
                     self.add_log(f"{len(self.profiles)} profil yüklendi")
                     return True
@@ -157,6 +2656,20 @@ class BetterKickTool:
             self.create_sample_profiles()
             return False
             
+    def with_discovered_profiles(self, profiles):
+        """profile_discovery etkinse Local State'te olup listede olmayan profilleri sona ekle"""
+        discovery = self.config.get('profile_discovery', {})
+        if not discovery.get('enabled', False):
+            return profiles
+        known_paths = {_profile_path_key(profile.get('path', '')) for profile in profiles}
+        discovered = [
+            profile for profile in self.profile_catalog.discover(discovery.get('user_data_dir'))
+            if _profile_path_key(profile['path']) not in known_paths
+        ]
+        if discovered:
+            logger.info(f"Local State'ten {len(discovered)} ek profil bulundu")
+        return profiles + discovered
+    
     def load_links(self):
         """Yayın linklerini JSON dosyasından yükle"""
         try:
@@ -169,12 +2682,9 @@ class BetterKickTool:
                     self.links = {}
                     for i, link_data in enumerate(links_list):
                         link_id = str(i + 1)
-                        self.links[link_id] = {
-                            'name': link_data.get('name', f'Yayın {link_id}'),
-                            'url': link_data.get('url', ''),
-                            'status': 'inactive'
-                        }
+                        self.links[link_id] = self.parse_link(link_id, link_data)
                     
+                    self.bump_version('links')
                     logger.info(f"{len(self.links)} link yüklendi")
                     self.add_log(f"{len(self.links)} link yüklendi")
                     return True
@@ -189,15 +2699,32 @@ class BetterKickTool:
             self.create_sample_links()
             return False
     
+    def parse_link(self, link_id, link_data):
+        """links.json girdisini bellekteki link kaydına dönüştür"""
+        link = {
+            'name': link_data.get('name', f'Yayın {link_id}'),
+            'url': link_data.get('url', ''),
+            'status': 'inactive'
+        }
+        link.update({key: link_data[key] for key in LINK_OPTION_KEYS if key in link_data})
+        
+        strategy = link.get('ready', 'body')
+        if strategy not in READINESS_STRATEGIES or (strategy == 'selector' and not link.get('ready_selector')):
+            logger.warning(f"Geçersiz hazır olma ayarı ({link['name']}): {strategy}, 'body' kullanılacak")
+            link['ready'] = 'body'
+        return link
+    
     def save_links(self):
         """Linkleri JSON dosyasına kaydet"""
         try:
             links_list = []
             for link_id, link_data in self.links.items():
-                links_list.append({
+                entry = {
                     'name': link_data['name'],
                     'url': link_data['url']
-                })
+                }
+                entry.update({key: link_data[key] for key in LINK_OPTION_KEYS if key in link_data})
+                links_list.append(entry)
                 
             data = {'links': links_list}
             
@@ -212,9 +2739,253 @@ class BetterKickTool:
             self.add_error(f"Link kaydetme hatası: {str(e)}")
             return False
             
+    def read_data_file(self, name):
+        """Canlı yeniden yükleme için data dosyasını oku; okunamazsa None döndür"""
+        try:
+            with open(os.path.join('data', name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # Yarım kalmış bir yazma olabilir; sonraki değişiklikte tekrar denenir
+            logger.warning(f"{name} okunamadı, değişiklik uygulanmadı: {str(e)}")
+            self.add_error(f"{name} okunamadı: {str(e)}")
+            return None
+    
+    def reload_data_file(self, name):
+        """Değişen data dosyasını yeniden yükle ve sadece farkı uygula"""
+        handlers = {
+            'links.json': self.reload_links,
+            'profiles.json': self.reload_profiles,
+            'config.json': self.reload_config,
+        }
+        with self.tracer.span('reload', file=name):
+            result = handlers[name]()
+        if result['success'] and result.get('changed'):
+            self.add_log(result['message'])
+        logger.info(result['message'])
+        return result
+    
+    def reload_links(self):
+        """links.json değişikliğini uygula: eklenen, silinen ve yeniden adlandırılan linkler
+        
+        Linkler URL ile eşleştirilir; konumsal ID'ler değişirse aktif oturumlar ve
+        süren başlatmalar yeni ID'lere taşınır. Fark state_lock altında hesaplanıp
+        uygulanır; silinen oturumların tarayıcıları kilit bırakıldıktan sonra kapatılır.
+        """
+        data = self.read_data_file('links.json')
+        if data is None:
+            return {"success": False, "message": "links.json yeniden yüklenemedi"}
+        
+        with self.state_lock:
+            old_ids = {}
+            for lid, link_data in self.links.items():
+                old_ids.setdefault(link_data['url'], lid)
+            new_links = {}
+            id_map = {}  # eski ID -> yeni ID
+            added = []
+            renamed = []
+            updated = []
+            for i, link_data in enumerate(data.get('links', [])):
+                new_id = str(i + 1)
+                link = self.parse_link(new_id, link_data)
+                old_id = old_ids.get(link['url'])
+                if old_id is not None and old_id not in id_map:
+                    old = self.links[old_id]
+                    if old['name'] != link['name']:
+                        renamed.append(link['name'])
+                    if any(old.get(key) != link.get(key) for key in LINK_OPTION_KEYS):
+                        updated.append(link['name'])
+                    # Çalışma zamanı alanları (durum, son hazır olma süresi) korunur
+                    link['status'] = old['status']
+                    if 'ready_ms' in old:
+                        link['ready_ms'] = old['ready_ms']
+                    new_links[new_id] = link
+                    id_map[old_id] = new_id
+                else:
+                    new_links[new_id] = link
+                    added.append(link['name'])
+            removed = [lid for lid in self.links if lid not in id_map]
+            
+            if not (added or removed or renamed or updated) and all(old == new for old, new in id_map.items()):
+                return {"success": True, "changed": False, "message": "links.json: değişiklik yok"}
+            
+            # Silinen linklerin oturumlarını listelerden çıkar (kapatma kilit dışında)
+            closing = [d for d in self.drivers if d['link_id'] not in id_map]
+            for driver_info in closing:
+                self.drivers.remove(driver_info)
+                self.active_links.remove((driver_info['link_id'], driver_info['profile_id']))
+                self.journal.record_stop(self.links[driver_info['link_id']]['url'], driver_info['profile_name'])
+            
+            # Kalan oturumları ve süren başlatmaları yeni ID'lere taşı
+            self.apply_link_ids(new_links, id_map)
+        
+        for driver_info in closing:
+            self.release_session(driver_info['driver'], driver_info.get('handle'), driver_info['profile_id'])
+        if closing and self.drivers:
+            self.window_positions = self.calculate_window_positions(len(self.drivers))
+            for i, driver_info in enumerate(self.drivers):
+                self.position_window(driver_info['driver'], i, driver_info.get('handle'))
+        
+        return {
+            "success": True,
+            "changed": True,
+            "message": f"links.json yeniden yüklendi: {len(added)} eklendi, {len(removed)} silindi, "
+                       f"{len(renamed)} yeniden adlandırıldı, {len(updated)} hazır olma ayarı değişti"
+        }
+    
+    def reload_profiles(self):
+        """profiles.json değişikliğini uygula
+        
+        Profiller adla eşleştirilir. Silinen profillerin oturumları kapatılır, yolu
+        değişenlerinki yeni yolla yeniden açılır; diğer oturumlar ve süren başlatmalar
+        yeni profil ID'lerine taşınır. Fark state_lock altında uygulanır, tarayıcılar
+        kilit dışında kapatılıp açılır.
+        """
+        data = self.read_data_file('profiles.json')
+        if data is None:
+            return {"success": False, "message": "profiles.json yeniden yüklenemedi"}
+        
+        new_profiles = self.with_discovered_profiles(data.get('profiles', []))
+        with self.state_lock:
+            old_ids = {}
+            for i, profile in enumerate(self.profiles):
+                old_ids.setdefault(profile['name'], str(i))
+            id_map = {}  # eski ID -> yeni ID
+            changed = set()
+            added = []
+            for i, profile in enumerate(new_profiles):
+                old_id = old_ids.get(profile.get('name'))
+                if old_id is None or old_id in id_map:
+                    added.append(profile.get('name'))
+                    continue
+                id_map[old_id] = str(i)
+                if self.profiles[int(old_id)]['path'] != profile.get('path'):
+                    changed.add(old_id)
+            removed = {str(i) for i in range(len(self.profiles)) if str(i) not in id_map}
+            
+            if not (added or removed or changed) and all(old == new for old, new in id_map.items()):
+                return {"success": True, "changed": False, "message": "profiles.json: değişiklik yok"}
+            
+            # Silinen/yolu değişen profillerdeki oturumları listelerden çıkar
+            dropped = removed | changed
+            restart = []
+            closing = [d for d in self.drivers if d['profile_id'] in dropped]
+            for driver_info in closing:
+                profile_id_str = driver_info['profile_id']
+                self.drivers.remove(driver_info)
+                self.active_links.remove((driver_info['link_id'], profile_id_str))
+                if profile_id_str in changed:
+                    restart.append((self.links[driver_info['link_id']]['url'], id_map[profile_id_str]))
+                else:
+                    self.journal.record_stop(self.links[driver_info['link_id']]['url'], driver_info['profile_name'])
+            # Sekme modunda bu profillerin tarayıcıları tüm pencereleriyle kapanır
+            closing_browsers = [self.profile_browsers.pop(pid) for pid in dropped if pid in self.profile_browsers]
+            
+            # Kalan oturumları, tarayıcıları ve süren başlatmaları yeni profil ID'lerine taşı
+            for driver_info in self.drivers:
+                driver_info['profile_id'] = id_map[driver_info['profile_id']]
+            self.active_links[:] = [(lid, id_map[pid]) for lid, pid in self.active_links]
+            self.profile_browsers = {id_map[pid]: driver for pid, driver in self.profile_browsers.items()}
+            self.remap_inflight(profile_map={pid: new for pid, new in id_map.items() if pid not in changed})
+            if self.warm_pool:
+                self.warm_pool.remap(id_map, dropped=changed)
+            self.profiles = new_profiles
+            for link_id in self.links:
+                if not any(al[0] == link_id for al in self.active_links) and self.links[link_id]['status'] == 'active':
+                    self.links[link_id]['status'] = 'inactive'
+            self.bump_version('profiles', 'sessions', 'links')
+        
+        for browser in closing_browsers:
+            self.browser_locks.pop(id(browser), None)
+        self.quit_drivers([d['driver'] for d in closing if d.get('handle') is None] + closing_browsers)
+        
+        # Yolu değişen profillerin oturumlarını yeni yolla aç (start_link pencereleri yerleştirir)
+        for url, profile_id_str in restart:
+            self.start_link(url, profile_id_str)
+        if closing and not restart and self.drivers:
+            self.window_positions = self.calculate_window_positions(len(self.drivers))
+            for i, driver_info in enumerate(self.drivers):
+                self.position_window(driver_info['driver'], i, driver_info.get('handle'))
+        
+        return {
+            "success": True,
+            "changed": True,
+            "message": f"profiles.json yeniden yüklendi: {len(added)} eklendi, {len(removed)} silindi, "
+                       f"{len(changed)} yolu değişti ({len(restart)} oturum yeniden açıldı)"
+        }
+    
+    def reload_config(self):
+        """config.json değişikliğini uygula"""
+        config = self.read_data_file('config.json')
+        if config is None:
+            return {"success": False, "message": "config.json yeniden yüklenemedi"}
+        
+        old_config = self.config
+        changed = sorted(key for key in set(old_config) | set(config) if old_config.get(key) != config.get(key))
+        if not changed:
+            return {"success": True, "changed": False, "message": "config.json: değişiklik yok"}
+        
+        self.apply_config(config)
+        self.journal.compact_every = config.get('journal_compact_every', 100)
+        self.apply_component_config(changed)
+        if 'check_interval' in changed or 'devtools' in changed:
+            # Bekleyen durum kontrolü yeni aralıkla yeniden zamanlansın
+            self.status_wakeup.set()
+        restart_required = [key for key in changed if key in RESTART_REQUIRED_CONFIG_KEYS]
+        if restart_required:
+            logger.warning(f"Bu ayarlar yeniden başlatınca uygulanacak: {', '.join(restart_required)}")
+            self.add_error(f"Yeniden başlatma gerekli: {', '.join(restart_required)}")
+        
+        return {
+            "success": True,
+            "changed": True,
+            "message": f"config.json yeniden yüklendi: {', '.join(changed)}"
+        }
+    
+    def apply_component_config(self, changed):
+        """Başlangıçta kurulan bileşenlere değişen yapılandırma bölümlerini canlı uygula"""
+        if 'launch_admission' in changed:
+            section = self.config.get('launch_admission', {})
+            self.launch_scheduler.reconfigure(
+                concurrency=section.get('concurrency', 2),
+                queue_size=section.get('queue_size', 8),
+                queue_timeout=section.get('queue_timeout', 60)
+            )
+        if 'restart_backoff' in changed:
+            section = self.config.get('restart_backoff', {})
+            self.restart_queue.reconfigure(
+                base=section.get('base', 5),
+                max_delay=section.get('max_delay', 300),
+                jitter=section.get('jitter', 0.2),
+                max_failures=section.get('max_failures', 5),
+                park_seconds=section.get('park_seconds', 1800),
+                stable_seconds=section.get('stable_seconds', 120)
+            )
+        if 'webhook_notifier' in changed:
+            section = self.config.get('webhook_notifier', {})
+            with self.notifier.lock:
+                self.notifier.batch_interval = section.get('batch_interval', 2.0)
+                self.notifier.max_queue = section.get('max_queue', 500)
+                self.notifier.timeout = section.get('timeout', 10)
+        if 'devtools' in changed:
+            # Açık oturumların aboneliklerine dokunulmaz; yeni değerler sonraki olaylarda geçerli
+            section = self.config.get('devtools', {})
+            self.devtools_enabled = section.get('enabled', True)
+            self.devtools_check_interval = section.get('check_interval', 1800)
+            self.devtools_refresh_cooldown = section.get('refresh_cooldown', 30)
+            self.devtools.timeout = section.get('timeout', 5)
+    
     def create_sample_profiles(self):
-        """Örnek profil dosyası oluştur"""
-        import os
+        """Örnek profil dosyası oluştur (Edge'in Local State'i okunabiliyorsa gerçek profillerle)"""
+        discovered = self.profile_catalog.discover(self.config.get('profile_discovery', {}).get('user_data_dir'))
+        if discovered:
+            with open('data/profiles.json', 'w', encoding='utf-8') as f:
+                json.dump({"profiles": discovered}, f, indent=2, ensure_ascii=False)
+            logger.info(f"profiles.json Edge Local State'ten oluşturuldu: {len(discovered)} profil")
+            self.add_log(f"Edge'den {len(discovered)} profil bulundu")
+            return
+        
         username = os.getenv('USERNAME', 'YourUsername')
         base_path = f"C:\\Users\\{username}\\AppData\\Local\\Microsoft\\Edge\\User Data"
         
@@ -354,50 +3125,49 @@ class BetterKickTool:
         
         return positions
         
+    def create_driver_factory(self):
+        """Yapılandırmaya göre driver fabrikasını seç"""
+        backend = self.config.get('driver_backend', 'edge')
+        page_load_strategy = self.config.get('page_load_strategy', 'normal')
+        if backend == 'edge_server':
+            logger.info("Paylaşılan msedgedriver sunucusu modu kullanılıyor")
+            return SharedEdgeDriverFactory(page_load_strategy)
+        if backend == 'fake':
+            fake_config = self.config.get('fake_driver', {})
+            logger.info("Sahte driver backend'i kullanılıyor")
+            return FakeDriverFactory(
+                latencies=fake_config.get('latencies'),
+                failure_rates=fake_config.get('failure_rates'),
+                seed=fake_config.get('seed')
+            )
+        return EdgeDriverFactory(page_load_strategy)
+        
+    @traced('create_edge_driver')
     def create_edge_driver(self, profile_path, profile_name):
         """Belirtilen profil ile Edge driver oluştur"""
         try:
-            edge_options = Options()
-            
-            # Edge profil yapısını doğru şekilde ayarla
-            user_data_dir = os.path.dirname(profile_path)
-            profile_directory = os.path.basename(profile_path)
-            
-            # Profil dizininin var olduğunu kontrol et
-            if not os.path.exists(profile_path):
+            # Profil dizininin var olduğunu kontrol et (doğrulanmış profillerde önbellekten)
+            if self.profile_catalog.status(profile_path) == ProfileCatalog.MISSING:
                 logger.error(f"Profil dizini bulunamadı: {profile_path}")
                 self.add_error(f"Profil bulunamadı: {profile_name}")
                 return None
             
-            edge_options.add_argument(f"--user-data-dir={user_data_dir}")
-            edge_options.add_argument(f"--profile-directory={profile_directory}")
-            edge_options.add_argument("--no-first-run")
-            edge_options.add_argument("--no-default-browser-check")
-            edge_options.add_argument("--disable-extensions")
-            edge_options.add_argument("--disable-plugins")
-            edge_options.add_argument("--mute-audio")
-            edge_options.add_argument("--disable-web-security")
-            edge_options.add_argument("--disable-features=VizDisplayCompositor")
-            edge_options.add_argument("--disable-blink-features=AutomationControlled")
-            edge_options.add_argument("--disable-dev-shm-usage")
-            edge_options.add_argument("--no-sandbox")
-            edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            edge_options.add_experimental_option('useAutomationExtension', False)
-            
             # Edge Driver servisini başlat
             try:
-                service = Service()
-                driver = webdriver.Edge(service=service, options=edge_options)
+                with self.tracer.span('spawn driver'):
+                    driver = self.driver_factory.create(profile_path)
             except Exception as e:
                 logger.error(f"EdgeDriver bulunamadı: {str(e)}")
                 self.add_error("EdgeDriver bulunamadı - PATH'e ekleyin")
                 return None
+            self.process_registry.register(driver)
             
-            # Pencere boyutunu başlangıçta ayarla
-            driver.set_window_rect(0, 0, 800, 600)
-            
-            # User agent ayarla
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            with self.tracer.span('initial setup'):
+                # Pencere boyutunu başlangıçta ayarla
+                driver.set_window_rect(0, 0, 800, 600)
+                
+                # User agent ayarla
+                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             logger.info(f"Edge driver başlatıldı: {profile_name}")
             self.add_log(f"Driver başlatıldı: {profile_name}")
@@ -409,44 +3179,77 @@ class BetterKickTool:
             self.add_error(f"Driver hatası ({profile_name}): {str(e)}")
             return None
             
+    @traced('open_link_in_driver')
     def open_link_in_driver(self, driver, link_id, link_data, profile_name):
-        """Belirtilen driver'da linki aç"""
+        """Belirtilen driver'da linki aç; hazır olma süresini (ms), başarısızsa None döndür"""
         try:
+            from selenium.webdriver.support.ui import WebDriverWait
+            
             url = link_data['url']
             name = link_data['name']
             
             if not url or not url.startswith(('http://', 'https://')):
                 logger.warning(f"Geçersiz URL: {url}")
                 self.add_error(f"Geçersiz URL: {url}")
-                return False
+                return None
+            
+            strategy = link_data.get('ready', 'body')
+            timeout = link_data.get('ready_timeout', self.readiness_timeouts.get(strategy, 10))
+            started = time.perf_counter()
             
             # Sayfayı yükle
-            driver.get(url)
+            with self.tracer.span('driver.get', url=url):
+                driver.get(url)
             
-            # Sayfanın yüklendiğini kontrol et
+            # Sayfanın linkin hazır olma stratejisine göre yüklendiğini kontrol et
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+                with self.tracer.span('readiness wait', strategy=strategy):
+                    condition = self.readiness_condition(link_data)
+                    if condition is not None:
+                        WebDriverWait(driver, timeout).until(condition)
             except Exception as e:
-                logger.warning(f"Sayfa yüklenemedi: {url}")
+                logger.warning(f"Sayfa {timeout}s içinde hazır olmadı ({strategy}): {url}")
                 self.add_error(f"Sayfa yüklenemedi: {name}")
-                return False
+                return None
+            ready_ms = round((time.perf_counter() - started) * 1000, 1)
                 
-            logger.info(f"{profile_name}: {name} (ID: {link_id}) açıldı")
-            self.add_log(f"{profile_name}: {name} açıldı")
+            logger.info(f"{profile_name}: {name} (ID: {link_id}) açıldı, {ready_ms} ms'de hazır ({strategy})")
+            self.add_log(f"{profile_name}: {name} açıldı ({ready_ms:.0f} ms)")
             
             # Linki aktif olarak işaretle
             self.links[link_id]['status'] = 'active'
+            self.links[link_id]['ready_ms'] = ready_ms
+            self.bump_version('links')
             
-            return True
+            return ready_ms
                 
         except Exception as e:
             logger.error(f"Link açılırken hata ({profile_name}): {str(e)}")
             self.add_error(f"Link açma hatası ({profile_name}): {str(e)}")
-            return False
+            return None
+    
+    def readiness_condition(self, link_data):
+        """Linkin hazır olma stratejisi için WebDriverWait koşulunu döndür
+        
+        body: <body> etiketi var (varsayılan), ready_state: document.readyState hedefe
+        ulaştı (interactive veya complete), selector: CSS seçicisi sayfada var,
+        none: beklenmez (None döner).
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        strategy = link_data.get('ready', 'body')
+        if strategy == 'none':
+            return None
+        if strategy == 'ready_state':
+            accepted = ('complete',) if link_data.get('ready_state') == 'complete' else ('interactive', 'complete')
+            return lambda driver: driver.execute_script("return document.readyState") in accepted
+        if strategy == 'selector':
+            return EC.presence_of_element_located((By.CSS_SELECTOR, link_data['ready_selector']))
+        return EC.presence_of_element_located((By.TAG_NAME, "body"))
             
-    def position_window(self, driver, position_index):
+    @traced('position_window')
+    def position_window(self, driver, position_index, handle=None):
         """Edge penceresini belirtilen konuma yerleştir"""
         try:
             if position_index >= len(self.window_positions):
@@ -456,10 +3259,12 @@ class BetterKickTool:
             pos = self.window_positions[position_index]
             
             # Selenium ile pencereyi konumlandır
-            driver.set_window_rect(pos["x"], pos["y"], pos["width"], pos["height"])
+            with self.focus_window(driver, handle):
+                driver.set_window_rect(pos["x"], pos["y"], pos["width"], pos["height"])
             
             # Kısa bir bekleme
-            time.sleep(0.5)
+            if self.window_settle_delay:
+                time.sleep(self.window_settle_delay)
             
             logger.info(f"Pencere konumlandırıldı: {pos['x']},{pos['y']} ({pos['width']}x{pos['height']})")
             self.add_log(f"Pencere konumlandırıldı: {position_index + 1}")
@@ -470,8 +3275,79 @@ class BetterKickTool:
             self.add_error(f"Pencere konumlandırma hatası: {str(e)}")
             return False
     
-    def start_link(self, link_id_or_url, profile_id=None, all_profiles=False):
-        """Belirtilen linki başlat"""
+    @contextmanager
+    def focus_window(self, driver, handle=None):
+        """Sekme modunda paylaşılan tarayıcıyı kilitleyip oturumun penceresine geç"""
+        if handle is None:
+            yield driver
+            return
+        lock = self.browser_locks.setdefault(id(driver), threading.RLock())
+        with lock:
+            driver.switch_to.window(handle)
+            yield driver
+    
+    def open_session_window(self, profile, profile_id_str):
+        """Sekme modunda profilin tarayıcısında yeni bir pencere aç, (driver, handle) döndür
+        
+        Bul-veya-oluştur profil başına kilitlenir: aynı profil için eşzamanlı başlatmalar
+        ikinci bir tarayıcı açmaz, ilk tarayıcı hazır olunca onda pencere açar.
+        """
+        with self.state_lock:
+            open_lock = self.profile_open_locks.setdefault(profile['path'], threading.Lock())
+        with open_lock:
+            driver = self.profile_browsers.get(profile_id_str)
+            if driver is not None:
+                lock = self.browser_locks.setdefault(id(driver), threading.RLock())
+                try:
+                    with lock:
+                        driver.switch_to.new_window('window')
+                        return driver, driver.current_window_handle
+                except Exception as e:
+                    logger.warning(f"Profil tarayıcısı yanıt vermiyor, yeniden başlatılıyor ({profile['name']}): {str(e)}")
+                    self.forget_browser(profile_id_str, driver)
+            
+            driver = self.create_edge_driver(profile['path'], profile['name'])
+            if driver is None:
+                return None, None
+            with self.state_lock:
+                self.profile_browsers[profile_id_str] = driver
+                self.browser_locks[id(driver)] = threading.RLock()
+            # İlk link tarayıcının açılıştaki boş penceresini kullanır
+            return driver, driver.current_window_handle
+    
+    def forget_browser(self, profile_id_str, driver):
+        """Sekme modundaki profil tarayıcısını kapat ve kayıtlardan çıkar"""
+        if self.profile_browsers.get(profile_id_str) is driver:
+            del self.profile_browsers[profile_id_str]
+        self.browser_locks.pop(id(driver), None)
+        self.quit_driver(driver)
+    
+    def release_session(self, driver, handle=None, profile_id_str=None):
+        """Oturumun tarayıcı kaynağını bırak: pencere modunda driver'ı, sekme modunda pencereyi kapat"""
+        # Kendi kapattığımız pencere için 'kapandı' olayı gelmesin
+        self.devtools.unwatch(driver, handle)
+        if handle is None:
+            self.quit_driver(driver)
+            return
+        
+        try:
+            with self.focus_window(driver, handle):
+                remaining = [h for h in driver.window_handles if h != handle]
+                if remaining:
+                    driver.close()
+                    driver.switch_to.window(remaining[0])
+                    return
+        except Exception as e:
+            logger.warning(f"Pencere kapatılamadı: {str(e)}")
+            if profile_id_str is not None and any(
+                    d['driver'] is driver and d.get('handle') != handle for d in self.drivers):
+                return  # Tarayıcıyı hala kullanan başka oturumlar var
+        # Profilin son penceresi: tarayıcıyı tamamen kapat
+        self.forget_browser(profile_id_str, driver)
+    
+    @traced('start_link')
+    def start_link(self, link_id_or_url, profile_id=None, all_profiles=False, restart=False):
+        """Belirtilen linki başlat (restart: yeniden başlatma kuyruğundan gelen deneme)"""
         # Profilleri yükle
         if not self.profiles:
             self.load_profiles()
@@ -484,141 +3360,173 @@ class BetterKickTool:
                 "message": "Hiç profil bulunamadı"
             }
         
-        # Link ID veya URL'den link bilgisini bul
-        link_id = None
-        link_data = None
-        
-        # Doğrudan link ID ise
-        if link_id_or_url in self.links:
-            link_id = link_id_or_url
-            link_data = self.links[link_id]
-        else:
-            # URL ise eşleşen linki bul
-            for lid, data in self.links.items():
-                if data['url'] == link_id_or_url:
-                    link_id = lid
-                    link_data = data
-                    break
+        # Seçim ve in-flight kaydı tek kilit altında: eşzamanlı iki istek aynı
+        # (link, profil) için iki tarayıcı başlatamaz
+        with self.state_lock:
+            # Link ID veya URL'den link bilgisini bul
+            link_id = None
+            link_data = None
+            
+            # Doğrudan link ID ise
+            if link_id_or_url in self.links:
+                link_id = link_id_or_url
+                link_data = self.links[link_id]
+            else:
+                # URL ise eşleşen linki bul
+                for lid, data in self.links.items():
+                    if data['url'] == link_id_or_url:
+                        link_id = lid
+                        link_data = data
+                        break
                     
-            # Eşleşme bulunamadıysa ve URL formatındaysa yeni link olarak ekle
-            if not link_id and link_id_or_url.startswith(('http://', 'https://')):
-                new_id = str(len(self.links) + 1)
-                self.links[new_id] = {
-                    'name': f'Yayın {new_id}',
-                    'url': link_id_or_url,
-                    'status': 'inactive'
+                # Eşleşme bulunamadıysa ve URL formatındaysa yeni link olarak ekle
+                if not link_id and link_id_or_url.startswith(('http://', 'https://')):
+                    new_id = str(len(self.links) + 1)
+                    self.links[new_id] = {
+                        'name': f'Yayın {new_id}',
+                        'url': link_id_or_url,
+                        'status': 'inactive'
+                    }
+                    self.bump_version('links')
+                    self.save_links()
+                    link_id = new_id
+                    link_data = self.links[new_id]
+                    logger.info(f"Yeni link eklendi: {link_id_or_url} (ID: {new_id})")
+                    self.add_log(f"Yeni link eklendi: ID {new_id}")
+            
+            if not link_id or not link_data:
+                logger.error(f"Link bulunamadı: {link_id_or_url}")
+                self.add_error(f"Link bulunamadı: {link_id_or_url}")
+                return {
+                    "success": False,
+                    "message": f"Link bulunamadı: {link_id_or_url}"
                 }
-                self.save_links()
-                link_id = new_id
-                link_data = self.links[new_id]
-                logger.info(f"Yeni link eklendi: {link_id_or_url} (ID: {new_id})")
-                self.add_log(f"Yeni link eklendi: ID {new_id}")
-        
-        if not link_id or not link_data:
-            logger.error(f"Link bulunamadı: {link_id_or_url}")
-            self.add_error(f"Link bulunamadı: {link_id_or_url}")
-            return {
-                "success": False,
-                "message": f"Link bulunamadı: {link_id_or_url}"
-            }
-        
-        # Profil seçimi
-        profiles_to_use = []
-        
-        if all_profiles:
-            # Tüm profillerde aç
-            for i, profile in enumerate(self.profiles):
-                profile_id_str = str(i)
-                # Bu profilde bu link zaten açık mı kontrol et
-                if not any(al[0] == link_id and al[1] == profile_id_str for al in self.active_links):
-                    profiles_to_use.append((profile, profile_id_str))
-        elif profile_id is not None:
-            # Belirli profilde aç
-            try:
-                profile_index = int(profile_id)
-                if 0 <= profile_index < len(self.profiles):
-                    profile_id_str = str(profile_index)
+            
+            # Profil seçimi
+            profiles_to_use = []
+            
+            if all_profiles:
+                # Tüm profillerde aç
+                for i, profile in enumerate(self.profiles):
+                    profile_id_str = str(i)
                     # Bu profilde bu link zaten açık mı kontrol et
                     if not any(al[0] == link_id and al[1] == profile_id_str for al in self.active_links):
-                        profiles_to_use.append((self.profiles[profile_index], profile_id_str))
+                        profiles_to_use.append((profile, profile_id_str))
+            elif profile_id is not None:
+                # Belirli profilde aç
+                try:
+                    profile_index = int(profile_id)
+                    if 0 <= profile_index < len(self.profiles):
+                        profile_id_str = str(profile_index)
+                        # Bu profilde bu link zaten açık mı kontrol et
+                        if not any(al[0] == link_id and al[1] == profile_id_str for al in self.active_links):
+                            profiles_to_use.append((self.profiles[profile_index], profile_id_str))
+                        else:
+                            error_msg = f"Link bu profilde zaten aktif: {self.profiles[profile_index]['name']}"
+                            self.add_error(error_msg)
+                            return {
+                                "success": False,
+                                "message": error_msg
+                            }
                     else:
-                        error_msg = f"Link bu profilde zaten aktif: {self.profiles[profile_index]['name']}"
+                        error_msg = f"Geçersiz profil ID: {profile_id}"
                         self.add_error(error_msg)
                         return {
                             "success": False,
                             "message": error_msg
                         }
-                else:
-                    error_msg = f"Geçersiz profil ID: {profile_id}"
+                except ValueError:
+                    error_msg = f"Geçersiz profil ID formatı: {profile_id}"
                     self.add_error(error_msg)
                     return {
                         "success": False,
                         "message": error_msg
                     }
-            except ValueError:
-                error_msg = f"Geçersiz profil ID formatı: {profile_id}"
+            else:
+                # Varsayılan davranış: tüm profillerde aç
+                for i, profile in enumerate(self.profiles):
+                    profile_id_str = str(i)
+                    # Bu profilde bu link zaten açık mı kontrol et
+                    if not any(al[0] == link_id and al[1] == profile_id_str for al in self.active_links):
+                        profiles_to_use.append((profile, profile_id_str))
+            
+            if not profiles_to_use:
+                error_msg = "Kullanılabilir profil bulunamadı veya link tüm profillerde zaten aktif"
                 self.add_error(error_msg)
                 return {
                     "success": False,
                     "message": error_msg
                 }
-        else:
-            # Varsayılan davranış: tüm profillerde aç
-            for i, profile in enumerate(self.profiles):
-                profile_id_str = str(i)
-                # Bu profilde bu link zaten açık mı kontrol et
-                if not any(al[0] == link_id and al[1] == profile_id_str for al in self.active_links):
-                    profiles_to_use.append((profile, profile_id_str))
-        
-        if not profiles_to_use:
-            error_msg = "Kullanılabilir profil bulunamadı veya link tüm profillerde zaten aktif"
-            self.add_error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg
-            }
+            
+            # Aynı çift için süren başlatma varsa ona bağlan, yoksa çifti sahiplen
+            claimed = []
+            attached = []
+            for profile, profile_id_str in profiles_to_use:
+                pending = self.inflight.get((link_id, profile_id_str))
+                if pending is not None:
+                    attached.append((profile, pending))
+                else:
+                    claimed.append((profile, self.claim_inflight(link_id, profile_id_str)))
         
         success_count = 0
         failed_profiles = []
         
-        for profile, profile_id_str in profiles_to_use:
-            # Edge driver oluştur
-            driver = self.create_edge_driver(profile['path'], profile['name'])
-            if not driver:
+        for profile, pending in claimed:
+            # Canlı yeniden yükleme ID'leri değiştirmiş olabilir: güncel çifti kayıttan al
+            launch_key = pending['key']
+            if launch_key is None:
+                self.finish_inflight(pending, False)
                 failed_profiles.append(profile['name'])
                 continue
-                
-            # Linki aç
-            if self.open_link_in_driver(driver, link_id, link_data, profile['name']):
+            try:
+                launched = self.launch_session(profile, launch_key[1], launch_key[0], link_data)
+            except Exception:
+                self.finish_inflight(pending, False)
+                raise
+            if not launched:
+                self.finish_inflight(pending, False)
+                failed_profiles.append(profile['name'])
+                continue
+            driver, handle, ready_ms = launched
+            
+            with self.tracer.span('layout', windows=len(self.drivers) + 1):
                 # Pencere konumlarını hesapla
                 active_count = len(self.drivers) + 1
                 self.window_positions = self.calculate_window_positions(active_count)
                 
                 # Mevcut pencereleri yeniden konumlandır
                 for i, driver_info in enumerate(self.drivers):
-                    self.position_window(driver_info['driver'], i)
+                    self.position_window(driver_info['driver'], i, driver_info.get('handle'))
                     
                 # Yeni pencereyi konumlandır
-                self.position_window(driver, len(self.drivers))
-                
-                # Driver'ı kaydet
-                self.drivers.append({
-                    'driver': driver,
-                    'profile_name': profile['name'],
-                    'profile_id': profile_id_str,
-                    'link_id': link_id
-                })
-                
-                # Active links'e ekle
-                self.active_links.append((link_id, profile_id_str))
-                success_count += 1
-            else:
-                # Başarısız olursa driver'ı kapat
-                try:
-                    driver.quit()
-                except:
-                    pass
+                self.position_window(driver, len(self.drivers), handle)
+            
+            with self.state_lock:
+                key = pending['key']
+                if key is not None:
+                    self.register_session(driver, handle, profile, key[1], key[0], ready_ms)
+                self.finish_inflight(pending, key is not None)
+            if key is None:
+                # Link veya profil başlatma sürerken silindi
+                self.release_session(driver, handle, launch_key[1])
                 failed_profiles.append(profile['name'])
+                continue
+            link_id = key[0]  # Sonuç mesajı güncel ID'yi göstersin
+            if not restart:
+                # Elle başlatma devre kesiciyi ve bekleyen denemeyi sıfırlar
+                self.restart_queue.cancel(*key)
+            success_count += 1
+        
+        # Başka bir istekte süren başlatmaların sonucunu bekle; beklerken başlatma
+        # hakkı bırakılır, ilgisiz başlatmalar kuyrukta bu isteğin arkasında kalmaz
+        if attached:
+            with self.launch_scheduler.suspended():
+                for profile, pending in attached:
+                    logger.info(f"Süren başlatmaya bağlanıldı: {link_data['name']} ({profile['name']})")
+                    if pending['event'].wait(self.inflight_wait_timeout) and pending['success']:
+                        success_count += 1
+                    else:
+                        failed_profiles.append(profile['name'])
         
         # Status thread'i başlat
         if self.drivers and (not self.status_thread or not self.status_thread.is_alive()):
@@ -642,6 +3550,242 @@ class BetterKickTool:
                 "message": error_msg
             }
     
+    def claim_inflight(self, link_id, profile_id_str):
+        """(link, profil) çifti için süren başlatma kaydı aç (state_lock altında çağrılır)
+        
+        Kayıttaki 'key' canlı yeniden yüklemede güncel ID'lere taşınır; link veya
+        profil silinirse None olur ve başlatan taraf açtığı oturumu kapatır.
+        """
+        pending = {'event': threading.Event(), 'success': False, 'key': (link_id, profile_id_str)}
+        self.inflight[(link_id, profile_id_str)] = pending
+        return pending
+    
+    def finish_inflight(self, pending, success):
+        """Süren başlatma kaydını kaldır ve ona bağlanan istekleri uyandır"""
+        with self.state_lock:
+            key = pending['key']
+            if key is not None and self.inflight.get(key) is pending:
+                del self.inflight[key]
+        pending['success'] = success
+        pending['event'].set()
+    
+    def remap_inflight(self, link_map=None, profile_map=None):
+        """Süren başlatmaları yeni konumsal ID'lere taşı (state_lock altında çağrılır)
+        
+        Eşlemede olmayan (silinen) link veya profillerin kayıtları bırakılır.
+        """
+        inflight = {}
+        for (link_id, profile_id_str), pending in self.inflight.items():
+            if link_map is not None:
+                link_id = link_map.get(link_id)
+            if profile_map is not None:
+                profile_id_str = profile_map.get(profile_id_str)
+            if link_id is None or profile_id_str is None:
+                pending['key'] = None
+                continue
+            pending['key'] = (link_id, profile_id_str)
+            inflight[pending['key']] = pending
+        self.inflight = inflight
+    
+    def apply_link_ids(self, new_links, id_map):
+        """Link sözlüğünü değiştir; oturumları ve süren başlatmaları yeni ID'lere taşı
+        
+        state_lock altında çağrılır. id_map'te olmayan linklerin oturumları önceden kapatılmış olmalıdır.
+        """
+        self.links = new_links
+        for driver_info in self.drivers:
+            driver_info['link_id'] = id_map[driver_info['link_id']]
+        self.active_links[:] = [(id_map[lid], pid) for lid, pid in self.active_links]
+        self.remap_inflight(link_map=id_map)
+        self.bump_version('links', 'sessions')
+    
+    def launch_session(self, profile, profile_id_str, link_id, link_data):
+        """Oturumun tarayıcısını hazırlayıp linki aç; başarılıysa (driver, handle, ready_ms), değilse None döndür"""
+        handle = None
+        if self.browser_mode == 'tab':
+            # Profilin tek tarayıcısında yeni pencere aç
+            driver, handle = self.open_session_window(profile, profile_id_str)
+        else:
+            # Sıcak havuzdan driver al, yoksa yeni Edge driver oluştur
+            driver = self.warm_pool.acquire(profile_id_str) if self.warm_pool else None
+            if driver is None:
+                driver = self.create_edge_driver(profile['path'], profile['name'])
+        if not driver:
+            return None
+            
+        # Linki aç
+        with self.focus_window(driver, handle):
+            ready_ms = self.open_link_in_driver(driver, link_id, link_data, profile['name'])
+        if ready_ms is None:
+            # Başarısız olursa driver'ı (sekme modunda pencereyi) kapat
+            self.release_session(driver, handle, profile_id_str)
+            return None
+        self.watch_session(driver, handle)
+        return driver, handle, ready_ms
+    
+    def watch_session(self, driver, handle):
+        """Oturum penceresini DevTools olaylarına abone et (pencere modunda tek pencere)"""
+        if not self.devtools_enabled or self.devtools.debugger_address(driver) is None:
+            return False
+        try:
+            target_id = handle or driver.current_window_handle
+        except Exception:
+            return False
+        return self.devtools.watch(driver, target_id)
+    
+    def register_session(self, driver, handle, profile, profile_id_str, link_id, ready_ms=None):
+        """Açılan oturumu aktif listelere ve oturum günlüğüne ekle"""
+        self.drivers.append({
+            'driver': driver,
+            'handle': handle,
+            'profile_name': profile['name'],
+            'profile_id': profile_id_str,
+            'link_id': link_id,
+            'ready_ms': ready_ms
+        })
+        self.active_links.append((link_id, profile_id_str))
+        self.links[link_id]['status'] = 'active'
+        self.bump_version('sessions', 'links')
+        self.journal.record_start(link_id, self.links[link_id]['url'], profile_id_str, profile['name'])
+        self.record_history(link_id, profile_id_str, True, ready_ms, driver)
+        # DevTools ile izlenmeyen oturum eklendiyse yoklama aralığı yeniden hesaplansın
+        self.status_wakeup.set()
+    
+    def history_key(self, link_id, profile_id):
+        """Geçmiş deposu anahtarı (url|profil adı); link veya profil yoksa None"""
+        try:
+            profile_index = int(profile_id)
+            if profile_index < 0:
+                return None
+            return f"{self.links[link_id]['url']}|{self.profiles[profile_index]['name']}"
+        except (KeyError, IndexError, ValueError, TypeError):
+            return None
+    
+    def record_history(self, link_id, profile_id, ok, ready_ms=None, driver=None):
+        """Oturum için sağlık örneği kaydet (geçmiş hataları oturum akışını bozmaz)"""
+        if not self.history_enabled:
+            return
+        key = self.history_key(link_id, profile_id)
+        if key is None:
+            return
+        try:
+            rss_mb = self.process_registry.rss_mb(driver) if driver is not None else None
+            self.history.record(key, ok, ready_ms=ready_ms, rss_mb=rss_mb)
+        except Exception as e:
+            logger.warning(f"Sağlık geçmişi yazılamadı: {str(e)}")
+    
+    def sample_sessions(self):
+        """Periyodik geçmiş örneği: açık oturumlar ayakta, yeniden başlatma bekleyenler kapalı sayılır"""
+        samples = []
+        rss_by_driver = {}  # Sekme modunda aynı tarayıcı birden çok oturumda ortak
+        for driver_info in list(self.drivers):
+            key = self.history_key(driver_info['link_id'], driver_info['profile_id'])
+            if key is None:
+                continue
+            driver = driver_info['driver']
+            if id(driver) not in rss_by_driver:
+                rss_by_driver[id(driver)] = self.process_registry.rss_mb(driver)
+            samples.append((key, True, rss_by_driver[id(driver)]))
+        for url, profile_name in self.restart_queue.down_keys():
+            samples.append((f"{url}|{profile_name}", False, None))
+        return samples
+    
+    def resume_sessions(self):
+        """Oturum günlüğündeki oturumları paralel başlatıp pencereleri tek seferde yerleştir"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        records = self.journal.load()
+        if not records:
+            return {
+                "success": True,
+                "message": "Geri yüklenecek oturum yok"
+            }
+        
+        # Günlük url ve profil adıyla tutulur; güncel ID'lere eşle
+        link_ids = {data['url']: lid for lid, data in self.links.items()}
+        profile_ids = {profile['name']: str(i) for i, profile in enumerate(self.profiles)}
+        tasks = []
+        skipped = 0
+        with self.state_lock:
+            for record in records:
+                link_id = link_ids.get(record['url'])
+                profile_id_str = profile_ids.get(record['profile_name'])
+                if link_id is None or profile_id_str is None:
+                    logger.warning(f"Günlükteki oturum atlandı, link veya profil artık yok: {record['url']} ({record['profile_name']})")
+                    skipped += 1
+                    continue
+                if (link_id, profile_id_str) in self.active_links or (link_id, profile_id_str) in self.inflight:
+                    continue
+                tasks.append((self.claim_inflight(link_id, profile_id_str),
+                              self.links[link_id], self.profiles[int(profile_id_str)]))
+        
+        # Sekme modunda aynı profilin pencereleri tek tarayıcıyı paylaşır: profil başına sıralı,
+        # profiller arası paralel. Pencere modunda her oturum bağımsızdır.
+        groups = {}
+        for task in tasks:
+            link_id, profile_id_str = task[0]['key']
+            group_key = profile_id_str if self.browser_mode == 'tab' else (link_id, profile_id_str)
+            groups.setdefault(group_key, []).append(task)
+        
+        def launch_group(group):
+            results = []
+            for pending, link_data, profile in group:
+                key = pending['key']
+                if key is None:
+                    results.append((pending, None))
+                    continue
+                try:
+                    launched = self.launch_session(profile, key[1], key[0], link_data)
+                except Exception as e:
+                    logger.error(f"Oturum geri yüklenemedi ({profile['name']}): {str(e)}")
+                    launched = None
+                results.append((pending, launched and (launched, key[1])))
+            return results
+        
+        workers = max(1, self.config.get('resume_concurrency', 4))
+        with self.tracer.span('resume', sessions=len(tasks)):
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume") as pool:
+                launched_groups = list(pool.map(launch_group, groups.values()))
+        
+        # Başarılı oturumları günlük sırasıyla kaydet
+        launched = {id(pending): result for group in launched_groups for pending, result in group}
+        started = 0
+        for pending, _, profile in tasks:
+            result = launched.get(id(pending))
+            if result is None:
+                self.finish_inflight(pending, False)
+                continue
+            (driver, handle, ready_ms), launch_profile_id = result
+            with self.state_lock:
+                key = pending['key']
+                if key is not None:
+                    self.register_session(driver, handle, profile, key[1], key[0], ready_ms)
+                self.finish_inflight(pending, key is not None)
+            if key is None:
+                # Link veya profil geri yükleme sürerken silindi
+                self.release_session(driver, handle, launch_profile_id)
+                continue
+            started += 1
+        failed = len(tasks) - started
+        
+        # Yeniden başlatılamayan oturumlar günlükten çıkarılmaz: bir sonraki --resume tekrar dener
+        if self.drivers:
+            with self.tracer.span('layout', windows=len(self.drivers)):
+                self.window_positions = self.calculate_window_positions(len(self.drivers))
+                for i, driver_info in enumerate(self.drivers):
+                    self.position_window(driver_info['driver'], i, driver_info.get('handle'))
+            if not self.status_thread or not self.status_thread.is_alive():
+                self.start_status_thread()
+        
+        message = f"{started} oturum geri yüklendi"
+        if failed or skipped:
+            message += f" (başarısız: {failed}, atlanan: {skipped})"
+        self.add_log(message)
+        return {
+            "success": started > 0 or not tasks,
+            "message": message
+        }
+    
     def stop_all(self):
         """Tüm aktif linkleri durdur"""
         if not self.drivers:
@@ -654,6 +3798,8 @@ class BetterKickTool:
             
         count = len(self.drivers)
         self.cleanup_drivers()
+        self.journal.record_clear()
+        self.restart_queue.cancel()
         self.add_log(f"{count} aktif link durduruldu")
         
         return {
@@ -661,85 +3807,89 @@ class BetterKickTool:
             "message": f"{count} aktif link durduruldu"
         }
         
+    @traced('stop_link')
     def stop_link(self, link_id_or_url, profile_id=None):
         """Belirtilen linki durdur"""
-        # Link ID veya URL'den link bilgisini bul
-        link_id = None
-        
-        # Doğrudan link ID ise
-        if link_id_or_url in self.links:
-            link_id = link_id_or_url
-        else:
-            # URL ise eşleşen linki bul
-            for lid, data in self.links.items():
-                if data['url'] == link_id_or_url:
-                    link_id = lid
-                    break
-        
-        if not link_id:
-            error_msg = f"Link bulunamadı: {link_id_or_url}"
-            logger.error(error_msg)
-            self.add_error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg
-            }
-        
-        # Aktif link kontrolü ve profil filtreleme
-        active_entries = [(lid, pid) for lid, pid in self.active_links if lid == link_id]
-        
-        if not active_entries:
-            error_msg = f"Link aktif değil: {link_id}"
-            self.add_error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg
-            }
-        
-        # Profil ID belirtilmişse filtrele
-        if profile_id is not None:
-            active_entries = [(lid, pid) for lid, pid in active_entries if pid == str(profile_id)]
+        # Arama ve oturumların listelerden çıkarılması tek kilit altında: canlı
+        # yeniden yükleme veya link silme konumsal ID'leri arada değiştiremez
+        with self.state_lock:
+            link_id = self.find_link_id(link_id_or_url)
+            
+            if not link_id:
+                error_msg = f"Link bulunamadı: {link_id_or_url}"
+                logger.error(error_msg)
+                self.add_error(error_msg)
+                return {
+                    "success": False,
+                    "message": error_msg
+                }
+            
+            # Aktif link kontrolü ve profil filtreleme
+            active_entries = [(lid, pid) for lid, pid in self.active_links if lid == link_id]
+            
             if not active_entries:
-                error_msg = f"Link belirtilen profilde aktif değil: {link_id} (Profil: {profile_id})"
+                error_msg = f"Link aktif değil: {link_id}"
                 self.add_error(error_msg)
                 return {
                     "success": False,
                     "message": error_msg
                 }
+            
+            # Profil ID belirtilmişse filtrele
+            if profile_id is not None:
+                active_entries = [(lid, pid) for lid, pid in active_entries if pid == str(profile_id)]
+                if not active_entries:
+                    error_msg = f"Link belirtilen profilde aktif değil: {link_id} (Profil: {profile_id})"
+                    self.add_error(error_msg)
+                    return {
+                        "success": False,
+                        "message": error_msg
+                    }
+            
+            # Oturumları listelerden çıkar; tarayıcılar kilit dışında kapatılır
+            link_data = self.links[link_id]
+            stopping = [d for d in self.drivers if (d['link_id'], d['profile_id']) in active_entries]
+            for driver_info in stopping:
+                self.drivers.remove(driver_info)
+                self.active_links.remove((driver_info['link_id'], driver_info['profile_id']))
+                self.restart_queue.cancel(driver_info['link_id'], driver_info['profile_id'])
+            
+            # Link durumunu güncelle
+            if not any(al[0] == link_id for al in self.active_links):
+                link_data['status'] = 'inactive'
+            self.bump_version('sessions', 'links')
         
-        # Driver'ları bul ve kapat
-        stopped_count = 0
-        for link_id_to_stop, profile_id_to_stop in active_entries:
-            for i, driver_info in enumerate(list(self.drivers)):
-                if driver_info['link_id'] == link_id_to_stop and driver_info['profile_id'] == profile_id_to_stop:
-                    try:
-                        driver_info['driver'].quit()
-                    except:
-                        pass
-                        
-                    self.drivers.remove(driver_info)
-                    self.active_links.remove((link_id_to_stop, profile_id_to_stop))
-                    stopped_count += 1
-                    break
+        # Driver'ları kapat
+        for driver_info in stopping:
+            self.release_session(driver_info['driver'], driver_info.get('handle'), driver_info['profile_id'])
+            self.journal.record_stop(link_data['url'], driver_info['profile_name'])
+        stopped_count = len(stopping)
         
         # Pencere konumlarını güncelle
         if self.drivers:
             self.window_positions = self.calculate_window_positions(len(self.drivers))
             for j, d_info in enumerate(self.drivers):
-                self.position_window(d_info['driver'], j)
-        
-        # Link durumunu güncelle
-        if not any(al[0] == link_id for al in self.active_links):
-            self.links[link_id]['status'] = 'inactive'
+                self.position_window(d_info['driver'], j, d_info.get('handle'))
         
-        success_msg = f"Link {stopped_count} profilde durduruldu: {self.links[link_id]['name']} (ID: {link_id})"
-        self.add_log(f"Link durduruldu: {self.links[link_id]['name']} ({stopped_count} profil)")
+        success_msg = f"Link {stopped_count} profilde durduruldu: {link_data['name']} (ID: {link_id})"
+        self.add_log(f"Link durduruldu: {link_data['name']} ({stopped_count} profil)")
         
         return {
             "success": True,
             "message": success_msg
         }
     
+    def find_link_id(self, link_id_or_url):
+        """Link ID'si veya URL'den güncel link ID'sini bul; yoksa None (state_lock altında çağrılır)"""
+        # Doğrudan link ID ise
+        if link_id_or_url in self.links:
+            return link_id_or_url
+        # URL ise eşleşen linki bul
+        for lid, data in self.links.items():
+            if data['url'] == link_id_or_url:
+                return lid
+        return None
+    
     def add_link(self, url, name=None):
         """Yeni link ekle"""
         # URL kontrolü
@@ -750,103 +3900,113 @@ class BetterKickTool:
                 "success": False,
                 "message": error_msg
             }
+        
+        # Kontrol, ID ataması ve kayıt tek kilit altında: eşzamanlı iki ekleme
+        # aynı ID'yi alamaz, canlı yeniden yükleme araya giremez
+        with self.state_lock:
+            # Mevcut link kontrolü
+            for link_id, link_data in self.links.items():
+                if link_data['url'] == url:
+                    error_msg = f"Bu URL zaten kayıtlı (ID: {link_id})"
+                    self.add_error(error_msg)
+                    return {
+                        "success": False,
+                        "message": error_msg
+                    }
+            
+            # Yeni link ID'si
+            new_id = str(len(self.links) + 1)
+            
+            # İsim belirtilmemişse varsayılan isim
+            if not name:
+                name = f"Yayın {new_id}"
+            
+            # Linki ekle
+            self.links[new_id] = {
+                'name': name,
+                'url': url,
+                'status': 'inactive'
+            }
+            self.bump_version('links')
             
-        # Mevcut link kontrolü
-        for link_id, link_data in self.links.items():
-            if link_data['url'] == url:
-                error_msg = f"Bu URL zaten kayıtlı (ID: {link_id})"
+            # Linkleri kaydet
+            if not self.save_links():
+                # Kaydetme başarısız olursa linki kaldır
+                del self.links[new_id]
+                self.bump_version('links')
+                error_msg = "Link eklenemedi: Kaydetme hatası"
                 self.add_error(error_msg)
                 return {
                     "success": False,
                     "message": error_msg
                 }
-                
-        # Yeni link ID'si
-        new_id = str(len(self.links) + 1)
         
-        # İsim belirtilmemişse varsayılan isim
-        if not name:
-            name = f"Yayın {new_id}"
-            
-        # Linki ekle
-        self.links[new_id] = {
-            'name': name,
-            'url': url,
-            'status': 'inactive'
+        success_msg = f"Link eklendi: {name} (ID: {new_id})"
+        self.add_log(success_msg)
+        return {
+            "success": True,
+            "message": success_msg,
+            "link_id": new_id
         }
-        
-        # Linkleri kaydet
-        if self.save_links():
-            success_msg = f"Link eklendi: {name} (ID: {new_id})"
-            self.add_log(success_msg)
-            return {
-                "success": True,
-                "message": success_msg,
-                "link_id": new_id
-            }
-        else:
-            # Kaydetme başarısız olursa linki kaldır
-            del self.links[new_id]
-            error_msg = "Link eklenemedi: Kaydetme hatası"
-            self.add_error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg
-            }
     
     def remove_link(self, link_id_or_url):
         """Link sil"""
-        # Link ID veya URL'den link bilgisini bul
-        link_id = None
+        with self.state_lock:
+            link_id = self.find_link_id(link_id_or_url)
+            if not link_id:
+                error_msg = f"Link bulunamadı: {link_id_or_url}"
+                logger.error(error_msg)
+                self.add_error(error_msg)
+                return {
+                    "success": False,
+                    "message": error_msg
+                }
+            url = self.links[link_id]['url']
+            active = any(al[0] == link_id for al in self.active_links)
         
-        # Doğrudan link ID ise
-        if link_id_or_url in self.links:
-            link_id = link_id_or_url
-        else:
-            # URL ise eşleşen linki bul
-            for lid, data in self.links.items():
-                if data['url'] == link_id_or_url:
-                    link_id = lid
-                    break
+        # Link aktifse önce durdur (tarayıcılar kilit dışında kapanır; ID arada değişebileceği için URL ile)
+        if active:
+            self.stop_link(url)
         
-        if not link_id:
-            error_msg = f"Link bulunamadı: {link_id_or_url}"
-            logger.error(error_msg)
-            self.add_error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg
-            }
+        with self.state_lock:
+            link_id = self.find_link_id(url)
+            if not link_id:
+                error_msg = f"Link bulunamadı: {link_id_or_url}"
+                self.add_error(error_msg)
+                return {
+                    "success": False,
+                    "message": error_msg
+                }
             
-        # Link aktifse önce durdur
-        if any(al[0] == link_id for al in self.active_links):
-            self.stop_link(link_id)
+            # Linki sil
+            previous = dict(self.links)
+            link_name = self.links[link_id]['name']
+            del self.links[link_id]
+            self.bump_version('links')
+            
+            # Linkleri kaydet
+            if not self.save_links():
+                # Kaydetme başarısız olursa linki yerine geri koy
+                self.links = previous
+                self.bump_version('links')
+                error_msg = "Link silinemedi: Kaydetme hatası"
+                self.add_error(error_msg)
+                return {
+                    "success": False,
+                    "message": error_msg
+                }
             
-        # Linki sil
-        link_name = self.links[link_id]['name']
-        del self.links[link_id]
+            # Kalan linkleri dosyadaki sırayla yeniden numaralandır; canlı yeniden yükleme
+            # kendi kaydımızı okuduğunda aynı ID'leri bulur ve fark çıkmaz
+            id_map = {lid: str(i + 1) for i, lid in enumerate(self.links)}
+            self.apply_link_ids({id_map[lid]: data for lid, data in self.links.items()}, id_map)
         
-        # Linkleri kaydet
-        if self.save_links():
-            success_msg = f"Link silindi: {link_name} (ID: {link_id})"
-            self.add_log(success_msg)
-            return {
-                "success": True,
-                "message": success_msg
-            }
-        else:
-            # Kaydetme başarısız olursa linki geri ekle
-            self.links[link_id] = {
-                'name': link_name,
-                'url': link_id_or_url,
-                'status': 'inactive'
-            }
-            error_msg = "Link silinemedi: Kaydetme hatası"
-            self.add_error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg
-            }
+        success_msg = f"Link silindi: {link_name} (ID: {link_id})"
+        self.add_log(success_msg)
+        return {
+            "success": True,
+            "message": success_msg
+        }
     
     def set_check_interval(self, minutes):
         """Kontrol aralığını değiştir"""
@@ -862,6 +4022,8 @@ class BetterKickTool:
                 
             self.check_interval = minutes * 60
             self.save_config()
+            self.bump_version('config')
+            self.status_wakeup.set()
             
             success_msg = f"Kontrol aralığı {minutes} dakika olarak ayarlandı"
             self.add_log(success_msg)
@@ -877,27 +4039,65 @@ class BetterKickTool:
                 "message": error_msg
             }
     
-    def get_status(self):
-        """Program durumunu döndür"""
+    def parse_list_query(self, cursor, limit, fields, session_cursor=False):
+        """Sayfalama parametrelerini doğrula: (cursor, limit, fields) veya hata mesajı döndür"""
+        try:
+            if limit is not None:
+                limit = int(limit)
+                if not 1 <= limit <= 1000:
+                    raise ValueError
+        except (TypeError, ValueError):
+            return None, "Geçersiz limit: 1-1000 arası bir sayı olmalıdır"
+        try:
+            if cursor is not None:
+                # Link cursor'ı link ID'si, oturum cursor'ı "link ID:profil ID"
+                parts = cursor.split(':') if session_cursor else [cursor]
+                if len(parts) != (2 if session_cursor else 1):
+                    raise ValueError
+                cursor = tuple(int(part) for part in parts) if session_cursor else int(parts[0])
+        except (TypeError, ValueError):
+            return None, f"Geçersiz cursor: {cursor}"
+        if isinstance(fields, str):
+            fields = {field.strip() for field in fields.split(',') if field.strip()}
+        return (cursor, limit, fields or None), None
+    
+    def get_status(self, status=None, profile_id=None, name=None, cursor=None, limit=None, fields=None):
+        """Program durumunu döndür
+        
+        Aktif oturumlar durum, profil ve isim parçasına göre filtrelenebilir;
+        limit verilirse cursor ile sayfalanır, fields ile alanlar seçilir.
+        """
+        query, error_msg = self.parse_list_query(cursor, limit, fields, session_cursor=True)
+        if error_msg:
+            return {"success": False, "message": error_msg}
+        cursor, limit, fields = query
+        
+        self.link_index.refresh(self)
+        page, last, matched_count = self.link_index.query_sessions(status, profile_id, name, cursor, limit)
+        
+        ready_times = {(d['link_id'], d['profile_id']): d.get('ready_ms') for d in self.drivers}
         active_links = []
-        for link_id, profile_id in self.active_links:
-            if link_id in self.links:
-                profile_name = "Bilinmeyen"
-                try:
-                    profile_index = int(profile_id)
-                    if 0 <= profile_index < len(self.profiles):
-                        profile_name = self.profiles[profile_index]['name']
-                except:
-                    pass
-                    
-                active_links.append({
-                    'id': link_id,
-                    'name': self.links[link_id]['name'],
-                    'url': self.links[link_id]['url'],
-                    'status': self.links[link_id]['status'],
-                    'profile_id': profile_id,
-                    'profile_name': profile_name
-                })
+        for link_id, profile_id in page:
+            link_data = self.links.get(link_id)
+            if link_data is None:
+                continue
+            profile_name = "Bilinmeyen"
+            try:
+                profile_index = int(profile_id)
+                if 0 <= profile_index < len(self.profiles):
+                    profile_name = self.profiles[profile_index]['name']
+            except:
+                pass
+                
+            active_links.append(_project({
+                'id': link_id,
+                'name': link_data['name'],
+                'url': link_data['url'],
+                'status': link_data['status'],
+                'profile_id': profile_id,
+                'profile_name': profile_name,
+                'ready_ms': ready_times.get((link_id, profile_id))
+            }, fields))
                 
         return {
             "success": True,
@@ -905,25 +4105,96 @@ class BetterKickTool:
             "total_count": len(self.links),
             "check_interval": self.check_interval // 60,  # Dakika cinsinden
             "active_links": active_links,
-            "last_status_check": self.last_status_check
+            "matched_count": matched_count,
+            "next_cursor": f"{last[0]}:{last[1]}" if last else None,
+            "last_status_check": self.last_status_check,
+            "browser_mode": self.browser_mode,
+            "warm_pool": self.warm_pool.stats() if self.warm_pool else None,
+            "restarts": self.restart_queue.stats(),
+            "launch_admission": self.launch_scheduler.stats(),
+            "notifier": self.notifier.stats(),
+            "api_server": self.api_server.stats() if self.api_server else None,
+            "devtools": self.devtools.stats()
         }
     
-    def get_all_links(self):
-        """Tüm linkleri döndür"""
+    def get_all_links(self, status=None, profile_id=None, name=None, cursor=None, limit=None, fields=None):
+        """Linkleri döndür (durum, aktif profil ve isim parçasına göre filtreli, cursor ile sayfalı)
+        
+        Erişilebilirlik yüzdesi geçmiş deposunu okuduğu için sadece fields ile
+        istenirse (ör. fields=id,name,availability) ve geçmiş açıksa eklenir.
+        """
+        query, error_msg = self.parse_list_query(cursor, limit, fields)
+        if error_msg:
+            return {"success": False, "message": error_msg}
+        cursor, limit, fields = query
+        
+        self.link_index.refresh(self)
+        page, last, total = self.link_index.query_links(status, profile_id, name, cursor, limit)
+        
         links_list = []
-        for link_id, link_data in self.links.items():
-            links_list.append({
+        profile_names = [profile['name'] for profile in self.profiles]
+        with_availability = bool(fields) and 'availability' in fields and self.history_enabled
+        for link_id in page:
+            link_data = self.links.get(link_id)
+            if link_data is None:
+                continue
+            item = {
                 'id': link_id,
                 'name': link_data['name'],
                 'url': link_data['url'],
-                'status': link_data['status']
-            })
+                'status': link_data['status'],
+                'ready': link_data.get('ready', 'body'),
+                'ready_ms': link_data.get('ready_ms')
+            }
+            if with_availability:
+                # Tüm profillerdeki oturumların son 24 saatlik erişilebilirliği: anahtar başına
+                # ~24 saatlik özet satırı okunur (availability 24 saat ve üstünde saatlik halkayı kullanır)
+                keys = [f"{link_data['url']}|{name}" for name in profile_names]
+                item['availability'] = self.history.availability(keys, 86400)
+            links_list.append(_project(item, fields))
             
         return {
             "success": True,
-            "links": links_list
+            "links": links_list,
+            "total": total,
+            "next_cursor": last
+        }
+    
+    def get_session_history(self, session_id, resolution='minute', since=None, limit=None):
+        """Oturumun (link_id:profile_id) sağlık ve kaynak geçmişini döndür"""
+        if not self.history_enabled:
+            return {"success": False, "message": "Sağlık geçmişi kapalı (history.enabled)"}
+        link_id, _, profile_id = session_id.partition(':')
+        key = self.history_key(link_id, profile_id)
+        if key is None:
+            return {"success": False, "message": f"Oturum bulunamadı: {session_id}"}
+        if resolution not in ('raw', 'minute', 'hour'):
+            return {"success": False, "message": f"Geçersiz çözünürlük: {resolution} (raw, minute, hour)"}
+        try:
+            since = float(since) if since else None
+            limit = int(limit) if limit else None
+        except ValueError:
+            return {"success": False, "message": "since ve limit sayı olmalı"}
+        
+        try:
+            samples = self.history.history(key, resolution, since, limit)
+            availability = {label: self.history.availability([key], seconds)
+                            for label, seconds in (('1h', 3600), ('24h', 86400), ('7d', 7 * 86400))}
+        except Exception as e:
+            logger.error(f"Oturum geçmişi okunurken hata: {str(e)}")
+            return {"success": False, "message": f"Geçmiş okunamadı: {str(e)}"}
+        return {
+            "success": True,
+            "id": f"{link_id}:{profile_id}",
+            "name": self.links[link_id]['name'],
+            "profile_name": self.profiles[int(profile_id)]['name'],
+            "active": (link_id, profile_id) in self.active_links,
+            "resolution": resolution,
+            "availability": availability,
+            "samples": samples
         }
     
+    @traced('restart_all')
     def restart_all(self):
         """Tüm aktif linkleri yeniden başlat"""
         if not self.active_links:
@@ -958,6 +4229,7 @@ class BetterKickTool:
             "message": success_msg
         }
     
+    @traced('reposition_windows')
     def reposition_windows(self):
         """Tüm açık pencereleri yeniden konumlandır"""
         if not self.drivers:
@@ -974,7 +4246,7 @@ class BetterKickTool:
         # Tüm pencereleri yeniden konumlandır
         repositioned_count = 0
         for i, driver_info in enumerate(self.drivers):
-            if self.position_window(driver_info['driver'], i):
+            if self.position_window(driver_info['driver'], i, driver_info.get('handle')):
                 repositioned_count += 1
                 
         success_msg = f"{repositioned_count} pencere yeniden konumlandırıldı"
@@ -999,6 +4271,37 @@ class BetterKickTool:
             "profiles": profiles_list
         }
     
+    def get_profile_catalog(self):
+        """Edge'in Local State'indeki profilleri durumlarıyla döndür
+        
+        Sadece yapılandırmadaki (profile_discovery.user_data_dir) veya platformun
+        varsayılan kullanıcı veri dizini okunur; katalog önbelleği bu yüzden sınırlı kalır.
+        """
+        try:
+            user_data_dir = self.config.get('profile_discovery', {}).get('user_data_dir')
+            discovered = self.profile_catalog.discover(user_data_dir)
+            statuses = self.profile_catalog.validate([profile['path'] for profile in discovered])
+            configured = {_profile_path_key(profile['path']): str(i) for i, profile in enumerate(self.profiles)}
+            return {
+                "success": True,
+                "user_data_dir": user_data_dir or ProfileCatalog.default_user_data_dir(),
+                "profiles": [
+                    {
+                        'name': profile['name'],
+                        'path': profile['path'],
+                        'status': statuses[profile['path']],
+                        'profile_id': configured.get(_profile_path_key(profile['path']))
+                    }
+                    for profile in discovered
+                ]
+            }
+        except Exception as e:
+            logger.error(f"Profil kataloğu okunurken hata: {str(e)}")
+            return {
+                "success": False,
+                "message": f"Profil kataloğu okunamadı: {str(e)}"
+            }
+    
     def get_logs(self, lines=10):
         """Son log kayıtlarını döndür"""
         try:
@@ -1025,29 +4328,69 @@ class BetterKickTool:
                 "message": f"Log dosyası okunurken hata: {str(e)}"
             }
     
+    def quit_driver(self, driver):
+        """Driver'ı kapat; quit başarısız olursa kalan süreçlerini zorla sonlandır"""
+        self.devtools.unwatch(driver)
+        try:
+            driver.quit()
+            self.process_registry.release(driver)
+        except Exception:
+            self.process_registry.release(driver, force=True)
+    
+    def quit_drivers(self, drivers):
+        """Driver'ları paralel kapat; genel süre sınırını aşanların süreç ağacını zorla sonlandır"""
+        if not drivers:
+            return
+        deadline = time.monotonic() + self.shutdown_timeout
+        threads = []
+        for driver in drivers:
+            # Daemon thread: takılan bir quit() programın kapanmasını engellemesin
+            thread = threading.Thread(target=self.quit_driver, args=(driver,), name="driver_quit", daemon=True)
+            thread.start()
+            threads.append((driver, thread))
+        
+        hung = 0
+        for driver, thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
+            if thread.is_alive():
+                hung += 1
+                self.process_registry.release(driver, force=True)
+        if hung:
+            logger.warning(f"{hung} driver {self.shutdown_timeout}s içinde kapanmadı, süreçleri zorla sonlandırıldı")
+            self.add_error(f"{hung} driver zorla sonlandırıldı")
+    
     def cleanup_drivers(self):
         """Sadece driver'ları temizle, programı kapatma"""
         logger.info("Edge driver'lar kapatılıyor...")
         self.add_log("Tüm driver'lar kapatılıyor")
-        for driver_info in self.drivers:
-            try:
-                driver_info['driver'].quit()
-            except:
-                pass
-                
-        self.drivers.clear()
-        self.active_links.clear()
-        
-        # Tüm linkleri inaktif olarak işaretle
-        for link_id in self.links:
-            self.links[link_id]['status'] = 'inactive'
+        # Listeler kilit altında boşaltılır: bu sırada kaydedilen oturumlar kaybolmaz
+        with self.state_lock:
+            # Sekme modunda aynı tarayıcı birden çok oturumda olabilir, her tarayıcı bir kez kapatılır
+            unique_drivers = {id(d['driver']): d['driver'] for d in self.drivers}
+            unique_drivers.update({id(driver): driver for driver in self.profile_browsers.values()})
+            
+            self.drivers.clear()
+            self.active_links.clear()
+            self.profile_browsers.clear()
+            self.browser_locks.clear()
+            
+            # Tüm linkleri inaktif olarak işaretle
+            for link_id in self.links:
+                self.links[link_id]['status'] = 'inactive'
+            self.bump_version('links', 'sessions')
+        self.quit_drivers(list(unique_drivers.values()))
     
+    @traced('check_link_status')
     def check_link_status(self):
         """Aktif linklerin durumunu kontrol et"""
         logger.info("Link durumları kontrol ediliyor...")
         self.add_log("Link durumları kontrol ediliyor")
         self.last_status_check = int(time.time())
         
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         for driver_info in list(self.drivers):  # Kopyasını al çünkü içeriği değişebilir
             driver = driver_info['driver']
             link_id = driver_info['link_id']
@@ -1055,70 +4398,194 @@ class BetterKickTool:
             profile_name = driver_info['profile_name']
             
             try:
-                # Tarayıcı hala açık mı kontrol et
-                driver.current_url
-                
-                # Sayfa yüklenmiş mi kontrol et
-                try:
-                    WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                    logger.info(f"Link aktif: {self.links[link_id]['name']} (ID: {link_id}, Profil: {profile_name})")
-                except:
-                    logger.warning(f"Sayfa yüklenemedi: {self.links[link_id]['name']} (ID: {link_id}, Profil: {profile_name})")
-                    # Sayfayı yenile
-                    driver.refresh()
+                with self.tracer.span('health check', link=link_id, profile=profile_id), \
+                        self.focus_window(driver, driver_info.get('handle')):
+                    # Tarayıcı hala açık mı kontrol et
+                    driver.current_url
+                    
+                    # Sayfa yüklenmiş mi kontrol et
+                    try:
+                        WebDriverWait(driver, 5).until(
+                            EC.presence_of_element_located((By.TAG_NAME, "body"))
+                        )
+                        logger.info(f"Link aktif: {self.links[link_id]['name']} (ID: {link_id}, Profil: {profile_name})")
+                        self.record_history(link_id, profile_id, True, driver=driver)
+                    except:
+                        logger.warning(f"Sayfa yüklenemedi: {self.links[link_id]['name']} (ID: {link_id}, Profil: {profile_name})")
+                        self.record_history(link_id, profile_id, False, driver=driver)
+                        # Sayfayı yenile
+                        driver.refresh()
                     
             except Exception as e:
                 logger.error(f"Tarayıcı kapanmış veya hata vermiş: {str(e)}")
-                self.add_error(f"Tarayıcı hatası: {profile_name}")
-                
-                # Driver'ı listeden kaldır
-                self.drivers.remove(driver_info)
-                
-                if (link_id, profile_id) in self.active_links:
-                    self.active_links.remove((link_id, profile_id))
-                    
-                if link_id in self.links:
-                    # Eğer bu link başka profillerde de açık değilse error olarak işaretle
-                    if not any(al[0] == link_id for al in self.active_links):
-                        self.links[link_id]['status'] = 'error'
-                
-                # Yeniden başlat
-                logger.info(f"Link yeniden başlatılıyor: {self.links[link_id]['name']} (ID: {link_id}, Profil: {profile_name})")
-                self.add_log(f"Link yeniden başlatılıyor: {profile_name}")
-                self.start_link(link_id, profile_id)
+                self.handle_session_failure(driver_info, str(e).splitlines()[0] if str(e) else type(e).__name__)
+    
+    def handle_session_failure(self, driver_info, error):
+        """Çöken oturumu kaldır, bildir ve yeniden başlatma kuyruğuna ekle
+        
+        Yoklama ve DevTools olayları aynı oturumu aynı anda bildirebilir; oturum
+        zaten kaldırılmışsa hiçbir şey yapılmaz.
+        """
+        link_id = driver_info['link_id']
+        profile_id = driver_info['profile_id']
+        profile_name = driver_info['profile_name']
+        with self.state_lock:
+            if driver_info not in self.drivers:
+                return False
+            self.drivers.remove(driver_info)
+            if (link_id, profile_id) in self.active_links:
+                self.active_links.remove((link_id, profile_id))
+            if link_id in self.links:
+                # Eğer bu link başka profillerde de açık değilse error olarak işaretle
+                if not any(al[0] == link_id for al in self.active_links):
+                    self.links[link_id]['status'] = 'error'
+        
+        self.add_error(f"Tarayıcı hatası: {profile_name}")
+        link_name = self.links[link_id]['name'] if link_id in self.links else link_id
+        self.record_history(link_id, profile_id, False)
+        self.notifier.notify('crash', f"{link_name} ({profile_name}): {error}")
+        
+        # Driver'ın (sekme modunda pencerenin) kalan kaynaklarını bırak
+        self.release_session(driver_info['driver'], driver_info.get('handle'), profile_id)
+        self.bump_version('links', 'sessions')
+        
+        # Geri çekilmeli yeniden başlatma kuyruğuna ekle
+        self.restart_queue.schedule(link_id, profile_id, error)
+        return True
+    
+    def on_devtools_event(self, driver, target_id, kind, detail):
+        """DevTools olayını işle (DevToolsMonitor olay thread'inden çağrılır)
+        
+        Olay thread'i bloklanmaz: oturumu kapatma ve sayfayı yeniden açma gibi
+        yavaş işler ayrı bir thread'de yapılır.
+        """
+        sessions = [
+            d for d in list(self.drivers)
+            if d['driver'] is driver and (target_id is None or d.get('handle') in (None, target_id))
+        ]
+        for driver_info in sessions:
+            link_id = driver_info['link_id']
+            link_data = self.links.get(link_id)
+            if link_data is None:
+                continue
+            label = f"{link_data['name']} (ID: {link_id}, Profil: {driver_info['profile_name']})"
+            
+            if kind in ('crashed', 'closed', 'disconnected'):
+                logger.error(f"DevTools: {detail}: {label}")
+                self.run_in_background(self.handle_session_failure, driver_info, detail)
+                continue
+            
+            if kind == 'navigated' and self.same_page(detail, link_data['url']):
+                continue
+            # Sayfa yüklenemedi veya başka adrese gitti: linki yeniden aç (sık tekrarlanmasın)
+            now = time.time()
+            if now - driver_info.get('devtools_recovered_at', 0) < self.devtools_refresh_cooldown:
+                continue
+            driver_info['devtools_recovered_at'] = now
+            if kind == 'load_failed':
+                logger.warning(f"DevTools: sayfa yüklenemedi ({detail}): {label}")
+            else:
+                logger.warning(f"DevTools: sayfa başka adrese gitti ({detail}): {label}")
+            self.add_log(f"Sayfa yeniden açılıyor: {link_data['name']}")
+            self.record_history(link_id, driver_info['profile_id'], False)
+            self.run_in_background(self.reopen_session_page, driver_info, link_data['url'])
+    
+    def reopen_session_page(self, driver_info, url):
+        """Oturumun sayfasını yeniden aç; açılamazsa oturumu çökmüş say"""
+        try:
+            with self.focus_window(driver_info['driver'], driver_info.get('handle')):
+                driver_info['driver'].get(url)
+        except Exception as e:
+            logger.error(f"Sayfa yeniden açılamadı: {str(e)}")
+            self.handle_session_failure(driver_info, str(e).splitlines()[0] if str(e) else type(e).__name__)
+    
+    @staticmethod
+    def run_in_background(func, *args):
+        """Olay thread'ini bekletmeden işi ayrı bir daemon thread'de çalıştır"""
+        def run():
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"DevTools olay işleme hatası: {str(e)}")
+        threading.Thread(target=run, name="devtools_recovery", daemon=True).start()
+    
+    @staticmethod
+    def same_page(url, link_url):
+        """Gezinilen adres linkin sayfası mı (şema, sorgu ve sondaki / yok sayılır)"""
+        from urllib.parse import urlsplit
+        
+        def normalize(value):
+            parts = urlsplit(value or '')
+            host = parts.netloc.lower()
+            return (host[4:] if host.startswith('www.') else host), parts.path.rstrip('/').lower()
+        
+        return normalize(url) == normalize(link_url)
+    
+    def effective_check_interval(self):
+        """Tüm oturumlar DevTools ile izleniyorsa seyreltilmiş yoklama aralığı"""
+        drivers = list(self.drivers)
+        if self.devtools_enabled and drivers and all(
+                self.devtools.is_watched(d['driver'], d.get('handle')) for d in drivers):
+            return max(self.check_interval, self.devtools_check_interval)
+        return self.check_interval
     
     def start_status_thread(self):
         """Durum kontrol thread'ini başlat"""
         def status_worker():
+            started = time.time()
             while self.running and self.drivers:
-                time.sleep(self.check_interval)
+                # Aralık değişirse (set_check_interval, config.json) bekleme yeniden hesaplanır
+                remaining = max(started, self.last_status_check) + self.effective_check_interval() - time.time()
+                if remaining > 0:
+                    self.status_wakeup.wait(remaining)
+                    self.status_wakeup.clear()
+                    continue
                 if self.running and self.drivers:
                     self.check_link_status()
         
-        self.status_thread = threading.Thread(target=status_worker, daemon=True)
+        self.status_thread = threading.Thread(target=status_worker, name="status_worker", daemon=True)
         self.status_thread.start()
         logger.info(f"Durum kontrol thread'i başlatıldı (kontrol aralığı: {self.check_interval//60} dakika)")
         self.add_log(f"Status thread başlatıldı ({self.check_interval//60}dk)")
     
     def cleanup(self):
         """Tüm Edge driver'ları kapat ve programı sonlandır"""
+        # Önce API'yi boşalt: süren /start gibi isteklerin yanıtları driver'lar kapanmadan yazılsın
+        if self.api_server:
+            self.api_server.stop()
+        if self._hotkey_hook is not None:
+            try:
+                import keyboard
+                keyboard.unhook(self._hotkey_hook)
+            except Exception:
+                pass
+            self._hotkey_hook = None
+        if self.file_watcher:
+            self.file_watcher.stop()
+        self.restart_queue.stop()
+        if self.warm_pool:
+            self.warm_pool.stop()
         self.cleanup_drivers()
+        self.devtools.stop()
+        self.driver_factory.stop()
+        self.notifier.stop()
+        self.history.stop()
         self.running = False
 
     def validate_profiles(self):
         """Profillerin var olup olmadığını kontrol et"""
         valid_profiles = []
+        # Dizinler paralel kontrol edilir; mtime'ı değişmeyenler için önbellek kullanılır
+        statuses = self.profile_catalog.validate([profile['path'] for profile in self.profiles])
         
         for profile in self.profiles:
             profile_path = profile['path']
+            status = statuses[profile_path]
             
             # Profil dizininin var olup olmadığını kontrol et
-            if os.path.exists(profile_path):
+            if status != ProfileCatalog.MISSING:
                 # Preferences dosyasının var olup olmadığını kontrol et
-                prefs_file = os.path.join(profile_path, 'Preferences')
-                if os.path.exists(prefs_file):
+                if status == ProfileCatalog.VALID:
                     valid_profiles.append(profile)
                     logger.info(f"✅ Geçerli profil: {profile['name']} - {profile_path}")
                     self.add_log(f"✅ Geçerli profil: {profile['name']}")
@@ -1138,12 +4605,15 @@ class BetterKickTool:
             return False
         
         self.profiles = valid_profiles
+        self.bump_version('profiles')
         logger.info(f"Toplam {len(valid_profiles)} geçerli profil yüklendi")
         self.add_log(f"Toplam {len(valid_profiles)} geçerli profil yüklendi")
         return True
 
     def create_dashboard(self):
         """Ana dashboard oluştur"""
+        from rich.layout import Layout
+        
         layout = Layout()
         
         layout.split_column(
@@ -1176,6 +4646,11 @@ class BetterKickTool:
 
     def update_header(self):
         """Header panelini güncelle"""
+        from rich import box
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.text import Text
+        
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         uptime = int(time.time() - self.last_status_check) if self.last_status_check else 0
         
@@ -1193,6 +4668,9 @@ class BetterKickTool:
 
     def update_status(self):
         """Status panelini güncelle"""
+        from rich import box
+        from rich.table import Table
+        
         table = Table(title="📊 Sistem Durumu", box=box.ROUNDED)
         table.add_column("Metrik", style="cyan", no_wrap=True)
         table.add_column("Değer", style="magenta")
@@ -1223,35 +4701,56 @@ class BetterKickTool:
         
         return table
 
-    def update_links(self):
-        """Links panelini güncelle"""
+    def update_links(self, max_rows=None):
+        """Links panelini güncelle (sadece görünen satırları oluşturur)"""
+        from rich import box
+        from rich.table import Table
+        
         table = Table(title="🔗 Linkler", box=box.ROUNDED)
         table.add_column("ID", style="cyan", width=4)
         table.add_column("İsim", style="white", width=20)
         table.add_column("Durum", justify="center", width=8)
         table.add_column("Profiller", style="dim", width=15)
         
-        for link_id, link_data in self.links.items():
+        # Aktif profilleri link bazında bir kez grupla (links x active_links döngüsü yerine)
+        profiles_by_link = {}
+        for al_link_id, al_profile_id in self.active_links:
+            try:
+                profile_index = int(al_profile_id)
+                if 0 <= profile_index < len(self.profiles):
+                    profiles_by_link.setdefault(al_link_id, []).append(self.profiles[profile_index]['name'][:8])
+            except:
+                pass
+        
+        restart_states = self.restart_queue.states()
+        
+        # Görünür pencereyi hesapla
+        total = len(self.links)
+        if max_rows is None or total <= max_rows:
+            start, end = 0, total
+        else:
+            start = max(0, min(self.links_scroll, total - max_rows))
+            end = start + max_rows
+            table.caption = f"{start + 1}-{end} / {total}"
+        
+        for link_id, link_data in itertools.islice(self.links.items(), start, end):
             # Status icon
+            restarts = restart_states.get(link_id, {})
             if link_data['status'] == 'active':
                 status = "🟢 Aktif"
+            elif restarts.get('pending'):
+                status = "🔁 Sırada"
+            elif restarts.get('parked'):
+                status = "⛔ Park"
             elif link_data['status'] == 'error':
                 status = "🔴 Hata"
             else:
                 status = "⚪ Pasif"
             
-            # Bu linkin hangi profillerde açık olduğunu bul
-            active_profiles = []
-            for al_link_id, al_profile_id in self.active_links:
-                if al_link_id == link_id:
-                    try:
-                        profile_index = int(al_profile_id)
-                        if 0 <= profile_index < len(self.profiles):
-                            active_profiles.append(self.profiles[profile_index]['name'][:8])
-                    except:
-                        pass
-            
+            active_profiles = profiles_by_link.get(link_id)
             profiles_text = ", ".join(active_profiles) if active_profiles else "-"
+            if restarts.get('parked'):
+                profiles_text += f" (⛔{restarts['parked']})"
             
             table.add_row(
                 link_id,
@@ -1264,14 +4763,18 @@ class BetterKickTool:
 
     def update_profiles(self):
         """Profiles panelini güncelle"""
+        from rich import box
+        from rich.table import Table
+        
         table = Table(title="👤 Profiller", box=box.ROUNDED)
         table.add_column("ID", style="cyan", width=4)
         table.add_column("İsim", style="white", width=15)
         table.add_column("Durum", justify="center", width=8)
         
+        active_profile_ids = {al[1] for al in self.active_links}
         for i, profile in enumerate(self.profiles):
             # Bu profilde aktif link var mı kontrol et
-            has_active = any(al[1] == str(i) for al in self.active_links)
+            has_active = str(i) in active_profile_ids
             status = "🟢 Aktif" if has_active else "⚪ Boş"
             
             table.add_row(
@@ -1284,6 +4787,9 @@ class BetterKickTool:
 
     def update_errors(self):
         """Errors panelini güncelle"""
+        from rich import box
+        from rich.panel import Panel
+        
         if not self.last_errors:
             error_text = "Henüz hata yok 🎉"
         else:
@@ -1296,12 +4802,15 @@ class BetterKickTool:
             style="red"
         )
 
-    def update_logs(self):
-        """Logs panelini güncelle"""
+    def update_logs(self, max_rows=5):
+        """Logs panelini güncelle (sadece sığan son satırlar)"""
+        from rich import box
+        from rich.panel import Panel
+        
         if not self.last_logs:
             log_text = "Henüz log yok"
         else:
-            log_text = "\n".join(self.last_logs[-5:])  # Son 5 log
+            log_text = "\n".join(self.last_logs[-max(1, max_rows):])
         
         return Panel(
             log_text,
@@ -1312,10 +4821,15 @@ class BetterKickTool:
 
     def update_footer(self):
         """Footer panelini güncelle"""
+        from rich import box
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.text import Text
+        
         if self.show_help_panel:
             help_text = Text()
             help_text.append("🆘 YARDIM MENÜSÜ", style="bold yellow")
-            help_text.append("\n[Q] Çıkış | [R] Yenile | [S] Durdur | [P] Yeniden Konumlandır | [ESC] Yardımı Kapat", style="dim")
+            help_text.append("\n[Q] Çıkış | [R] Yenile | [S] Durdur | [P] Yeniden Konumlandır | [PgUp/PgDn] Linkleri Kaydır | [ESC] Yardımı Kapat", style="dim")
             help_text.append("\nDiscord Bot: !start, !stop, !restart, !status, !profiles, !links", style="cyan")
             help_text.append("\nAPI: GET /status, POST /start, POST /stop, GET /profiles", style="green")
             
@@ -1345,48 +4859,130 @@ class BetterKickTool:
                 style="bright_black"
             )
 
+    def render_dashboard(self, layout, panel_keys, screen_height):
+        """Sadece girdilerinin sürümü değişen panelleri yeniden oluştur"""
+        v = self.versions
+        
+        # Sabit yükseklikler: header 3 + footer 3, sol tarafta status 8,
+        # sağ tarafta profiles 8 + errors 8; tablo/panel çerçeveleri (başlık/alt yazı dahil) düşülür
+        main_height = max(0, screen_height - 6)
+        links_rows = max(1, main_height - 8 - 6)
+        logs_rows = max(1, main_height - 16 - 2)
+        
+        panels = {
+            'header': ((int(time.time()),), self.update_header),
+            'status': ((v['sessions'], v['links'], v['profiles'], v['config'], v['errors'], self.running),
+                       self.update_status),
+            'links': ((v['links'], v['sessions'], v['profiles'], self.links_scroll, links_rows),
+                      lambda: self.update_links(links_rows)),
+            'profiles': ((v['profiles'], v['sessions']), self.update_profiles),
+            'errors': ((v['errors'],), self.update_errors),
+            'logs': ((v['logs'], logs_rows), lambda: self.update_logs(logs_rows)),
+            'footer': ((v['help'],), self.update_footer),
+        }
+        
+        changed = False
+        for name, (key, build) in panels.items():
+            if panel_keys.get(name) != key:
+                layout[name].update(build())
+                panel_keys[name] = key
+                changed = True
+        return changed
+    
+    def on_key_event(self, event):
+        """Klavye olayını debounce edip komut kuyruğuna ekle (keyboard thread'inde çalışır)"""
+        key = event.name
+        if key not in HOTKEY_COMMANDS:
+            return
+        
+        if event.event_type == 'up':
+            self._keys_down.discard(key)
+            return
+        
+        # Basılı tutulan tuşun otomatik tekrarlarını ve çok sık basışları yoksay
+        now = time.monotonic()
+        if key in self._keys_down or now - self._last_key_time.get(key, 0) < self.hotkey_debounce:
+            return
+        self._keys_down.add(key)
+        self._last_key_time[key] = now
+        self.command_queue.put(HOTKEY_COMMANDS[key])
+    
+    def handle_command(self, command):
+        """Kısayol komutunu çalıştır (render thread'i dışında)"""
+        if command == 'quit':
+            self.add_log("Çıkış yapılıyor...")
+            self.running = False
+            self.gui_enabled = False
+            self.gui_dirty.set()
+        elif command == 'refresh':
+            self.add_log("Yenileniyor...")
+            self.bump_version(*self.versions)
+        elif command == 'stop_all':
+            self.add_log("Tüm linkler durduruluyor...")
+            self.stop_all()
+        elif command == 'reposition':
+            self.add_log("Pencereler yeniden konumlandırılıyor...")
+            self.reposition_windows()
+        elif command == 'help_on':
+            self.show_help_panel = True
+            self.bump_version('help')
+        elif command == 'help_off':
+            self.show_help_panel = False
+            self.bump_version('help')
+        elif command == 'scroll_down':
+            self.links_scroll = min(self.links_scroll + 10, max(0, len(self.links) - 1))
+            self.gui_dirty.set()
+        elif command == 'scroll_up':
+            self.links_scroll = max(0, self.links_scroll - 10)
+            self.gui_dirty.set()
+    
+    def start_command_worker(self):
+        """Komut kuyruğunu işleyen thread'i başlat"""
+        def command_worker():
+            while self.running:
+                try:
+                    command = self.command_queue.get(timeout=1)
+                except queue.Empty:
+                    continue
+                try:
+                    self.handle_command(command)
+                except Exception as e:
+                    logger.error(f"Komut hatası ({command}): {str(e)}")
+                    self.add_error(f"Komut hatası ({command}): {str(e)}")
+        
+        self.command_thread = threading.Thread(target=command_worker, name="command_worker", daemon=True)
+        self.command_thread.start()
+    
     def start_gui(self):
         """GUI'yi başlat"""
+        from rich.live import Live
+        
         def gui_worker():
             layout = self.create_dashboard()
+            panel_keys = {}
+            last_refresh = 0
+            pending = False
             
-            with Live(layout, refresh_per_second=2, screen=True) as live:
+            with Live(layout, console=self.console, auto_refresh=False, screen=True) as live:
                 while self.gui_enabled and self.running:
                     try:
-                        # Layout'u güncelle
-                        layout["header"].update(self.update_header())
-                        layout["status"].update(self.update_status())
-                        layout["links"].update(self.update_links())
-                        layout["profiles"].update(self.update_profiles())
-                        layout["errors"].update(self.update_errors())
-                        layout["logs"].update(self.update_logs())
-                        layout["footer"].update(self.update_footer())
+                        # Sadece değişen panelleri güncelle, ekranı yapılandırılan hızla sınırla
+                        if self.render_dashboard(layout, panel_keys, live.console.size.height):
+                            pending = True
+                        now = time.time()
+                        min_interval = 1.0 / max(float(self.gui_refresh_per_second), 0.1)
+                        if pending and now - last_refresh >= min_interval:
+                            live.refresh()
+                            last_refresh = now
+                            pending = False
                         
-                        # Keyboard input kontrolü
-                        if keyboard.is_pressed('q'):
-                            self.console.print("\n[bold red]Çıkış yapılıyor...[/bold red]")
-                            self.running = False
-                            self.gui_enabled = False
-                            break
-                        elif keyboard.is_pressed('r'):
-                            self.console.print("\n[bold green]Yenileniyor...[/bold green]")
-                            time.sleep(0.5)
-                        elif keyboard.is_pressed('s'):
-                            self.console.print("\n[bold yellow]Tüm linkler durduruluyor...[/bold yellow]")
-                            self.stop_all()
-                            time.sleep(0.5)
-                        elif keyboard.is_pressed('p'):
-                            self.console.print("\n[bold blue]Pencereler yeniden konumlandırılıyor...[/bold blue]")
-                            self.reposition_windows()
-                            time.sleep(0.5)
-                        elif keyboard.is_pressed('h'):
-                            self.show_help_panel = True
-                            time.sleep(0.5)
-                        elif keyboard.is_pressed('esc'):
-                            self.show_help_panel = False
-                            time.sleep(0.5)
-                        
-                        time.sleep(0.1)
+                        # Bir sonraki state değişikliğini veya saat tikini bekle
+                        if pending:
+                            timeout = last_refresh + min_interval - now
+                        else:
+                            timeout = 1.0 - now % 1.0
+                        self.gui_dirty.wait(max(timeout, 0.01))
+                        self.gui_dirty.clear()
                         
                     except KeyboardInterrupt:
                         break
@@ -1395,31 +4991,99 @@ class BetterKickTool:
                         self.add_error(f"GUI hatası: {str(e)}")
                         break
         
-        self.gui_thread = threading.Thread(target=gui_worker, daemon=True)
+        # Kısayollar keyboard thread'inden kuyruğa, oradan komut thread'ine gider
+        try:
+            import keyboard
+            self._hotkey_hook = keyboard.hook(self.on_key_event)
+        except Exception as e:
+            logger.error(f"Klavye kısayolları etkinleştirilemedi: {str(e)}")
+            self.add_error(f"Kısayol hatası: {str(e)}")
+        self.start_command_worker()
+        
+        self.gui_thread = threading.Thread(target=gui_worker, name="gui_worker", daemon=True)
         self.gui_thread.start()
     
-    def run(self):
+    def load_and_validate(self, timer):
+        """Profilleri ve linkleri yükleyip profilleri doğrula"""
+        with timer.phase('profiller'):
+            self.load_profiles()
+        with timer.phase('linkler'):
+            self.load_links()
+        with timer.phase('profil doğrulama'):
+            if not self.validate_profiles():
+                return False
+        with timer.phase('yetim süreç temizliği'):
+            user_data_dirs = {os.path.dirname(profile['path']) for profile in self.profiles}
+            reaped = self.process_registry.reap_orphans(user_data_dirs)
+            if reaped:
+                self.add_log(f"Önceki çalıştırmadan kalan {reaped} süreç sonlandırıldı")
+        with timer.phase('driver backend'):
+            try:
+                self.driver_factory.start()
+            except Exception as e:
+                logger.error(f"Driver backend başlatılamadı: {str(e)}")
+                self.add_error(f"Driver backend hatası: {str(e)}")
+        self.start_warm_pool()
+        if self.history_enabled:
+            self.history.start()
+        if self.config.get('live_reload', True) and not self.file_watcher:
+            self.file_watcher = DataFileWatcher(
+                self, 'data', ('links.json', 'profiles.json', 'config.json'),
+                poll_interval=self.config.get('reload_poll_interval', 1.0)
+            )
+            self.file_watcher.start()
+        with timer.phase('oturum günlüğü'):
+            if self.resume_on_start:
+                result = self.resume_sessions()
+                logger.info(result['message'])
+            else:
+                pending = len(self.journal.load())
+                if pending:
+                    logger.info(f"--resume verilmediği için günlükteki {pending} oturum geri yüklenmedi")
+                self.journal.reset()
+        return True
+    
+    def start_warm_pool(self):
+        """Yapılandırmada etkinse sıcak driver havuzunu başlat"""
+        pool_config = self.config.get('warm_pool', {})
+        if self.warm_pool or pool_config.get('size', 0) <= 0:
+            return
+        if self.browser_mode == 'tab':
+            logger.info("Sekme modunda profil tarayıcıları zaten açık kalır, sıcak havuz kullanılmıyor")
+            return
+        self.warm_pool = WarmDriverPool(
+            self,
+            size=pool_config['size'],
+            ttl=pool_config.get('ttl', 600),
+            check_interval=pool_config.get('check_interval', 5)
+        )
+        self.warm_pool.start()
+    
+    def run(self, timer=None):
         """Ana program döngüsü"""
+        from rich import box
+        from rich.panel import Panel
+        
+        timer = timer or StartupTimer()
+        
         # Başlangıç mesajı
         self.console.print(Panel(
             "[bold cyan]🚀 BetterKick Tool Başlatılıyor...[/bold cyan]\n[dim]Mükemmel Stream Management Sistemi[/dim]",
             box=box.DOUBLE
         ))
         
-        # Dosyaları yükle
-        with self.console.status("[bold green]Yapılandırma dosyaları yükleniyor..."):
-            self.load_profiles()
-            self.load_links()
-        
-        # Profilleri doğrula
-        with self.console.status("[bold green]Profiller doğrulanıyor..."):
-            if not self.validate_profiles():
-                self.console.print("[bold red]❌ Program durduruluyor: Geçerli profil bulunamadı[/bold red]")
-                return
+        # Dosyaları yükle ve profilleri doğrula
+        with self.console.status("[bold green]Yapılandırma dosyaları yükleniyor ve profiller doğrulanıyor..."):
+            valid = self.load_and_validate(timer)
+        if not valid:
+            self.console.print("[bold red]❌ Program durduruluyor: Geçerli profil bulunamadı[/bold red]")
+            return
         
         # GUI'yi başlat
         self.console.print("[bold green]✅ GUI başlatılıyor...[/bold green]")
-        self.start_gui()
+        with timer.phase('gui'):
+            self.start_gui()
+        timer.report()
         
         # Ana döngü
         try:
@@ -1429,99 +5093,875 @@ class BetterKickTool:
             pass
         finally:
             self.cleanup()
+    
+    def run_daemon(self, timer=None):
+        """Arayüzsüz servis döngüsü"""
+        timer = timer or StartupTimer()
+        logger.info("BetterKick Tool daemon modunda başlatılıyor")
+        
+        if not self.load_and_validate(timer):
+            logger.error("Program durduruluyor: Geçerli profil bulunamadı")
+            return
+        timer.report()
+        
+        try:
+            while self.running:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.cleanup()
 
 # Flask API sunucusu
-app = Flask(__name__)
-manager = BetterKickTool()
-
-@app.route('/status', methods=['GET'])
-def get_status():
-    return jsonify(manager.get_status())
-
-@app.route('/links', methods=['GET'])
-def get_links():
-    return jsonify(manager.get_all_links())
-
-@app.route('/start', methods=['POST'])
-def start_link():
-    data = request.json
-    link_id_or_url = data.get('link')
-    profile_id = data.get('profile_id')
-    all_profiles = data.get('all_profiles', False)
-    if not link_id_or_url:
-        return jsonify({"success": False, "message": "Link belirtilmedi"})
-    return jsonify(manager.start_link(link_id_or_url, profile_id, all_profiles))
-
-@app.route('/stop', methods=['POST'])
-def stop_link():
-    data = request.json
-    link_id_or_url = data.get('link')
-    profile_id = data.get('profile_id')
-    if link_id_or_url:
-        return jsonify(manager.stop_link(link_id_or_url, profile_id))
-    else:
-        return jsonify(manager.stop_all())
-
-@app.route('/links', methods=['POST'])
-def add_link():
-    data = request.json
-    url = data.get('url')
-    name = data.get('name')
-    if not url:
-        return jsonify({"success": False, "message": "URL belirtilmedi"})
-    return jsonify(manager.add_link(url, name))
-
-@app.route('/links', methods=['DELETE'])
-def remove_link():
-    data = request.json
-    link_id_or_url = data.get('link')
-    if not link_id_or_url:
-        return jsonify({"success": False, "message": "Link belirtilmedi"})
-    return jsonify(manager.remove_link(link_id_or_url))
-
-@app.route('/interval', methods=['PUT'])
-def set_interval():
-    data = request.json
-    minutes = data.get('minutes')
-    if not minutes:
-        return jsonify({"success": False, "message": "Dakika belirtilmedi"})
-    return jsonify(manager.set_check_interval(minutes))
-
-@app.route('/restart', methods=['POST'])
-def restart_all():
-    return jsonify(manager.restart_all())
-
-@app.route('/reposition', methods=['POST'])
-def reposition_windows():
-    return jsonify(manager.reposition_windows())
-
-@app.route('/profiles', methods=['GET'])
-def get_profiles():
-    return jsonify(manager.get_profiles())
-
-@app.route('/logs', methods=['GET'])
-def get_logs():
-    lines = request.args.get('lines', 10, type=int)
-    return jsonify(manager.get_logs(lines))
-
-@app.route('/open', methods=['POST'])
-def open_link():
-    data = request.json
-    link_id_or_url = data.get('link')
-    profile_id = data.get('profile_id')
-    if not link_id_or_url:
-        return jsonify({"success": False, "message": "Link belirtilmedi"})
-    if profile_id is None:
-        return jsonify({"success": False, "message": "Profil ID belirtilmedi"})
-    return jsonify(manager.start_link(link_id_or_url, profile_id))
-
-def start_api_server():
-    app.run(host='127.0.0.1', port=5000, debug=False)
+def create_app(manager):
+    """Verilen manager için Flask uygulamasını oluştur"""
+    from flask import Flask, request, jsonify
+    
+    app = Flask(__name__)
+    
+    # Her API isteği kendi izinin kök span'i olur
+    @app.before_request
+    def begin_request_span():
+        manager.tracer.begin(f"{request.method} {request.path}")
+    
+    @app.teardown_request
+    def end_request_span(error=None):
+        manager.tracer.end(error)
+    
+    profile_lock = threading.Lock()
+    
+    @app.route('/debug/profile', methods=['POST'])
+    def profile():
+        seconds = request.args.get('seconds', 5, type=float)
+        hz = request.args.get('hz', 100, type=int)
+        if not 0 < seconds <= manager.config.get('profile_max_seconds', 60) or not 1 <= hz <= 1000:
+            return jsonify({"success": False, "message": "Geçersiz süre veya örnekleme hızı"}), 400
+        if not profile_lock.acquire(blocking=False):
+            return jsonify({"success": False, "message": "Başka bir profil oturumu sürüyor"}), 409
+        try:
+            logger.info(f"Profil örnekleme başladı: {seconds}s, {hz}Hz")
+            collapsed = sample_stacks(seconds, hz)
+        finally:
+            profile_lock.release()
+        return collapsed, 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    
+    idempotency = IdempotencyCache(ttl=manager.config.get('idempotency_ttl', 600),
+                                   wait_timeout=manager.config.get('idempotency_wait', 2))
+    
+    def admitted(func, *args):
+        """Tarayıcı başlatan işlemi başlatma zamanlayıcısından geçirerek çalıştır
+        
+        Idempotency-Key başlığı varsa aynı anahtarlı tekrar istekler ilk isteğin yanıtını alır.
+        """
+        key = request.headers.get('Idempotency-Key')
+        if key:
+            fingerprint = (request.method, request.path, request.get_data())
+            state, cached = idempotency.begin(key, fingerprint)
+            if state == 'conflict':
+                return jsonify({"success": False, "message": "Idempotency-Key farklı bir istek için kullanılmış"}), 422
+            if state == 'in_progress':
+                # Aynı anahtarlı ilk istek hala sürüyor; istemci aynı anahtarla yeniden denemeli
+                retry_after = manager.config.get('idempotency_retry_after', 5)
+                return (jsonify({"success": False, "message": "Aynı Idempotency-Key ile istek hala sürüyor",
+                                 "retry_after": retry_after}), 409, {'Retry-After': str(retry_after)})
+            if state == 'replay':
+                body, status = cached
+                return jsonify(body), status, {'Idempotent-Replayed': 'true'}
+        
+        body, status, headers = None, 500, {}
+        try:
+            with manager.launch_scheduler.slot():
+                body, status = func(*args), 200
+        except AdmissionRejected as e:
+            body, status = {"success": False, "message": str(e), "retry_after": e.retry_after}, 429
+            headers = {'Retry-After': str(e.retry_after)}
+        finally:
+            if key:
+                idempotency.finish(key, body, status)
+        return jsonify(body), status, headers
+    
+    @app.route('/debug/trace', methods=['GET'])
+    def get_trace():
+        limit = request.args.get('limit', None, type=int)
+        return jsonify(manager.tracer.export_chrome(limit))
+    
+    def list_query():
+        """Liste uç noktalarının filtre, sayfalama ve alan seçimi parametreleri"""
+        return {
+            'status': request.args.get('status'),
+            'profile_id': request.args.get('profile'),
+            'name': request.args.get('name'),
+            'cursor': request.args.get('cursor'),
+            'limit': request.args.get('limit'),
+            'fields': request.args.get('fields'),
+        }
+    
+    @app.route('/status', methods=['GET'])
+    def get_status():
+        return jsonify(manager.get_status(**list_query()))
 
-if __name__ == "__main__":
-    # API sunucusunu ayrı bir thread'de başlat
-    api_thread = threading.Thread(target=start_api_server, daemon=True)
-    api_thread.start()
+    @app.route('/links', methods=['GET'])
+    def get_links():
+        return jsonify(manager.get_all_links(**list_query()))
+
+    @app.route('/start', methods=['POST'])
+    def start_link():
+        data = request.json
+        link_id_or_url = data.get('link')
+        profile_id = data.get('profile_id')
+        all_profiles = data.get('all_profiles', False)
+        if not link_id_or_url:
+            return jsonify({"success": False, "message": "Link belirtilmedi"})
+        return admitted(manager.start_link, link_id_or_url, profile_id, all_profiles)
+
+    @app.route('/stop', methods=['POST'])
+    def stop_link():
+        data = request.json
+        link_id_or_url = data.get('link')
+        profile_id = data.get('profile_id')
+        if link_id_or_url:
+            return jsonify(manager.stop_link(link_id_or_url, profile_id))
+        else:
+            return jsonify(manager.stop_all())
+
+    @app.route('/sessions/<session_id>/history', methods=['GET'])
+    def session_history(session_id):
+        return jsonify(manager.get_session_history(
+            session_id,
+            request.args.get('resolution', 'minute'),
+            request.args.get('since'),
+            request.args.get('limit')
+        ))
+
+    @app.route('/links', methods=['POST'])
+    def add_link():
+        data = request.json
+        url = data.get('url')
+        name = data.get('name')
+        if not url:
+            return jsonify({"success": False, "message": "URL belirtilmedi"})
+        return jsonify(manager.add_link(url, name))
+
+    @app.route('/links', methods=['DELETE'])
+    def remove_link():
+        data = request.json
+        link_id_or_url = data.get('link')
+        if not link_id_or_url:
+            return jsonify({"success": False, "message": "Link belirtilmedi"})
+        return jsonify(manager.remove_link(link_id_or_url))
+
+    @app.route('/interval', methods=['PUT'])
+    def set_interval():
+        data = request.json
+        minutes = data.get('minutes')
+        if not minutes:
+            return jsonify({"success": False, "message": "Dakika belirtilmedi"})
+        return jsonify(manager.set_check_interval(minutes))
+
+    @app.route('/restart', methods=['POST'])
+    def restart_all():
+        return admitted(manager.restart_all)
+
+    @app.route('/reposition', methods=['POST'])
+    def reposition_windows():
+        return jsonify(manager.reposition_windows())
+
+    @app.route('/profiles', methods=['GET'])
+    def get_profiles():
+        return jsonify(manager.get_profiles())
+
+    @app.route('/profiles/catalog', methods=['GET'])
+    def get_profile_catalog():
+        return jsonify(manager.get_profile_catalog())
+
+    @app.route('/logs', methods=['GET'])
+    def get_logs():
+        lines = request.args.get('lines', 10, type=int)
+        return jsonify(manager.get_logs(lines))
+
+    @app.route('/open', methods=['POST'])
+    def open_link():
+        data = request.json
+        link_id_or_url = data.get('link')
+        profile_id = data.get('profile_id')
+        if not link_id_or_url:
+            return jsonify({"success": False, "message": "Link belirtilmedi"})
+        if profile_id is None:
+            return jsonify({"success": False, "message": "Profil ID belirtilmedi"})
+        return admitted(manager.start_link, link_id_or_url, profile_id)
+    
+    return app
+
+class _TrackedBody:
+    """WSGI yanıt gövdesi; sunucu yanıtı yazıp close() çağırınca isteği bitmiş sayar"""
+    def __init__(self, body, done):
+        self.body = body
+        self.done = done
+    
+    def __iter__(self):
+        return iter(self.body)
+    
+    def close(self):
+        try:
+            close = getattr(self.body, 'close', None)
+            if close:
+                close()
+        finally:
+            done, self.done = self.done, None
+            if done:
+                done()
+
+class ApiServer:
+    """Flask uygulamasını çok iş parçacıklı bir WSGI sunucusunda çalıştırır
+    
+    cheroot kuruluysa (isteğe bağlı bağımlılık, keep-alive destekler) onu, değilse
+    werkzeug sunucusunu sabit boyutlu bir işçi havuzu, bağlantı sınırı ve
+    başlık/istek zaman aşımlarıyla kullanır. cheroot'un ayrı bir başlık zaman aşımı
+    yoktur: soket zaman aşımı her okuma/yazma için boşta kalma sınırıdır ve
+    header_timeout'a ayarlanır (yavaş gönderilen başlıklar, gövdeler ve boşta kalan
+    keep-alive bağlantıları kesilir); request_timeout sadece werkzeug'da uygulanır. stop() yeni isteklere 503 döndürür, süren
+    isteklerin yanıtları yazılana kadar en fazla drain_timeout saniye bekler ve
+    ardından sunucuyu kapatır.
+    """
+    def __init__(self, app, host='127.0.0.1', port=5000, backend='auto', workers=16, max_connections=64,
+                 request_timeout=30, header_timeout=10, drain_timeout=15):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.backend = backend
+        self.workers = workers
+        self.max_connections = max_connections
+        self.request_timeout = request_timeout
+        self.header_timeout = header_timeout
+        self.drain_timeout = drain_timeout
+        self.server = None
+        self.server_backend = None
+        self.thread = None
+        self.cond = threading.Condition()
+        self.active = 0        # Yanıtı henüz yazılmamış istekler
+        self.draining = False
+        self.stats_counter = Counter()
+    
+    def __call__(self, environ, start_response):
+        """Süren istekleri sayan ve kapanırken yeni istekleri reddeden WSGI katmanı"""
+        with self.cond:
+            draining = self.draining
+            if not draining:
+                self.active += 1
+        if draining:
+            self.stats_counter['rejected_draining'] += 1
+            start_response('503 Service Unavailable', [
+                ('Content-Type', 'application/json'), ('Retry-After', '5'), ('Connection', 'close')
+            ])
+            return [json.dumps({"success": False, "message": "API sunucusu kapanıyor"}).encode('utf-8')]
+        self.stats_counter['requests'] += 1
+        try:
+            body = self.app(environ, start_response)
+        except BaseException:
+            self.request_done()
+            raise
+        return _TrackedBody(body, self.request_done)
+    
+    def request_done(self):
+        with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
+    
+    @staticmethod
+    def cheroot():
+        try:
+            from cheroot import wsgi
+            return wsgi
+        except ImportError:
+            return None
+    
+    def start(self):
+        """Sunucuyu bağla ve ayrı thread'de çalıştır; bağlanamazsa False döndür"""
+        wsgi = self.cheroot() if self.backend in ('auto', 'cheroot') else None
+        if self.backend == 'cheroot' and wsgi is None:
+            logger.warning("cheroot kurulu değil, werkzeug sunucusu kullanılıyor")
+        try:
+            if wsgi is not None:
+                self.server = self.make_cheroot_server(wsgi)
+                self.server.prepare()
+                self.port = self.server.bind_addr[1]
+                self.server_backend = 'cheroot'
+                serve = self.server.serve
+            else:
+                self.server = self.make_werkzeug_server()
+                self.port = self.server.server_address[1]
+                self.server_backend = 'werkzeug'
+                serve = self.server.serve_forever
+        except (Exception, SystemExit) as e:
+            # werkzeug port kullanımdaysa sys.exit çağırır
+            logger.error(f"API sunucusu başlatılamadı ({self.host}:{self.port}): {str(e)}")
+            self.server = None
+            return False
+        
+        self.thread = threading.Thread(target=serve, name="api_server", daemon=True)
+        self.thread.start()
+        logger.info(f"API sunucusu başlatıldı: http://{self.host}:{self.port} "
+                    f"({self.server_backend}, {self.workers} işçi, en fazla {self.max_connections} bağlantı)")
+        return True
+    
+    def make_cheroot_server(self, wsgi):
+        server = wsgi.Server(
+            (self.host, self.port), self,
+            numthreads=self.workers,
+            max=self.workers,
+            request_queue_size=self.max_connections,
+            # Soket başına okuma/yazma boşta kalma sınırı: başlıklar bu sürede gelmeli
+            timeout=self.header_timeout,
+            shutdown_timeout=self.drain_timeout,
+            accepted_queue_size=self.max_connections
+        )
+        # Boşta bekleyen keep-alive bağlantıları işçi tutmaz, sayıları sınırlanır
+        server.keep_alive_conn_limit = self.max_connections
+        return server
+    
+    def make_werkzeug_server(self):
+        """Sabit işçi havuzlu, bağlantı sınırlı werkzeug sunucusu"""
+        from concurrent.futures import ThreadPoolExecutor
+        from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+        api = self
+        
+        class Handler(WSGIRequestHandler):
+            # werkzeug her yanıttan sonra bağlantıyı kapatır (keep-alive yok)
+            protocol_version = 'HTTP/1.1'
+            
+            def handle_one_request(self):
+                # İstek satırı ve başlıklar header_timeout içinde gelmeli
+                self.connection.settimeout(api.header_timeout)
+                super().handle_one_request()
+            
+            def parse_request(self):
+                ok = super().parse_request()
+                # Başlıklar okundu, gövde ve yanıt için istek zaman aşımı geçerli
+                self.connection.settimeout(api.request_timeout)
+                return ok
+        
+        class PooledServer(BaseWSGIServer):
+            multithread = True
+            
+            def __init__(self):
+                self.pool = ThreadPoolExecutor(max_workers=api.workers, thread_name_prefix="api_worker")
+                self.slots = threading.BoundedSemaphore(api.max_connections)
+                super().__init__(api.host, api.port, api, handler=Handler)
+            
+            def process_request(self, request, client_address):
+                # Bağlantı sınırı aşıldıysa işçi beklemeden 503 ile kapat
+                if not self.slots.acquire(blocking=False):
+                    api.stats_counter['rejected_connections'] += 1
+                    try:
+                        request.sendall(b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 1\r\n"
+                                        b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+                    except OSError:
+                        pass
+                    self.shutdown_request(request)
+                    return
+                self.pool.submit(self.process_request_worker, request, client_address)
+            
+            def process_request_worker(self, request, client_address):
+                try:
+                    self.finish_request(request, client_address)
+                except Exception:
+                    self.handle_error(request, client_address)
+                finally:
+                    self.shutdown_request(request)
+                    self.slots.release()
+            
+            def server_close(self):
+                super().server_close()
+                self.pool.shutdown(wait=False)
+        
+        return PooledServer()
+    
+    def stop(self):
+        """Yeni istekleri reddet, süren isteklerin bitmesini bekle ve sunucuyu kapat"""
+        with self.cond:
+            if self.server is None or self.draining:
+                return
+            self.draining = True
+            deadline = time.monotonic() + self.drain_timeout
+            while self.active > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+            unfinished = self.active
+        if unfinished:
+            logger.warning(f"API sunucusu kapatılırken {unfinished} istek tamamlanmadı")
+        try:
+            if self.server_backend == 'cheroot':
+                self.server.stop()
+            else:
+                # serve_forever döngüsünü durdur, ardından dinleme soketini ve işçi havuzunu kapat
+                self.server.shutdown()
+                self.server.server_close()
+        except Exception as e:
+            logger.error(f"API sunucusu kapatılırken hata: {str(e)}")
+        if self.thread:
+            self.thread.join(self.drain_timeout)
+        logger.info("API sunucusu kapatıldı")
+    
+    def stats(self):
+        with self.cond:
+            active = self.active
+        return {
+            'backend': self.server_backend,
+            'workers': self.workers,
+            'max_connections': self.max_connections,
+            'active_requests': active,
+            'draining': self.draining,
+            'requests': self.stats_counter['requests'],
+            'rejected_connections': self.stats_counter['rejected_connections'],
+            'rejected_draining': self.stats_counter['rejected_draining']
+        }
+
+def start_api_server(app, config=None):
+    """API'yi yapılandırmadaki (api_server) ayarlarla başlat"""
+    config = config or {}
+    server = ApiServer(
+        app,
+        host=config.get('host', '127.0.0.1'),
+        port=config.get('port', 5000),
+        backend=config.get('backend', 'auto'),
+        workers=config.get('workers', 16),
+        max_connections=config.get('max_connections', 64),
+        request_timeout=config.get('request_timeout', 30),
+        header_timeout=config.get('header_timeout', 10),
+        drain_timeout=config.get('drain_timeout', 15)
+    )
+    server.start()
+    return server
+
+def _parse_counts(value):
+    """'1,10,100' biçimindeki sayı listesini ayrıştır"""
+    return [int(v) for v in value.split(',') if v.strip()]
+
+def _parse_latencies(value):
+    """'launch=0.05,get=0.02' biçimindeki gecikmeleri ayrıştır"""
+    latencies = {}
+    for item in value.split(','):
+        if '=' in item:
+            name, seconds = item.split('=', 1)
+            latencies[name.strip()] = float(seconds)
+    return latencies
+
+def _prepare_bench_workdir(workdir, link_count, profile_count):
+    """Benchmark için geçici data dizini ve sahte profiller oluştur"""
+    os.makedirs(os.path.join(workdir, 'data'))
+    profiles = []
+    for p in range(profile_count):
+        path = os.path.join(workdir, 'User Data', f'Profile {p}')
+        os.makedirs(path)
+        with open(os.path.join(path, 'Preferences'), 'w', encoding='utf-8') as f:
+            f.write('{}')
+        profiles.append({'name': f'Bench {p}', 'path': path})
+    os.makedirs(os.path.join(workdir, 'User Data'), exist_ok=True)
+    local_state = {'profile': {'info_cache': {f'Profile {p}': {'name': f'Bench {p}'} for p in range(profile_count)}}}
+    with open(os.path.join(workdir, 'User Data', 'Local State'), 'w', encoding='utf-8') as f:
+        json.dump(local_state, f)
+    links = [{'name': f'Bench Link {i + 1}', 'url': f'https://example.com/stream/{i + 1}'} for i in range(link_count)]
+    with open(os.path.join(workdir, 'data', 'profiles.json'), 'w', encoding='utf-8') as f:
+        json.dump({'profiles': profiles}, f)
+    with open(os.path.join(workdir, 'data', 'links.json'), 'w', encoding='utf-8') as f:
+        json.dump({'links': links}, f)
+
+def _bench_case(link_count, profile_count, session_count, latencies, settle_delay, trace_allocations,
+                browser_mode='window'):
+    """Tek bir (link, profil, oturum) kombinasyonunda manager işlemlerini ölç"""
+    import tempfile
+    import tracemalloc
+    
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='betterkick_bench_') as workdir:
+        _prepare_bench_workdir(workdir, link_count, profile_count)
+        os.chdir(workdir)
+        manager = None
+        try:
+            factory = FakeDriverFactory(latencies=latencies, seed=0)
+            manager = BetterKickTool(headless=True, driver_factory=factory)
+            manager.window_settle_delay = settle_delay
+            manager.browser_mode = browser_mode
+            manager.load_profiles()
+            manager.load_links()
+            
+            pairs = [(str(l + 1), str(p)) for l in range(link_count) for p in range(profile_count)][:session_count]
+            
+            def measure(operation, calls, func):
+                before = factory.snapshot()
+                blocks_before = sys.getallocatedblocks()
+                if trace_allocations:
+                    tracemalloc.start()
+                started = time.perf_counter()
+                func()
+                wall = time.perf_counter() - started
+                entry = {
+                    'operation': operation,
+                    'links': link_count,
+                    'profiles': profile_count,
+                    'sessions': len(pairs),
+                    'calls': calls,
+                }
+                if trace_allocations:
+                    current, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    entry['alloc_bytes'] = current
+                    entry['alloc_peak_bytes'] = peak
+                    entry['alloc_blocks'] = sys.getallocatedblocks() - blocks_before
+                else:
+                    entry['wall_s'] = round(wall, 6)
+                    entry['per_call_ms'] = round(wall * 1000 / max(calls, 1), 3)
+                    entry['webdriver_calls'] = dict(factory.snapshot() - before)
+                results.append(entry)
+            
+            measure('start_link', len(pairs), lambda: [manager.start_link(l, p) for l, p in pairs])
+            measure('check_link_status', 1, manager.check_link_status)
+            measure('reposition_windows', 1, manager.reposition_windows)
+            measure('restart_all', 1, manager.restart_all)
+            measure('stop_link', len(pairs), lambda: [manager.stop_link(l, p) for l, p in pairs])
+        finally:
+            if manager:
+                manager.cleanup()
+            os.chdir(cwd)
+    return results
+
+def run_benchmarks(args):
+    """Sahte driver ile manager'ın sıcak yollarını ölç ve sonuçları JSON olarak yaz"""
+    import platform
+    
+    logging.basicConfig(level=logging.WARNING)
+    latencies = _parse_latencies(args.bench_latency)
+    
+    results = []
+    for link_count in _parse_counts(args.bench_links):
+        for profile_count in _parse_counts(args.bench_profiles):
+            for session_count in _parse_counts(args.bench_sessions):
+                if session_count > link_count * profile_count:
+                    continue
+                # Süre ölçümü ve bellek ölçümü ayrı turlarda (tracemalloc süreyi şişirir)
+                timing = _bench_case(link_count, profile_count, session_count, latencies,
+                                     args.bench_settle_delay, False, args.bench_browser_mode)
+                allocs = _bench_case(link_count, profile_count, session_count, latencies,
+                                     args.bench_settle_delay, True, args.bench_browser_mode)
+                for timed, traced in zip(timing, allocs):
+                    timed.update({k: v for k, v in traced.items() if k.startswith('alloc_')})
+                    results.append(timed)
+                    print(f"{timed['operation']:<20} links={link_count:<5} profiles={profile_count:<3} "
+                          f"sessions={timed['sessions']:<5} {timed['per_call_ms']:>10.3f} ms/çağrı  "
+                          f"webdriver={sum(timed['webdriver_calls'].values()):<6} "
+                          f"alloc={timed['alloc_bytes']}B/{timed['alloc_blocks']} blok")
+    
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'latencies': latencies,
+            'settle_delay': args.bench_settle_delay,
+            'browser_mode': args.bench_browser_mode,
+        },
+        'results': results,
+    }
+    with open(args.bench_output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Sonuçlar yazıldı: {args.bench_output}")
+    
+    # Önceki çalıştırmayla karşılaştır
+    if args.bench_baseline:
+        with open(args.bench_baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        key = lambda e: (e['operation'], e['links'], e['profiles'], e['sessions'])
+        previous = {key(e): e for e in baseline.get('results', [])}
+        for entry in results:
+            old = previous.get(key(entry))
+            if not old or not old.get('per_call_ms'):
+                continue
+            change = (entry['per_call_ms'] - old['per_call_ms']) / old['per_call_ms'] * 100
+            calls_change = sum(entry['webdriver_calls'].values()) - sum(old['webdriver_calls'].values())
+            print(f"{entry['operation']:<20} {key(entry)[1:]}  süre {change:+.1f}%  webdriver çağrısı {calls_change:+d}")
+    return report
+
+# bot.js komutlarının yaklaşık trafik karışımı: (ağırlık, metod, yol, gövde üretici)
+LOADTEST_MIX = [
+    (30, 'GET', '/status', None),
+    (20, 'GET', '/links', None),
+    (5, 'GET', '/profiles', None),
+    (5, 'GET', '/logs?lines=10', None),
+    (10, 'POST', '/start', lambda rng, links, profiles: {'link': rng.choice(links), 'profile_id': None, 'all_profiles': True}),
+    (10, 'POST', '/open', lambda rng, links, profiles: {'link': rng.choice(links), 'profile_id': rng.choice(profiles)}),
+    (10, 'POST', '/stop', lambda rng, links, profiles: {'link': rng.choice(links), 'profile_id': rng.choice(profiles)}),
+    (1, 'POST', '/stop', lambda rng, links, profiles: {'link': None, 'profile_id': None}),
+    (2, 'POST', '/restart', None),
+    (3, 'POST', '/reposition', None),
+    (2, 'POST', '/links', lambda rng, links, profiles: {'url': f'https://example.com/new/{rng.randint(1, 10**6)}', 'name': None}),
+    (1, 'DELETE', '/links', lambda rng, links, profiles: {'link': rng.choice(links)}),
+    (1, 'PUT', '/interval', lambda rng, links, profiles: {'minutes': rng.randint(1, 10)}),
+]
+
+def _synthetic_requests(rng, count, link_ids, profile_ids):
+    """Ağırlıklı karışımdan sentetik istekler üret"""
+    weights = [entry[0] for entry in LOADTEST_MIX]
+    for _ in range(count):
+        _, method, path, body = rng.choices(LOADTEST_MIX, weights=weights)[0]
+        yield method, path, body(rng, link_ids, profile_ids) if body else None
+
+def _recorded_requests(path, count):
+    """JSONL kayıt dosyasındaki istekleri (method, path, body) döngüsel olarak tekrar oynat"""
+    with open(path, 'r', encoding='utf-8') as f:
+        recorded = [json.loads(line) for line in f if line.strip()]
+    for i in range(count):
+        entry = recorded[i % len(recorded)]
+        yield entry['method'], entry['path'], entry.get('body')
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def _check_invariants(manager, factory):
+    """Yük bittikten sonra manager state'inin tutarlılığını kontrol et"""
+    problems = []
+    sessions = Counter(manager.active_links)
+    for pair, count in sessions.items():
+        if count > 1:
+            problems.append(f"Yinelenen oturum {pair}: {count} kez")
+    
+    tracked = Counter((d['link_id'], d['profile_id']) for d in manager.drivers)
+    if tracked != sessions:
+        problems.append(f"drivers/active_links uyuşmuyor: drivers={sum(tracked.values())}, active_links={sum(sessions.values())}")
+    
+    for link_id, profile_id in sessions:
+        if link_id not in manager.links:
+            problems.append(f"Oturum silinmiş linke ait: {link_id} (profil {profile_id})")
+    
+    active_link_ids = {link_id for link_id, _ in sessions}
+    for link_id, link_data in manager.links.items():
+        if link_data['status'] == 'active' and link_id not in active_link_ids:
+            problems.append(f"Link aktif görünüyor ama oturumu yok: {link_id}")
+        elif link_data['status'] != 'active' and link_id in active_link_ids:
+            problems.append(f"Linkin oturumu var ama durumu {link_data['status']}: {link_id}")
+    
+    urls = Counter(link_data['url'] for link_data in manager.links.values())
+    for url, count in urls.items():
+        if count > 1:
+            problems.append(f"Aynı URL {count} kez kayıtlı: {url}")
+    
+    tracked_drivers = {id(d['driver']) for d in manager.drivers}
+    leaked = [d for d in factory.drivers if d.alive and id(d) not in tracked_drivers]
+    if leaked:
+        problems.append(f"Takip edilmeyen açık tarayıcı: {len(leaked)}")
+    return problems
+
+def run_loadtest(args):
+    """Sahte driver arkasındaki API'ye eşzamanlı bot trafiği gönder ve raporla"""
+    import http.client
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.CRITICAL)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    
+    rng = random.Random(args.loadtest_seed)
+    link_ids = [str(i + 1) for i in range(args.loadtest_links)]
+    profile_ids = [str(p) for p in range(args.loadtest_profiles)]
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='betterkick_loadtest_') as workdir:
+        _prepare_bench_workdir(workdir, args.loadtest_links, args.loadtest_profiles)
+        os.chdir(workdir)
+        manager = None
+        try:
+            factory = FakeDriverFactory(latencies=_parse_latencies(args.loadtest_latency), seed=args.loadtest_seed)
+            manager = BetterKickTool(headless=True, driver_factory=factory)
+            manager.window_settle_delay = 0
+            manager.load_profiles()
+            manager.load_links()
+            
+            # Üretimdeki sunucu ve varsayılan işçi/bağlantı sınırları
+            server = ApiServer(create_app(manager), port=0)
+            if not server.start():
+                raise RuntimeError("Yük testi API sunucusu başlatılamadı")
+            manager.api_server = server
+            port = server.port
+            
+            if args.loadtest_replay:
+                requests_to_send = list(_recorded_requests(args.loadtest_replay, args.loadtest_requests))
+            else:
+                requests_to_send = list(_synthetic_requests(rng, args.loadtest_requests, link_ids, profile_ids))
+            
+            local = threading.local()
+            latencies = {}
+            failures = Counter()
+            rejections = Counter()  # 429: giriş kontrolünün beklenen geri basıncı, hata sayılmaz
+            response_problems = []
+            stats_lock = threading.Lock()
+            
+            def send(item):
+                method, path, body = item
+                conn = getattr(local, 'conn', None)
+                if conn is None:
+                    conn = local.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+                payload = json.dumps(body) if body is not None else None
+                headers = {'Content-Type': 'application/json'} if payload is not None else {}
+                route = f"{method} {path.split('?')[0]}"
+                started = time.perf_counter()
+                try:
+                    conn.request(method, path, body=payload, headers=headers)
+                    response = conn.getresponse()
+                    raw = response.read()
+                    status = response.status
+                except Exception as e:
+                    conn.close()
+                    local.conn = None
+                    status, raw = None, str(e).encode()
+                elapsed = time.perf_counter() - started
+                
+                problem = None
+                if status == 429:
+                    with stats_lock:
+                        rejections[route] += 1
+                elif status != 200:
+                    problem = f"{route}: HTTP {status} {raw[:120]!r}"
+                elif route == 'GET /status':
+                    data = json.loads(raw)
+                    if data['active_count'] != len(data['active_links']):
+                        problem = f"{route}: active_count={data['active_count']} ama {len(data['active_links'])} oturum listelendi"
+                with stats_lock:
+                    latencies.setdefault(route, []).append(elapsed)
+                    if problem:
+                        failures[route] += 1
+                        response_problems.append(problem)
+            
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.loadtest_concurrency) as pool:
+                list(pool.map(send, requests_to_send))
+            duration = time.perf_counter() - started
+            
+            invariant_problems = _check_invariants(manager, factory)
+            admission = manager.launch_scheduler.stats()
+        finally:
+            # cleanup API sunucusunu da boşaltıp kapatır
+            if manager:
+                manager.cleanup()
+            os.chdir(cwd)
+    
+    routes = {}
+    for route, values in sorted(latencies.items()):
+        values.sort()
+        routes[route] = {
+            'count': len(values),
+            'errors': failures[route],
+            'rejected': rejections[route],
+            'p50_ms': round(_percentile(values, 50) * 1000, 2),
+            'p99_ms': round(_percentile(values, 99) * 1000, 2),
+            'max_ms': round(values[-1] * 1000, 2),
+        }
+    total = sum(len(v) for v in latencies.values())
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'requests': total,
+            'concurrency': args.loadtest_concurrency,
+            'links': args.loadtest_links,
+            'profiles': args.loadtest_profiles,
+            'latency': args.loadtest_latency,
+            'replay': args.loadtest_replay,
+        },
+        'duration_s': round(duration, 3),
+        'throughput_rps': round(total / duration, 2) if duration else 0,
+        'routes': routes,
+        'launch_admission': admission,
+        'response_errors': response_problems[:100],
+        'inconsistencies': invariant_problems,
+    }
+    
+    print(f"{total} istek, {duration:.2f}s, {report['throughput_rps']} istek/s (eşzamanlılık {args.loadtest_concurrency})")
+    for route, stats in routes.items():
+        print(f"  {route:<16} n={stats['count']:<6} hata={stats['errors']:<4} 429={stats['rejected']:<4} "
+              f"p50={stats['p50_ms']:>8.2f}ms p99={stats['p99_ms']:>8.2f}ms max={stats['max_ms']:>8.2f}ms")
+    print(f"Giriş kontrolü: {admission['admitted']} kabul, {admission['rejected']} reddedildi, "
+          f"{admission['timed_out']} zaman aşımı, en fazla {admission['max_queued']} bekleyen, "
+          f"bekleme p95={admission['wait_ms']['p95']}ms")
+    if response_problems:
+        print(f"Yanıt hataları: {len(response_problems)}")
+        for problem in response_problems[:10]:
+            print(f"  - {problem}")
+    if invariant_problems:
+        print(f"Tutarsız state: {len(invariant_problems)}")
+        for problem in invariant_problems[:20]:
+            print(f"  - {problem}")
+    
+    with open(args.loadtest_output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Rapor yazıldı: {args.loadtest_output}")
+    return report
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="BetterKick Tool")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Rich arayüzü ve klavye kısayolları olmadan arka plan servisi olarak çalış")
+    parser.add_argument('--resume', action='store_true',
+                        help="Önceki çalıştırmadan (çökme/yeniden başlatma) kalan oturumları geri yükle")
+    
+    bench = parser.add_argument_group("benchmark")
+    bench.add_argument('--bench', action='store_true', help="Sahte driver ile benchmark çalıştır ve çık")
+    bench.add_argument('--bench-links', default='10,100', help="Link sayıları (virgülle ayrılmış)")
+    bench.add_argument('--bench-profiles', default='1,4', help="Profil sayıları (virgülle ayrılmış)")
+    bench.add_argument('--bench-sessions', default='4,12', help="Aktif oturum sayıları (virgülle ayrılmış)")
+    bench.add_argument('--bench-latency', default='', help="Sahte driver gecikmeleri, örn. launch=0.05,get=0.02")
+    bench.add_argument('--bench-settle-delay', type=float, default=0.0,
+                       help="Pencere konumlandırma sonrası bekleme (saniye)")
+    bench.add_argument('--bench-browser-mode', choices=('window', 'tab'), default='window',
+                       help="Pencere modu (oturum başına tarayıcı) veya sekme modu (profil başına tarayıcı)")
+    bench.add_argument('--bench-output', default='bench_results.json', help="JSON sonuç dosyası")
+    bench.add_argument('--bench-baseline', help="Karşılaştırılacak önceki sonuç dosyası")
+    
+    loadtest = parser.add_argument_group("yük testi")
+    loadtest.add_argument('--loadtest', action='store_true', help="Sahte driver ile API yük testi çalıştır ve çık")
+    loadtest.add_argument('--loadtest-requests', type=int, default=2000, help="Toplam istek sayısı")
+    loadtest.add_argument('--loadtest-concurrency', type=int, default=16, help="Eşzamanlı istemci sayısı")
+    loadtest.add_argument('--loadtest-links', type=int, default=20, help="Link sayısı")
+    loadtest.add_argument('--loadtest-profiles', type=int, default=4, help="Profil sayısı")
+    loadtest.add_argument('--loadtest-latency', default='launch=0.05,get=0.02',
+                          help="Sahte driver gecikmeleri, örn. launch=0.05,get=0.02")
+    loadtest.add_argument('--loadtest-replay', help="Tekrar oynatılacak JSONL istek kaydı (method, path, body)")
+    loadtest.add_argument('--loadtest-seed', type=int, default=0, help="Sentetik karışım için rastgele tohum")
+    loadtest.add_argument('--loadtest-output', default='loadtest_results.json', help="JSON rapor dosyası")
+    args = parser.parse_args(argv)
+    
+    if args.bench:
+        run_benchmarks(args)
+        return
+    if args.loadtest:
+        run_loadtest(args)
+        return
+    
+    timer = StartupTimer()
+    setup_logging()
+    
+    with timer.phase('manager'):
+        manager = BetterKickTool(headless=args.daemon)
+    manager.resume_on_start = args.resume
+    manager.install_signal_handlers()
+    
+    with timer.phase('api'):
+        app = create_app(manager)
+        # API sunucusu kendi thread'inde çalışır; cleanup kapanışta önce onu boşaltır
+        manager.api_server = start_api_server(app, manager.config.get('api_server', {}))
     
     # BetterKick Tool'u başlat
-    manager.run()
+    if args.daemon:
+        manager.run_daemon(timer)
+    else:
+        manager.run(timer)
+
+if __name__ == "__main__":
+    main()